@@ -0,0 +1,132 @@
+"""Timing and memory comparisons between DynamicArray and the built-in list.
+
+Run from the repository root, with an optional element count (defaults to
+10 million):
+
+    python -m pythondsa.benchmarks.bench_arrays 10000000
+"""
+import sys
+from random import Random
+from pythondsa.src.arrays import DynamicArray, GapBuffer, TieredVector
+from pythondsa.benchmarks.harness import peaked, timed, traced
+
+
+def append_n(seq, n):
+    """Append n integers to the end of seq."""
+    for i in range(n):
+        seq.append(i)
+    return seq
+
+
+def append_floats(seq, n):
+    """Append n distinct floats to the end of seq."""
+    for i in range(n):
+        seq.append(i + 0.5)
+    return seq
+
+
+def insert_middle(seq, m):
+    """Insert m integers at the middle of seq."""
+    for i in range(m):
+        seq.insert(len(seq) // 2, i)
+
+
+def insert_random(seq, m):
+    """Insert m integers at uniformly random positions of seq."""
+    rng = Random(1)
+    for i in range(m):
+        seq.insert(rng.randint(0, len(seq)), i)
+
+
+def insert_clustered(seq, m, burst=1000):
+    """Insert m integers in bursts typed at a cursor that jumps between bursts."""
+    rng = Random(1)
+    for i in range(m):
+        if i % burst == 0:
+            cursor = rng.randint(0, len(seq))
+        seq.insert(cursor, i)
+        cursor += 1
+
+
+def reorder_random(seq, m):
+    """Move m random entries of seq to other random positions."""
+    rng = Random(1)
+    for i in range(m):
+        k = rng.randrange(len(seq))
+        value = seq[k]
+        del seq[k]
+        seq.insert(rng.randint(0, len(seq)), value)
+
+
+def filled(factory, n):
+    """Return a new sequence built by factory holding n integers."""
+    seq = factory()
+    append_n(seq, n)
+    return seq
+
+
+def random_values(n, floating, seed=1):
+    """Return n random floats, or 63-bit integers, in a list."""
+    rng = Random(seed)
+    if floating:
+        return [rng.uniform(-1e9, 1e9) for _ in range(n)]
+    return [rng.getrandbits(63) - (1 << 62) for _ in range(n)]
+
+
+def sort_cases(values, typecode):
+    """Return (label, sort function) pairs, each over a fresh copy of values."""
+    boxed = DynamicArray()
+    boxed.extend(values)
+    radix = DynamicArray(typecode)
+    radix.extend(values)
+    keyed = DynamicArray(typecode)
+    keyed.extend(values)
+    return [('  list', list(values).sort),
+            ('  DynamicArray', boxed.sort),
+            ("  DynamicArray('{}') radix".format(typecode), radix.sort),
+            ("  DynamicArray('{}') boxed by key".format(typecode),
+             lambda: keyed.sort(key=lambda x: x))]
+
+
+def main(n):
+    inserts = 1000
+    print('append-heavy: {} appends'.format(n))
+    timed('  list', append_n, list(), n)
+    timed('  DynamicArray', append_n, DynamicArray(), n)
+
+    print('insert-heavy: {} middle inserts into {} elements'.format(inserts, n))
+    timed('  list', insert_middle, filled(list, n), inserts)
+    timed('  DynamicArray', insert_middle, filled(DynamicArray, n), inserts)
+
+    edits = 10000
+    size = n // 10
+    for label, workload in [('random', insert_random), ('clustered', insert_clustered)]:
+        print('{} inserts: {} into {} elements'.format(label, edits, size))
+        timed('  DynamicArray', workload, filled(DynamicArray, size), edits)
+        timed('  GapBuffer', workload, filled(GapBuffer, size), edits)
+
+    moves = 1000
+    print('reorder: {} random delete + insert pairs in {} elements'.format(moves, n))
+    timed('  list', reorder_random, filled(list, n), moves)
+    timed('  DynamicArray', reorder_random, filled(DynamicArray, n), moves)
+    timed('  TieredVector', reorder_random, filled(TieredVector, n), moves)
+
+    for typecode in 'dq':
+        kind = 'floats' if typecode == 'd' else 'integers'
+        values = random_values(n, typecode == 'd')
+        print('sort: {} random {}'.format(n, kind))
+        for label, sort in sort_cases(values, typecode):
+            timed(label, sort)
+        print('sort peak memory: {} random {}'.format(n, kind))
+        for label, sort in sort_cases(values, typecode):
+            peaked(label, sort)
+        del values
+
+    print('memory: {} floats'.format(n))
+    traced('  list', append_floats, list(), n)
+    traced('  DynamicArray', append_floats, DynamicArray(), n)
+    traced("  DynamicArray(typecode='d')", append_floats, DynamicArray('d'), n)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7)
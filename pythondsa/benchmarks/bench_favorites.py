@@ -0,0 +1,58 @@
+"""Average search depth of the FavoritesList policies under Zipf access.
+
+Run from the repository root, with an optional access count (defaults to
+100 thousand):
+
+    python -m pythondsa.benchmarks.bench_favorites 100000
+"""
+import sys
+from random import Random
+from time import perf_counter
+from pythondsa.src.favorites import FavoritesList
+
+
+def zipf_accesses(n, keys, s=1.0, seed=1):
+    """Return n keys drawn from range(keys) with Zipf(s) probabilities."""
+    weights = [1 / (rank + 1) ** s for rank in range(keys)]
+    rng = Random(seed)
+    order = list(range(keys))
+    rng.shuffle(order)  # the popular keys are not the first ones seen
+    return rng.choices(order, weights, k=n)
+
+
+def insertion_order_depth(accesses):
+    """Return the average depth of a scan over keys kept in first-seen order."""
+    index = {}
+    depth = 0
+    for key in accesses:
+        if key not in index:
+            index[key] = len(index)
+            depth += len(index) - 1  # a miss scans every earlier key
+        else:
+            depth += index[key] + 1
+    return depth / len(accesses)
+
+
+def run(label, policy, accesses):
+    """Replay accesses under policy and print its average search depth."""
+    fl = FavoritesList(policy)
+    start = perf_counter()
+    for key in accesses:
+        fl.access(key)
+    elapsed = perf_counter() - start
+    print('{:<24}{:>12.1f}{:>12.3f}s'.format(label, fl.stats()['average_depth'],
+                                            elapsed))
+
+
+def main(n, keys=1000):
+    accesses = zipf_accesses(n, keys)
+    print('{} Zipf accesses over {} keys'.format(n, keys))
+    print('{:<24}{:>12}{:>13}'.format('', 'avg depth', 'time'))
+    print('{:<24}{:>12.1f}'.format('  insertion order', insertion_order_depth(accesses)))
+    run('  count', 'count', accesses)
+    run('  move-to-front', 'mtf', accesses)
+    run('  transpose', 'transpose', accesses)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 5)
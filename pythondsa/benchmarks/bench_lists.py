@@ -0,0 +1,97 @@
+"""Timing and memory comparisons between the positional list implementations.
+
+Run from the repository root, with an optional element count (defaults to
+10 million):
+
+    python -m pythondsa.benchmarks.bench_lists 10000000
+"""
+import sys
+from random import Random
+from pythondsa.src.lists import ArrayPositionalList, IndexedPositionalList, PositionalList
+from pythondsa.benchmarks.harness import timed, traced
+
+
+def filled(n, factory=PositionalList):
+    """Return a new positional list built by factory holding n integers."""
+    pl = factory()
+    for i in range(n):
+        pl.add_last(i)
+    return pl
+
+
+def fill_shared(factory, n):
+    """Return a positional list from factory holding n references to None."""
+    pl = factory()
+    for i in range(n):
+        pl.add_last(None)
+    return pl
+
+
+def walk_positions(pl):
+    """Visit every element through first() and after(), one Position each."""
+    cursor = pl.first()
+    while cursor is not None:
+        cursor.element()
+        cursor = pl.after(cursor)
+
+
+def walk_iter(pl):
+    """Visit every element with the list's own iterator."""
+    for e in pl:
+        pass
+
+
+def walk_reversed(pl):
+    """Visit every element back to front."""
+    for e in reversed(pl):
+        pass
+
+
+def walk_chunks(pl, size=1024):
+    """Visit every element in chunks of the given size."""
+    for chunk in pl.iter_chunks(size):
+        for e in chunk:
+            pass
+
+
+def select_by_walking(pl, queries):
+    """Find the element at each of the given indices by walking from first()."""
+    for k in queries:
+        cursor = pl.first()
+        for _ in range(k):
+            cursor = pl.after(cursor)
+
+
+def select_by_index(pl, queries):
+    """Find the element at each of the given indices with at(k)."""
+    for k in queries:
+        pl.at(k)
+
+
+def main(n):
+    pl = filled(n)
+    print('iterate: {} elements'.format(n))
+    timed('  first/after positions', walk_positions, pl)
+    timed('  iter', walk_iter, pl)
+    timed('  reversed', walk_reversed, pl)
+    timed('  iter_chunks(1024)', walk_chunks, pl)
+    apl = filled(n, ArrayPositionalList)
+    timed('  ArrayPositionalList first/after', walk_positions, apl)
+    timed('  ArrayPositionalList iter', walk_iter, apl)
+    del pl, apl
+
+    size = n // 10
+    rng = Random(1)
+    queries = [rng.randrange(size) for _ in range(100)]
+    print('select: {} random indices in {} elements'.format(len(queries), size))
+    timed('  PositionalList walk', select_by_walking, filled(size), queries)
+    timed('  IndexedPositionalList at', select_by_index,
+          filled(size, IndexedPositionalList), queries)
+
+    print('memory: {} elements (a single shared object)'.format(n))
+    traced('  PositionalList', fill_shared, PositionalList, n)
+    traced('  ArrayPositionalList', fill_shared, ArrayPositionalList, n)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7)
@@ -0,0 +1,52 @@
+"""Timing comparisons between per-element and batch ArrayQueue operations.
+
+Run from the repository root, with an optional element count (defaults to
+10 million):
+
+    python -m pythondsa.benchmarks.bench_queues 10000000
+"""
+import sys
+from pythondsa.src.queues import ArrayQueue, MaskedArrayQueue
+from pythondsa.benchmarks.harness import timed
+
+
+def stream_each(queue, n, batch):
+    """Pass n integers through queue one at a time, batch in flight at once."""
+    for start in range(0, n, batch):
+        for i in range(start, min(start + batch, n)):
+            queue.enqueue(i)
+        for i in range(start, min(start + batch, n)):
+            queue.dequeue()
+
+
+def stream_batches(queue, n, batch):
+    """Pass n integers through queue with enqueue_many and dequeue_many."""
+    for start in range(0, n, batch):
+        values = range(start, min(start + batch, n))
+        queue.enqueue_many(values)
+        queue.dequeue_many(len(values))
+
+
+def fill_and_drain(queue, n):
+    """Enqueue n integers one at a time, then dequeue them all."""
+    for i in range(n):
+        queue.enqueue(i)
+    for i in range(n):
+        queue.dequeue()
+
+
+def main(n):
+    batch = 10000
+    print('stream: {} elements in batches of {}'.format(n, batch))
+    timed('  ArrayQueue per element', stream_each, ArrayQueue(), n, batch)
+    timed('  MaskedArrayQueue per element', stream_each, MaskedArrayQueue(), n, batch)
+    timed('  ArrayQueue batched', stream_batches, ArrayQueue(), n, batch)
+    timed('  MaskedArrayQueue batched', stream_batches, MaskedArrayQueue(), n, batch)
+
+    print('fill and drain: {} elements'.format(n))
+    timed('  ArrayQueue', fill_and_drain, ArrayQueue(), n)
+    timed('  MaskedArrayQueue', fill_and_drain, MaskedArrayQueue(), n)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7)
@@ -0,0 +1,75 @@
+"""Timing and memory comparisons between the stack implementations.
+
+Run from the repository root, with an optional element count (defaults to
+10 million):
+
+    python -m pythondsa.benchmarks.bench_stacks 10000000
+"""
+import sys
+from pythondsa.src.stacks import ArrayStack, BoundedArrayStack, LinkedStack
+from pythondsa.src.stacks import UnrolledLinkedStack
+from pythondsa.benchmarks.harness import timed, traced
+
+
+def push_n(stack, n):
+    """Push n integers onto stack and return it."""
+    for i in range(n):
+        stack.push(i)
+    return stack
+
+
+def push_pop_each(stack, n):
+    """Push n integers one at a time, then pop them one at a time."""
+    for i in range(n):
+        stack.push(i)
+    for i in range(n):
+        stack.pop()
+
+
+def push_pop_batches(stack, n, batch=64):
+    """Push and pop n integers in batches of the given size."""
+    for i in range(0, n, batch):
+        stack.push_many(range(i, min(i + batch, n)))
+    for i in range(0, n, batch):
+        stack.pop_many(min(batch, n - i))
+
+
+def dfs_frontier(stack, n, fanout=4):
+    """Simulate a DFS frontier: pop one node, push its fanout children."""
+    stack.push(0)
+    visited = 0
+    while not stack.is_empty() and visited < n:
+        stack.pop()
+        visited += 1
+        if len(stack) + fanout <= n:
+            stack.push_many(range(visited, visited + fanout))
+
+
+def main(n):
+    print('push then pop: {} elements one at a time'.format(n))
+    timed('  ArrayStack', push_pop_each, ArrayStack(), n)
+    timed('  ArrayStack(maxlen)', push_pop_each, ArrayStack(n), n)
+    timed('  BoundedArrayStack', push_pop_each, BoundedArrayStack(n), n)
+
+    print('push then pop: {} elements in batches of 64'.format(n))
+    timed('  ArrayStack', push_pop_batches, ArrayStack(), n)
+    timed('  ArrayStack(maxlen)', push_pop_batches, ArrayStack(n), n)
+    timed('  BoundedArrayStack', push_pop_batches, BoundedArrayStack(n), n)
+
+    print('linked push then pop: {} elements one at a time'.format(n))
+    timed('  ArrayStack', push_pop_each, ArrayStack(), n)
+    timed('  LinkedStack', push_pop_each, LinkedStack(), n)
+    timed('  UnrolledLinkedStack', push_pop_each, UnrolledLinkedStack(), n)
+
+    print('memory: {} small integers pushed'.format(n))
+    traced('  ArrayStack', push_n, ArrayStack(), n)
+    traced('  LinkedStack', push_n, LinkedStack(), n)
+    traced('  UnrolledLinkedStack', push_n, UnrolledLinkedStack(), n)
+
+    print('dfs frontier: {} visits with fanout 4'.format(n))
+    timed('  ArrayStack', dfs_frontier, ArrayStack(), n)
+    timed('  BoundedArrayStack', dfs_frontier, BoundedArrayStack(n), n)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7)
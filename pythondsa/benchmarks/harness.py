@@ -0,0 +1,33 @@
+"""Timing and memory helpers shared by the benchmark scripts."""
+import tracemalloc
+from time import perf_counter
+
+
+def timed(label, func, *args):
+    """Run func(*args), print the elapsed time under label and return it."""
+    start = perf_counter()
+    func(*args)
+    elapsed = perf_counter() - start
+    print('{:<40}{:>10.3f}s'.format(label, elapsed))
+    return elapsed
+
+
+def traced(label, func, *args):
+    """Run func(*args), print the memory it keeps allocated under label."""
+    tracemalloc.start()
+    result = func(*args)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print('{:<40}{:>10.1f}MB'.format(label, retained / 2 ** 20))
+    del result
+    return retained
+
+
+def peaked(label, func, *args):
+    """Run func(*args), print the peak memory it allocated under label."""
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print('{:<40}{:>10.1f}MB'.format(label, peak / 2 ** 20))
+    return peak
@@ -1,22 +1,73 @@
-import ctypes
+import bisect
+import mmap
+import os
+import struct
+import sys
+from array import array
 from pythondsa.src.exceptions import Empty
 
 
+def overallocate(capacity, minimum):
+    """Growth policy over-allocating by about 1/8, as CPython's list does."""
+    return (minimum + (minimum >> 3) + 6) & ~3
+
+
+def _kind(typecode):
+    """Return the NumPy kind character ('i', 'u' or 'f') of an array typecode."""
+    if typecode in 'fd':
+        return 'f'
+    return 'u' if typecode.isupper() else 'i'
+
+
 class DynamicArray:
     """A dynamic array class akin to a simplified Python list."""
 
-    def __init__(self):
-        """Create an empty array."""
+    TYPECODES = frozenset('bBhHiIlLqQfd')  # numeric codes of the array module
+
+    def __init__(self, typecode=None, growth=2, shrink_threshold=4):
+        """Create an empty array.
+
+        If a typecode is given (one of TYPECODES), elements are stored unboxed
+        in a compact buffer of that C type instead of as object references.
+
+        growth is the factor (greater than 1) by which a full array grows, or
+        a callable growth(capacity, minimum) returning the new capacity, such
+        as overallocate. The capacity is halved once fewer than
+        1/shrink_threshold of it is in use; None never shrinks the array.
+        """
+        if typecode is not None and typecode not in DynamicArray.TYPECODES:
+            raise ValueError('Unsupported typecode: ' + repr(typecode))
+        if not callable(growth) and not growth > 1:
+            raise ValueError('growth must be a factor greater than 1 or a callable')
+        if shrink_threshold is not None and not shrink_threshold >= 2:
+            raise ValueError('shrink_threshold must be at least 2 or None')
+        self._typecode = typecode
+        self._blank = None if typecode is None else 0  # filler of vacant slots
+        if typecode is None:
+            self._itemsize = struct.calcsize('P')  # size of an object reference
+        else:
+            self._itemsize = array(typecode).itemsize
+        self._growth = growth
+        self._shrink_threshold = shrink_threshold
         self._n = 0                                 # count actual elements
         self._capacity = 1                          # default array capacity
         self._A = self._make_array(self._capacity)  # low-level array
+        self._resizes = 0                           # telemetry counters
+        self._bytes_copied = 0
+        self._peak_capacity = self._capacity
+        self._prefix = None                         # optional FenwickTree
+        self._prefix_stale = False                  # rebuild before next use
 
     def __len__(self):
         """Return number of elements stored in the array."""
         return self._n
 
     def __getitem__(self, k):
-        """Return element at index k."""
+        """Return element at index k, or a new array for a slice k."""
+        if isinstance(k, slice):
+            result = DynamicArray(self._typecode, self._growth, self._shrink_threshold)
+            result.extend(self._A[self._live_slice(k)])
+            return result
         if not self._n * -1 <= k < self._n:
             raise IndexError('Invalid index')
         if k >= 0:
@@ -25,36 +76,90 @@ class DynamicArray:
             negative_index = self._n - self._capacity + k
             return self._A[negative_index]
 
+    def __setitem__(self, k, value):
+        """Replace element at index k, or the elements of slice k, with value.
+
+        Assigning to a slice with step 1 may change the length of the array,
+        shifting the tail once; an extended slice requires a value of the
+        same length, as with lists.
+        """
+        if not isinstance(k, slice):
+            j = self._validate(k)
+            old = self._A[j]
+            self._A[j] = value
+            if self._prefix is not None and not self._prefix_stale:
+                self._prefix.add(j, self._A[j] - old)
+            return
+        values = value if hasattr(value, '__len__') else list(value)
+        block = self._block(values)  # reject mistyped values before moving anything
+        self._prefix_stale = True
+        start, stop, step = k.indices(self._n)
+        if step != 1:
+            indices = range(start, stop, step)
+            if len(block) != len(indices):
+                raise ValueError('attempt to assign sequence of size {} to extended '
+                                 'slice of size {}'.format(len(block), len(indices)))
+            for j, v in zip(indices, block):
+                self._A[j] = v
+            return
+        stop = max(start, stop)
+        d = len(block) - (stop - start)  # change in length
+        if self._n + d > self._capacity:
+            self._resize(self._grown_capacity(self._n + d))
+        self._move_tail(stop, d)
+        self._A[start:start + len(block)] = block
+        self._n += d
+        self._shrink()
+
+    def __delitem__(self, k):
+        """Remove element at index k, or the elements of slice k."""
+        self._prefix_stale = True
+        if not isinstance(k, slice):
+            self._shift_left(self._validate(k))
+            self._n -= 1
+        else:
+            start, stop, step = k.indices(self._n)
+            doomed = range(start, stop, step)
+            if step < 0:
+                doomed = doomed[::-1]
+            if len(doomed) == 0:
+                return
+            if doomed.step == 1:
+                self._move_tail(doomed.stop, -len(doomed))
+                self._n -= len(doomed)
+            else:
+                self._keep_where(lambda j, e: j not in doomed, doomed.start)
+        self._shrink()
+
     def append(self, obj):
         """Add object to the end of the array."""
         if self._n == self._capacity:
-            self._resize(2 * self._capacity)
+            self._resize(self._grown_capacity(self._n + 1))
         self._A[self._n] = obj
         self._n += 1
+        if self._prefix is not None and not self._prefix_stale:
+            self._prefix.append(self._A[self._n - 1])
 
     def insert(self, k, value):
         """Insert value at index k, shifting subsequent values rightward."""
         #  (for simplicity, we assume 0 <= k <= n in this version)
+        if self._typecode is not None:  # reject a mistyped value before moving anything
+            value = array(self._typecode, [value])[0]
         if self._n == self._capacity:  # array needs to be resized
-            self._resize_with_shift(2 * self._capacity, k)
+            self._resize_with_shift(self._grown_capacity(self._n + 1), k)
         else:  # no need to resize array
-            for j in range(self._n, k, -1):
-                self._A[j] = self._A[j - 1]
+            self._shift_right(k)
         self._A[k] = value
         self._n += 1
+        self._prefix_stale = True
 
     def remove(self, value):
         """Remove first occurrence of value (or raise ValueError)."""
-        for k in range(self._n):
-            if self._A[k] == value:
-                for j in range(k, self._n - 1):
-                    self._A[j] = self._A[j + 1]
-                self._A[self._n - 1] = None        # help garbage collection
-                self._n -= 1
-                if self._capacity // 4 > self._n:   # shrink capacity if needed
-                    self._resize(self._capacity // 2)
-                return
-        raise ValueError('value not found')    # only reached if no match
+        k = self._find(value)
+        self._shift_left(k)
+        self._n -= 1
+        self._prefix_stale = True
+        self._shrink()
 
     def pop(self):
         """Remove and return the last element in the array.
@@ -63,31 +168,816 @@ class DynamicArray:
         if self._n == 0:
             raise Empty('The array is empty')
         answer = self._A[self._n - 1]
-        self._A[self._n - 1] = None  # help garbage collection
+        self._A[self._n - 1] = self._blank  # help garbage collection
         self._n -= 1
-        if self._capacity // 4 > self._n:  # shrink capacity if needed
-            self._resize(self._capacity // 2)
+        if self._prefix is not None and not self._prefix_stale:
+            self._prefix.pop()
+        self._shrink()
         return answer
 
+    def extend(self, iterable):
+        """Append all elements of iterable, resizing at most once."""
+        values = iterable if hasattr(iterable, '__len__') else list(iterable)
+        m = len(values)
+        if self._n + m > self._capacity:
+            self._resize(self._grown_capacity(self._n + m))
+        self._A[self._n:self._n + m] = self._block(values)
+        self._n += m
+        self._prefix_stale = True
+
+    def remove_all(self, pred):
+        """Remove every element e for which pred(e) is true, in one pass.
+
+        Return the number of elements removed.
+        """
+        return self._keep_where(lambda j, e: not pred(e))
+
+    def compact(self):
+        """Remove every None element, in one pass, and return their number.
+
+        This clears placeholders left behind by marking entries as deleted.
+        """
+        return self.remove_all(lambda e: e is None)
+
+    def sort(self, key=None, reverse=False):
+        """Sort the elements in place, in ascending order unless reverse is true.
+
+        Typed arrays without a key are sorted by an LSD radix sort over their
+        raw bits, using one scratch buffer of the same C type. Object arrays
+        are sorted by list.sort on the low-level array itself.
+
+        The pure-Python radix sort is slower than list.sort, but needs only
+        n * itemsize bytes of scratch space and never boxes the elements.
+        """
+        self._prefix_stale = True
+        if self._typecode is not None and key is None:
+            self._radix_sort(reverse)
+        elif self._typecode is None:
+            del self._A[self._n:]  # detach the vacant slots while sorting
+            try:
+                self._A.sort(key=key, reverse=reverse)
+            finally:
+                self._A.extend([None] * (self._capacity - self._n))
+        else:  # a key on typed data needs the boxed values
+            self._A[:self._n] = self._block(sorted(self._A[:self._n], key=key,
+                                                   reverse=reverse))
+
+    def bisect_left(self, value, lo=0, hi=None):
+        """Return the leftmost insertion index for value in the sorted array."""
+        return bisect.bisect_left(self._A, value, lo, self._n if hi is None else hi)
+
+    def bisect_right(self, value, lo=0, hi=None):
+        """Return the rightmost insertion index for value in the sorted array."""
+        return bisect.bisect_right(self._A, value, lo, self._n if hi is None else hi)
+
+    def build_prefix_index(self):
+        """Attach a Fenwick tree of prefix sums to the numeric elements.
+
+        The index follows append, pop and item assignment in O(log n); any
+        other change is absorbed by an O(n) rebuild at the next range_sum.
+        """
+        self._prefix = FenwickTree(self._A[:self._n])
+        self._prefix_stale = False
+
+    def drop_prefix_index(self):
+        """Detach the prefix-sum index, if any."""
+        self._prefix = None
+        self._prefix_stale = False
+
+    def range_sum(self, i, j):
+        """Return the sum of the elements at indices i through j - 1.
+
+        This takes O(log n) with a prefix-sum index, or O(j - i) without.
+        """
+        if not 0 <= i <= j <= self._n:
+            raise IndexError('Invalid range')
+        if self._prefix is None:
+            return sum(self._A[i:j])
+        if self._prefix_stale:
+            self.build_prefix_index()
+        return self._prefix.range_sum(i, j)
+
+    def reserve(self, n):
+        """Make sure the array can hold n elements without resizing."""
+        if n > self._capacity:
+            self._resize(n)
+
+    def shrink_to_fit(self):
+        """Reduce the capacity to the number of elements (but at least 1)."""
+        if self._capacity > max(1, self._n):
+            self._resize(max(1, self._n))
+
+    def stats(self):
+        """Return a dict of resize telemetry for tuning the growth policy."""
+        return {
+            'length': self._n,
+            'capacity': self._capacity,
+            'peak_capacity': self._peak_capacity,
+            'resizes': self._resizes,
+            'bytes_copied': self._bytes_copied,
+        }
+
+    def view(self):
+        """Return a memoryview of the live elements, sharing the array's memory.
+
+        Only typed arrays can be viewed. The view keeps referring to the
+        current low-level array, so it goes stale once the array is resized.
+        """
+        if self._typecode is None:
+            raise TypeError('Only typed arrays expose a buffer')
+        return memoryview(self._A)[:self._n]
+
+    def __buffer__(self, flags):
+        """Expose the live elements through the buffer protocol."""
+        return self.view()
+
+    @property
+    def __array_interface__(self):
+        """Describe the live elements for zero-copy use by NumPy."""
+        if self._typecode is None:  # lets NumPy fall back to the sequence protocol
+            raise AttributeError('Only typed arrays expose an array interface')
+        data = self.view()
+        if data.itemsize == 1:
+            order = '|'  # byte order is not relevant
+        else:
+            order = '<' if sys.byteorder == 'little' else '>'
+        return {
+            'version': 3,
+            'shape': (self._n,),
+            'typestr': order + _kind(self._typecode) + str(data.itemsize),
+            'data': data,  # a buffer object, so the memory is kept alive
+        }
+
+    def extend_from_buffer(self, buffer):
+        """Append all elements of a C-contiguous buffer with a single copy.
+
+        The buffer must hold elements of the same kind and size as the array,
+        or raw bytes whose length is a multiple of the element size.
+        """
+        if self._typecode is None:
+            raise TypeError('Only typed arrays can be extended from a buffer')
+        source = memoryview(buffer)
+        itemsize = self._A.itemsize
+        fmt = source.format.lstrip('@=<>!')
+        if fmt in ('B', 'c'):  # raw bytes; 'b' holds signed int8 elements
+            if source.nbytes % itemsize:
+                raise ValueError('Buffer size is not a multiple of element size')
+        else:
+            if (fmt not in DynamicArray.TYPECODES or source.itemsize != itemsize
+                    or _kind(fmt) != _kind(self._typecode)):
+                raise TypeError('Buffer format {!r} does not match typecode {!r}'
+                                .format(source.format, self._typecode))
+            little = source.format[0] == '<'
+            if source.format[0] in '<>!' and little != (sys.byteorder == 'little'):
+                raise ValueError('Buffer byte order is not native')
+        m = source.nbytes // itemsize
+        if self._n + m > self._capacity:
+            self._resize(self._grown_capacity(self._n + m))
+        with memoryview(self._A) as target, target.cast('B') as octets:
+            octets[self._n * itemsize:(self._n + m) * itemsize] = source.cast('B')
+        self._n += m
+        self._prefix_stale = True
+
+    @classmethod
+    def from_buffer(cls, buffer, typecode=None):
+        """Return a new typed array holding the elements of buffer.
+
+        The typecode defaults to the buffer's own element format.
+        """
+        if typecode is None:
+            typecode = memoryview(buffer).format.lstrip('@=<>!')
+        result = cls(typecode)
+        result.extend_from_buffer(buffer)
+        return result
+
+    def _validate(self, k):
+        """Return nonnegative index for k, or raise IndexError if invalid."""
+        if not self._n * -1 <= k < self._n:
+            raise IndexError('Invalid index')
+        return k + self._n if k < 0 else k
+
+    def _live_slice(self, k):
+        """Return slice k resolved against the live elements of the array."""
+        start, stop, step = k.indices(self._n)
+        if not range(start, stop, step):
+            return slice(0, 0)
+        if step < 0 and stop < 0:  # runs down to index 0 inclusive
+            stop = None
+        return slice(start, stop, step)
+
+    def _block(self, values):
+        """Return values in a form the low-level array accepts for slice assignment."""
+        if self._typecode is None:
+            return values
+        return array(self._typecode, values)
+
+    def _keep_where(self, keep, start=0):
+        """Keep only the elements from start on for which keep(j, e) is true.
+
+        Kept elements are moved leftward in one pass; return the number removed.
+        If keep raises, the elements it has not yet judged are all kept.
+        """
+        A = self._A
+        n = self._n
+        write = read = start
+        try:
+            while read < n:
+                e = A[read]
+                if keep(read, e):
+                    if write != read:
+                        A[write] = e
+                    write += 1
+                read += 1
+        finally:
+            removed = read - write
+            if removed and read < n:  # keep raised: close the gap as one block
+                A[write:n - removed] = A[read:n]
+            A[n - removed:n] = self._block([self._blank] * removed)  # clear vacated
+            self._n = n - removed
+            self._prefix_stale = True
+        self._shrink()
+        return removed
+
+    def _move_tail(self, stop, d):
+        """Move elements from index stop onward d slots (either way) as one block."""
+        if d > 0:
+            self._A[stop + d:self._n + d] = self._A[stop:self._n]
+        elif d < 0:
+            self._A[stop + d:self._n + d] = self._A[stop:self._n]
+            self._A[self._n + d:self._n] = self._block([self._blank] * -d)
+
+    def _radix_sort(self, reverse):
+        """Sort a typed array in place by LSD radix sort on its raw bits.
+
+        Each value is first mapped to an unsigned integer with the same order
+        (flipping the sign bit of integers, and all bits of negative floats),
+        sorted a digit at a time, and mapped back.
+        """
+        n = self._n
+        size = self._itemsize
+        code = next(c for c in 'BHILQ' if array(c).itemsize == size)  # unsigned
+        bits = 8 * size
+        sign = 1 << (bits - 1)
+        full = (1 << bits) - 1
+        floating = _kind(self._typecode) == 'f'
+        signed = _kind(self._typecode) == 'i'
+        flip = full if reverse else 0  # complemented keys sort descending
+        with memoryview(self._A) as raw, raw.cast('B') as octets:
+            with octets.cast(code) as whole, whole[:n] as keys:
+                for j in range(n):  # map to order-preserving unsigned keys
+                    x = keys[j]
+                    if floating:
+                        x = x ^ full if x & sign else x | sign
+                    elif signed:
+                        x ^= sign
+                    keys[j] = x ^ flip
+                digit = 16 if n > 1 << 16 and bits >= 16 else 8
+                mask = (1 << digit) - 1
+                source, target = keys, array(code, [0]) * n
+                for shift in range(0, bits, digit):
+                    counts = [0] * (mask + 1)
+                    for x in source:
+                        counts[(x >> shift) & mask] += 1
+                    if max(counts) == n:  # all share this digit, nothing moves
+                        continue
+                    total = 0
+                    for d, c in enumerate(counts):  # starting index of each digit
+                        counts[d] = total
+                        total += c
+                    for x in source:
+                        d = (x >> shift) & mask
+                        target[counts[d]] = x
+                        counts[d] += 1
+                    source, target = target, source
+                if source is not keys:
+                    keys[:] = source
+                for j in range(n):  # map back to the original bits
+                    x = keys[j] ^ flip
+                    if floating:
+                        x = x ^ sign if x & sign else x ^ full
+                    elif signed:
+                        x ^= sign
+                    keys[j] = x
+
+    def _find(self, value):
+        """Return index of first occurrence of value (or raise ValueError)."""
+        try:
+            return self._A.index(value, 0, self._n)
+        except ValueError:
+            raise ValueError('value not found') from None  # no match
+
+    def _shift_right(self, k):
+        """Shift elements from index k onward one slot rightward, as a block."""
+        if self._typecode is None:
+            del self._A[self._n]              # drop one vacant slot from the end...
+            self._A.insert(k, self._blank)    # ...so the tail moves as one memmove
+        else:  # typed arrays are never resized in place, views may be exported
+            self._A[k + 1:self._n + 1] = self._A[k:self._n]
+
+    def _shift_left(self, k):
+        """Shift elements after index k one slot leftward, overwriting index k."""
+        if self._typecode is None:
+            del self._A[k]                    # the tail moves as one memmove
+            self._A.append(self._blank)       # vacated slot, for garbage collection
+        else:
+            self._A[k:self._n - 1] = self._A[k + 1:self._n]
+            self._A[self._n - 1] = self._blank
+
+    def _grown_capacity(self, minimum):
+        """Return the new capacity, under the growth policy, for minimum elements."""
+        if callable(self._growth):
+            c = self._growth(self._capacity, minimum)
+        else:
+            c = int(self._capacity * self._growth)
+        return max(c, minimum)
+
+    def _shrink(self):
+        """Halve the capacity if too little of it is in use."""
+        threshold = self._shrink_threshold
+        if threshold is not None and self._capacity // threshold > self._n:
+            self._resize(self._capacity // 2)
+
+    def _record_resize(self, c, copied):
+        """Update the telemetry counters for a resize to capacity c."""
+        self._resizes += 1
+        self._bytes_copied += copied * self._itemsize
+        self._peak_capacity = max(self._peak_capacity, c)
+
     def _resize(self, c):
         """Resize internal array to capacity c."""
         B = self._make_array(c)
-        for k in range(self._n):
-            B[k] = self._A[k]
+        B[:self._n] = self._A[:self._n]  # block copy, references stay counted
         self._A = B
         self._capacity = c
+        self._record_resize(c, self._n)
 
     def _resize_with_shift(self, c, k):
         """Resize internal array to capacity c and shift elements after k rightward."""
         B = self._make_array(c)
-        for i in range(k):
-            B[i] = self._A[i]
-        for i in range(k, self._n, 1):
-            B[i + 1] = self._A[i]
+        B[:k] = self._A[:k]
+        B[k + 1:self._n + 1] = self._A[k:self._n]
         self._A = B
         self._capacity = c
+        self._record_resize(c, self._n)
+
+    def _make_array(self, c):
+        """Return new array with capacity c.
+
+        A fixed-length list is used rather than a ctypes.py_object array: it is
+        the same contiguous block of object references, but slicing, insertion
+        and deletion on it are single reference-counted block moves, whereas
+        ctypes keeps a per-slot keep-alive entry and copies element by element.
+        Typed arrays use an array.array of the same capacity, which supports
+        the same block operations on unboxed values.
+        """
+        if self._typecode is None:
+            return [None] * c
+        return array(self._typecode, [0]) * c
+
+
+class MappedDynamicArray(DynamicArray):
+    """A typed dynamic array stored in a growable memory-mapped file.
+
+    The file starts with a small header (magic, typecode and element count),
+    followed by the low-level array. Growing or shrinking the array resizes
+    the file and remaps it rather than copying the elements, and reopening
+    the file recovers the array as it was.
+    """
+
+    _HEADER = struct.Struct('<4sc3xQ')  # magic, typecode, element count
+    _MAGIC = b'PDSA'
+
+    def __init__(self, path, typecode=None):
+        """Open the array stored at path, creating the file if needed.
+
+        A typecode is required to create a new file; for an existing file it
+        defaults to (and must match) the one recorded in its header.
+        """
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._mm = None
+        try:
+            size = os.fstat(self._fd).st_size
+            if size == 0:  # a new file
+                if typecode is None:
+                    raise ValueError('A typecode is required to create a new file')
+                super().__init__(typecode)
+                self._map(1)
+                self._n = 0
+            else:
+                header = os.pread(self._fd, self._HEADER.size, 0)
+                if len(header) < self._HEADER.size:
+                    raise ValueError('Not a mapped array file: ' + repr(path))
+                magic, stored, count = self._HEADER.unpack(header)
+                stored = stored.decode('ascii')
+                if magic != self._MAGIC or stored not in DynamicArray.TYPECODES:
+                    raise ValueError('Not a mapped array file: ' + repr(path))
+                if typecode is not None and typecode != stored:
+                    raise ValueError('File holds typecode ' + repr(stored))
+                super().__init__(stored)
+                itemsize = array(stored).itemsize
+                self._map(max(1, (size - self._HEADER.size) // itemsize))
+                self._count = min(count, self._capacity)
+            self._peak_capacity = self._capacity
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def _n(self):
+        """Number of elements, written through to the file header."""
+        return self._count
+
+    @_n.setter
+    def _n(self, value):
+        self._count = value
+        if self._mm is not None:
+            self._HEADER.pack_into(self._mm, 0, self._MAGIC,
+                                   self._typecode.encode('ascii'), value)
+
+    def flush(self):
+        """Write pending changes of the mapping back to the file."""
+        self._mm.flush()
+
+    def close(self):
+        """Unmap the array and close its file.
+
+        Raise BufferError, leaving the array open, if views are still exported.
+        """
+        if self._mm is not None:
+            self._unmap()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _find(self, value):
+        """Return index of first occurrence of value (or raise ValueError)."""
+        chunk = 1 << 16  # search in bounded slices, never the whole file at once
+        for start in range(0, self._n, chunk):
+            stop = min(start + chunk, self._n)
+            try:
+                return start + self._A[start:stop].tolist().index(value)
+            except ValueError:
+                pass
+        raise ValueError('value not found')
+
+    def _resize(self, c):
+        """Resize the file to capacity c and remap it, without copying."""
+        self._map(c)
+        self._record_resize(c, 0)
+
+    def _resize_with_shift(self, c, k):
+        """Resize the file to capacity c and shift elements after k rightward."""
+        self._map(c)
+        self._record_resize(c, 0)
+        self._shift_right(k)
+
+    def _map(self, c):
+        """Truncate or extend the file to hold capacity c and (re)map it.
+
+        Raise BufferError if views of the current mapping are still exported.
+        """
+        if self._mm is not None:
+            self._unmap()
+        size = self._HEADER.size + c * array(self._typecode).itemsize
+        os.ftruncate(self._fd, size)
+        self._mm = mmap.mmap(self._fd, size)
+        self._A = memoryview(self._mm)[self._HEADER.size:].cast(self._typecode)
+        self._capacity = c
+
+    def _unmap(self):
+        """Release the current mapping.
+
+        Raise BufferError, keeping the mapping usable, if views are exported.
+        """
+        self._A.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            self._A = memoryview(self._mm)[self._HEADER.size:].cast(self._typecode)
+            raise BufferError('Cannot unmap while views are exported') from None
+        self._mm = None
+
+
+class GapBuffer:
+    """A sequence that keeps a movable gap of free slots at its last edit.
+
+    Inserting or deleting at the gap costs O(1); moving the gap costs only the
+    distance it travels, so bursts of edits near one position are amortized
+    O(1) each instead of shifting every later element.
+    """
+
+    def __init__(self):
+        """Create an empty buffer."""
+        self._capacity = 1                          # default array capacity
+        self._A = self._make_array(self._capacity)  # low-level array
+        self._gap_start = 0                         # first slot of the gap
+        self._gap_end = self._capacity              # first slot after the gap
+
+    def __len__(self):
+        """Return number of elements stored in the buffer."""
+        return self._capacity - (self._gap_end - self._gap_start)
+
+    def __getitem__(self, k):
+        """Return element at index k."""
+        return self._A[self._physical(k)]
+
+    def __setitem__(self, k, value):
+        """Replace element at index k with value."""
+        self._A[self._physical(k)] = value
+
+    def __delitem__(self, k):
+        """Remove element at index k, moving the gap there."""
+        n = len(self)
+        if not -n <= k < n:
+            raise IndexError('Invalid index')
+        self._move_gap(k % n)
+        self._A[self._gap_end] = None  # help garbage collection
+        self._gap_end += 1
+        if self._capacity // 4 > len(self):  # shrink capacity if needed
+            self._resize(self._capacity // 2)
+
+    def __iter__(self):
+        """Generate a forward iteration of the elements of the buffer."""
+        yield from self._A[:self._gap_start]
+        yield from self._A[self._gap_end:]
+
+    def append(self, obj):
+        """Add object to the end of the buffer."""
+        self.insert(len(self), obj)
+
+    def insert(self, k, value):
+        """Insert value at index k, moving the gap there."""
+        if not 0 <= k <= len(self):
+            raise IndexError('Invalid index')
+        if self._gap_start == self._gap_end:  # gap is used up
+            self._resize(2 * self._capacity)
+        self._move_gap(k)
+        self._A[self._gap_start] = value
+        self._gap_start += 1
+
+    def remove(self, value):
+        """Remove first occurrence of value (or raise ValueError)."""
+        try:
+            k = self._A.index(value, 0, self._gap_start)
+        except ValueError:
+            try:
+                k = self._A.index(value, self._gap_end) - self._gap_end + self._gap_start
+            except ValueError:
+                raise ValueError('value not found') from None  # no match
+        del self[k]
+
+    def pop(self):
+        """Remove and return the last element in the buffer.
+
+        Raise Empty exception if the buffer is empty."""
+        if len(self) == 0:
+            raise Empty('The buffer is empty')
+        answer = self[-1]
+        del self[-1]
+        return answer
+
+    def _physical(self, k):
+        """Return the slot of the low-level array holding index k."""
+        n = len(self)
+        if not -n <= k < n:
+            raise IndexError('Invalid index')
+        if k < 0:
+            k += n
+        return k if k < self._gap_start else k + self._gap_end - self._gap_start
+
+    def _move_gap(self, k):
+        """Move the gap to start at index k, shifting only the elements passed."""
+        start, end = self._gap_start, self._gap_end
+        gap = end - start
+        if k < start:    # elements k..start-1 move to the end of the gap
+            d = start - k
+            self._A[end - d:end] = self._A[k:start]
+            self._A[k:k + min(d, gap)] = [None] * min(d, gap)
+        elif k > start:  # elements after the gap move to its start
+            d = k - start
+            self._A[start:k] = self._A[end:end + d]
+            self._A[max(end, k):end + d] = [None] * min(d, gap)
+        self._gap_start, self._gap_end = k, k + gap
+
+    def _resize(self, c):
+        """Resize internal array to capacity c, keeping the gap in place."""
+        B = self._make_array(c)
+        tail = self._capacity - self._gap_end  # number of elements after the gap
+        B[:self._gap_start] = self._A[:self._gap_start]
+        B[c - tail:] = self._A[self._gap_end:]
+        self._A = B
+        self._gap_end = c - tail
+        self._capacity = c
+
+    def _make_array(self, c):
+        """Return new array with capacity c."""
+        return [None] * c
+
+
+class TieredVector:
+    """A sequence stored in fixed-size circular blocks.
+
+    Every block but the last is full. An insert or delete shifts elements
+    within one block and then passes one element across each later block by
+    rotating it, so both cost O(b + n/b). The block size b is a power of two
+    kept near sqrt(n), which makes that O(sqrt n).
+    """
+
+    MIN_BLOCK = 16  # smallest block size, must be a power of two
+
+    def __init__(self):
+        """Create an empty vector."""
+        self._n = 0                     # count actual elements
+        self._blocks = []               # low-level arrays of capacity b
+        self._offsets = []              # slot of the first element of each block
+        self._set_block_size(TieredVector.MIN_BLOCK)
+
+    def __len__(self):
+        """Return number of elements stored in the vector."""
+        return self._n
+
+    def __getitem__(self, k):
+        """Return element at index k."""
+        k = self._validate(k)
+        i = k >> self._shift
+        return self._blocks[i][(self._offsets[i] + k) & self._mask]
+
+    def __setitem__(self, k, value):
+        """Replace element at index k with value."""
+        k = self._validate(k)
+        i = k >> self._shift
+        self._blocks[i][(self._offsets[i] + k) & self._mask] = value
+
+    def __delitem__(self, k):
+        """Remove element at index k, shifting subsequent elements leftward."""
+        k = self._validate(k)
+        b, mask = self._b, self._mask
+        blocks, offsets = self._blocks, self._offsets
+        i, j = k >> self._shift, k & mask
+        last = (self._n - 1) >> self._shift
+        count = b if i < last else self._n - i * b  # elements in block i
+        block = self._straighten(i)
+        block[j:count - 1] = block[j + 1:count]
+        block[count - 1] = None  # help garbage collection
+        for t in range(i + 1, last + 1):  # pull the first element of each later block
+            front = offsets[t]
+            blocks[t - 1][(offsets[t - 1] + b - 1) & mask] = blocks[t][front]
+            blocks[t][front] = None
+            offsets[t] = (front + 1) & mask
+        self._n -= 1
+        if self._n == last * b:  # last block is now empty
+            blocks.pop()
+            offsets.pop()
+        if b > TieredVector.MIN_BLOCK and self._n < b * b // 8:
+            self._rebuild(b // 2)
+
+    def __iter__(self):
+        """Generate a forward iteration of the elements, a block at a time."""
+        b = self._b
+        for i, block in enumerate(self._blocks):
+            front = self._offsets[i]
+            count = min(b, self._n - i * b)
+            if front + count <= b:
+                yield from block[front:front + count]
+            else:  # block wraps around
+                yield from block[front:]
+                yield from block[:front + count - b]
+
+    def append(self, obj):
+        """Add object to the end of the vector."""
+        self.insert(self._n, obj)
+
+    def insert(self, k, value):
+        """Insert value at index k, shifting subsequent values rightward."""
+        if not 0 <= k <= self._n:
+            raise IndexError('Invalid index')
+        b, mask = self._b, self._mask
+        blocks, offsets = self._blocks, self._offsets
+        if self._n == len(blocks) * b:  # all blocks are full
+            blocks.append(self._make_array(b))
+            offsets.append(0)
+        i, j = k >> self._shift, k & mask
+        last = self._n >> self._shift  # the only block with a free slot
+        for t in range(last, i, -1):  # push the last element of each earlier block
+            offsets[t] = front = (offsets[t] - 1) & mask
+            blocks[t][front] = blocks[t - 1][(offsets[t - 1] + b - 1) & mask]
+        count = b - 1 if i < last else self._n - i * b  # elements left in block i
+        block = self._straighten(i)
+        block[j + 1:count + 1] = block[j:count]
+        block[j] = value
+        self._n += 1
+        if self._n > 2 * b * b:
+            self._rebuild(2 * b)
+
+    def remove(self, value):
+        """Remove first occurrence of value (or raise ValueError)."""
+        for k, e in enumerate(self):
+            if e == value:
+                del self[k]
+                return
+        raise ValueError('value not found')  # only reached if no match
+
+    def pop(self):
+        """Remove and return the last element in the vector.
+
+        Raise Empty exception if the vector is empty."""
+        if self._n == 0:
+            raise Empty('The vector is empty')
+        answer = self[-1]
+        del self[-1]
+        return answer
+
+    def _validate(self, k):
+        """Return nonnegative index for k, or raise IndexError if invalid."""
+        if not -self._n <= k < self._n:
+            raise IndexError('Invalid index')
+        return k + self._n if k < 0 else k
+
+    def _straighten(self, i):
+        """Rotate block i so that its first element is in slot 0, and return it."""
+        front = self._offsets[i]
+        if front:
+            block = self._blocks[i]
+            block[:] = block[front:] + block[:front]
+            self._offsets[i] = 0
+        return self._blocks[i]
+
+    def _set_block_size(self, b):
+        """Record block size b with its derived shift and mask."""
+        self._b = b
+        self._shift = b.bit_length() - 1
+        self._mask = b - 1
+
+    def _rebuild(self, b):
+        """Redistribute the elements into blocks of size b."""
+        elements = list(self)
+        self._set_block_size(b)
+        self._blocks = []
+        for start in range(0, self._n, b):
+            block = self._make_array(b)
+            chunk = elements[start:start + b]
+            block[:len(chunk)] = chunk
+            self._blocks.append(block)
+        self._offsets = [0] * len(self._blocks)
 
     def _make_array(self, c):
         """Return new array with capacity c."""
-        return (c * ctypes.py_object)()
+        return [None] * c
 
+
+class FenwickTree:
+    """A binary indexed tree of prefix sums over a sequence of numbers.
+
+    Node i (counted from 1) holds the sum of the values at positions
+    i - (i & -i) + 1 through i, so any prefix sum and any point update
+    touch O(log n) nodes.
+    """
+
+    def __init__(self, values=()):
+        """Build the tree over values in O(n)."""
+        self._tree = [0]                # node 0 is unused
+        self._tree.extend(values)
+        n = len(self._tree) - 1
+        for i in range(1, n + 1):      # push each partial sum to its parent
+            parent = i + (i & -i)
+            if parent <= n:
+                self._tree[parent] += self._tree[i]
+
+    def __len__(self):
+        """Return the number of values summarized by the tree."""
+        return len(self._tree) - 1
+
+    def prefix_sum(self, k):
+        """Return the sum of the first k values."""
+        total = 0
+        while k > 0:
+            total += self._tree[k]
+            k -= k & -k
+        return total
+
+    def range_sum(self, i, j):
+        """Return the sum of the values at indices i through j - 1."""
+        return self.prefix_sum(j) - self.prefix_sum(i)
+
+    def add(self, k, delta):
+        """Add delta to the value at index k."""
+        k += 1
+        while k < len(self._tree):
+            self._tree[k] += delta
+            k += k & -k
+
+    def append(self, value):
+        """Add value at the end of the sequence in O(log n)."""
+        m = len(self._tree)               # node of the new value
+        below = m - (m & -m)              # the node covers positions below+1..m
+        self._tree.append(value + self.prefix_sum(m - 1) - self.prefix_sum(below))
+
+    def pop(self):
+        """Remove the last value; no other node covers it."""
+        self._tree.pop()
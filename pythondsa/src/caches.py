@@ -0,0 +1,283 @@
+from time import monotonic
+from pythondsa.src.lists import PositionalList
+from pythondsa.src.maps import ChainHashMap
+
+
+class CacheBase:
+    """Abstract base class for caches bounded by entry count and total weight.
+
+    A hash map finds the entry of a key, and each entry holds the Position of
+    its place in the eviction order kept by the subclass, so lookups, updates
+    and evictions all take O(1) expected time.
+    """
+    _MapType = ChainHashMap  # Map type; can be redefined by subclass
+
+    class _Entry:
+        """Lightweight, nonpublic class for storing a cached item."""
+        __slots__ = ('_key', '_value', '_weight', '_position', '_bucket',
+                     '_expires', '_expiry')
+
+        def __init__(self, key, value, weight):
+            self._key = key
+            self._value = value
+            self._weight = weight
+
+    def __init__(self, maxsize=128, maxweight=None, weigher=None):
+        """Create an empty cache.
+
+        maxsize caps the number of entries and maxweight the sum of their
+        weights, as given by weigher(value) (1 per entry by default); either
+        limit may be None. The least valuable entries are evicted to stay
+        within both.
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be positive')
+        if maxweight is not None and maxweight <= 0:
+            raise ValueError('maxweight must be positive')
+        self._map = self._MapType()  # key -> _Entry
+        self._maxsize = maxsize
+        self._maxweight = maxweight
+        self._weigher = weigher
+        self._weight = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self):
+        """Return the number of entries in the cache."""
+        self._purge()
+        return len(self._map)
+
+    def __contains__(self, key):
+        """Return True if key is cached, without counting a hit or miss."""
+        self._purge()
+        return key in self._map
+
+    def get(self, key, default=None):
+        """Return the value cached for key, or default if there is none."""
+        self._purge()
+        try:
+            entry = self._map[key]
+        except KeyError:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._access(entry)
+        return entry._value
+
+    def put(self, key, value):
+        """Cache value for key, evicting other entries as needed.
+
+        Raise ValueError if value alone weighs more than maxweight.
+        """
+        self._purge()
+        weight = 1 if self._weigher is None else self._weigher(value)
+        if self._maxweight is not None and weight > self._maxweight:
+            raise ValueError('value is heavier than maxweight')
+        try:
+            entry = self._map[key]
+        except KeyError:
+            entry = None
+        if entry is not None:
+            self._weight += weight - entry._weight
+            entry._value = value
+            entry._weight = weight
+            self._update(entry)
+            while self._over(0, 0):
+                self._evict()
+        else:
+            while self._over(1, weight):
+                self._evict()
+            entry = self._Entry(key, value, weight)
+            self._map[key] = entry
+            self._weight += weight
+            self._admit(entry)
+
+    def pop(self, key, *default):
+        """Remove key and return its value, or default if key is not cached.
+
+        Raise KeyError if key is not cached and no default is given.
+        """
+        self._purge()
+        try:
+            entry = self._map[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        self._discard(entry)
+        return entry._value
+
+    def stats(self):
+        """Return a dict of the cache's counters and current size and weight."""
+        return {'hits': self._hits, 'misses': self._misses,
+                'evictions': self._evictions, 'expirations': self._expirations,
+                'size': len(self._map), 'weight': self._weight}
+
+    # ------------- nonpublic behaviours -------------
+    def _over(self, count, weight):
+        """Return True if adding count entries of weight would break a limit."""
+        if not self._map:
+            return False
+        if self._maxsize is not None and len(self._map) + count > self._maxsize:
+            return True
+        return self._maxweight is not None and self._weight + weight > self._maxweight
+
+    def _evict(self):
+        """Discard the entry chosen by the eviction policy."""
+        self._discard(self._victim())
+        self._evictions += 1
+
+    def _discard(self, entry):
+        """Remove entry from the map and from the eviction order."""
+        del self._map[entry._key]
+        self._weight -= entry._weight
+        self._remove(entry)
+
+    def _purge(self):
+        """Drop stale entries before an operation; nothing by default."""
+        pass
+
+    def _update(self, entry):
+        """Record that the value of entry was replaced."""
+        self._access(entry)
+
+    def _admit(self, entry):
+        """Place a new entry in the eviction order."""
+        raise NotImplementedError('must be implemented by subclass')
+
+    def _access(self, entry):
+        """Record a use of entry in the eviction order."""
+        raise NotImplementedError('must be implemented by subclass')
+
+    def _remove(self, entry):
+        """Take entry out of the eviction order."""
+        raise NotImplementedError('must be implemented by subclass')
+
+    def _victim(self):
+        """Return the entry to evict next."""
+        raise NotImplementedError('must be implemented by subclass')
+
+
+class LRUCache(CacheBase):
+    """Cache evicting the least recently used entry first.
+
+    Entries are kept in a PositionalList from least to most recently used; a
+    hit splices the entry's node to the back, so its Position stays valid.
+    """
+
+    def __init__(self, maxsize=128, maxweight=None, weigher=None):
+        """Create an empty cache."""
+        super().__init__(maxsize, maxweight, weigher)
+        self._order = PositionalList()
+
+    def _admit(self, entry):
+        entry._position = self._order.add_last(entry)
+
+    def _access(self, entry):
+        p = entry._position
+        self._order.splice(p, p, self._order)  # move to the back in O(1)
+
+    def _remove(self, entry):
+        self._order.delete(entry._position)
+
+    def _victim(self):
+        return self._order.first().element()
+
+
+class LFUCache(CacheBase):
+    """Cache evicting the least frequently used entry first.
+
+    Entries with the same use count share a bucket, and buckets are kept in a
+    PositionalList in increasing order of count. A hit splices the entry into
+    the neighbouring bucket, so every operation takes O(1) time. Ties are
+    broken by evicting the least recently used entry of the lowest bucket.
+    """
+
+    class _Bucket:
+        """Lightweight, nonpublic class for entries sharing one use count."""
+        __slots__ = '_count', '_entries'
+
+        def __init__(self, count):
+            self._count = count
+            self._entries = PositionalList()
+
+    def __init__(self, maxsize=128, maxweight=None, weigher=None):
+        """Create an empty cache."""
+        super().__init__(maxsize, maxweight, weigher)
+        self._buckets = PositionalList()
+
+    def _admit(self, entry):
+        first = self._buckets.first()
+        if first is None or first.element()._count != 1:
+            first = self._buckets.add_first(self._Bucket(1))
+        entry._bucket = first
+        entry._position = first.element()._entries.add_last(entry)
+
+    def _access(self, entry):
+        here = entry._bucket
+        bucket = here.element()
+        there = self._buckets.after(here)
+        if there is None or there.element()._count != bucket._count + 1:
+            there = self._buckets.add_after(here, self._Bucket(bucket._count + 1))
+        p = entry._position
+        bucket._entries.splice(p, p, there.element()._entries)
+        entry._bucket = there
+        if bucket._entries.is_empty():
+            self._buckets.delete(here)
+
+    def _remove(self, entry):
+        bucket = entry._bucket.element()
+        bucket._entries.delete(entry._position)
+        if bucket._entries.is_empty():
+            self._buckets.delete(entry._bucket)
+
+    def _victim(self):
+        return self._buckets.first().element()._entries.first().element()
+
+
+class TTLCache(LRUCache):
+    """LRU cache whose entries also expire ttl seconds after they are stored.
+
+    A second PositionalList keeps entries in the order they were last stored,
+    which is also the order they expire in, so expired entries are purged
+    from its front in O(1) amortized time per entry.
+    """
+
+    def __init__(self, maxsize=128, ttl=600, maxweight=None, weigher=None,
+                 timer=monotonic):
+        """Create an empty cache; timer returns the current time in seconds."""
+        if ttl <= 0:
+            raise ValueError('ttl must be positive')
+        super().__init__(maxsize, maxweight, weigher)
+        self._ttl = ttl
+        self._timer = timer
+        self._expiry = PositionalList()
+
+    def expire(self):
+        """Remove every entry whose time to live has passed."""
+        now = self._timer()
+        first = self._expiry.first()
+        while first is not None and first.element()._expires <= now:
+            self._discard(first.element())
+            self._expirations += 1
+            first = self._expiry.first()
+
+    def _purge(self):
+        self.expire()
+
+    def _admit(self, entry):
+        super()._admit(entry)
+        entry._expires = self._timer() + self._ttl
+        entry._expiry = self._expiry.add_last(entry)
+
+    def _update(self, entry):
+        super()._update(entry)
+        entry._expires = self._timer() + self._ttl
+        p = entry._expiry
+        self._expiry.splice(p, p, self._expiry)  # now the last to expire
+
+    def _remove(self, entry):
+        super()._remove(entry)
+        self._expiry.delete(entry._expiry)
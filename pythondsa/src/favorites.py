@@ -0,0 +1,114 @@
+from heapq import nlargest
+from pythondsa.src.lists import PositionalList
+
+
+class FavoritesList:
+    """List of elements reordered by access so that favorites are found first.
+
+    The reordering heuristic is chosen by policy:
+    - 'count' keeps elements in nonincreasing order of access count;
+    - 'mtf' moves an accessed element to the front;
+    - 'transpose' swaps an accessed element with its predecessor.
+    The list also records how deep each search had to go.
+    """
+    POLICIES = ('count', 'mtf', 'transpose')
+
+    # ------------------------- nested _Item class -------------------------
+    class _Item:
+        __slots__ = '_value', '_count'  # streamline memory usage
+
+        def __init__(self, e):
+            self._value = e  # the user's element
+            self._count = 0  # access count initially zero
+
+    # ------------------------- nonpublic utilities -------------------------
+    def _find_position(self, e):
+        """Search for element e; return (its Position or None, search depth)."""
+        depth = 0
+        walk = self._data.first()
+        while walk is not None:
+            depth += 1
+            if walk.element()._value == e:
+                return walk, depth
+            walk = self._data.after(walk)
+        return None, depth
+
+    def _move_up(self, p):
+        """Move item at Position p earlier in the list based on access count."""
+        if p != self._data.first():
+            cnt = p.element()._count
+            walk = self._data.before(p)
+            if cnt > walk.element()._count:  # must shift forward
+                while (walk != self._data.first() and
+                       cnt > self._data.before(walk).element()._count):
+                    walk = self._data.before(walk)
+                self._data.add_before(walk, self._data.delete(p))  # delete/reinsert
+
+    def _reorder(self, p):
+        """Apply the reordering policy to the item just accessed at Position p."""
+        if self._policy == 'count':
+            self._move_up(p)
+        elif p != self._data.first():
+            if self._policy == 'mtf':
+                self._data.add_first(self._data.delete(p))
+            else:  # transpose
+                walk = self._data.before(p)
+                self._data.add_before(walk, self._data.delete(p))
+
+    # ------------------------- public methods -------------------------
+    def __init__(self, policy='count'):
+        """Create an empty list of favorites reordered by the given policy."""
+        if policy not in self.POLICIES:
+            raise ValueError('Unknown policy: ' + repr(policy))
+        self._data = PositionalList()  # will be list of _Item instances
+        self._policy = policy
+        self._accesses = 0
+        self._depth = 0  # total depth of all access searches
+
+    def __len__(self):
+        """Return number of entries on favorites list."""
+        return len(self._data)
+
+    def is_empty(self):
+        """Return True if list is empty."""
+        return len(self._data) == 0
+
+    def __iter__(self):
+        """Generate the elements in their current list order."""
+        for item in self._data:
+            yield item._value
+
+    def access(self, e):
+        """Access element e, thereby increasing its access count."""
+        p, depth = self._find_position(e)  # try to locate existing element
+        self._accesses += 1
+        self._depth += depth
+        if p is None:
+            p = self._data.add_last(self._Item(e))  # if new, place at end
+        p.element()._count += 1
+        self._reorder(p)
+
+    def remove(self, e):
+        """Remove element e from the list of favorites."""
+        p, _ = self._find_position(e)
+        if p is not None:
+            self._data.delete(p)  # delete, if found
+
+    def top(self, k):
+        """Generate sequence of top k elements in terms of access count."""
+        if not 1 <= k <= len(self):
+            raise ValueError('Illegal value for k')
+        if self._policy == 'count':  # the list itself is in count order
+            walk = self._data.first()
+            for j in range(k):
+                yield walk.element()._value
+                walk = self._data.after(walk)
+        else:
+            for item in nlargest(k, self._data, key=lambda item: item._count):
+                yield item._value
+
+    def stats(self):
+        """Return a dict with the number of accesses and their search depth."""
+        average = self._depth / self._accesses if self._accesses else 0.0
+        return {'accesses': self._accesses, 'depth': self._depth,
+                'average_depth': average}
@@ -1,3 +1,7 @@
+from array import array
+from random import random
+
+
 class _DoublyLinkedBase:
     """A base class providing a doubly linked list representation."""
 
@@ -48,7 +52,28 @@ class _DoublyLinkedBase:
 
 
 class PositionalList(_DoublyLinkedBase):
-    """A sequential container of elements allowing positional access."""
+    """A sequential container of elements allowing positional access.
+
+    Each node records its owning list through an _Owner token. Tokens form a
+    union-find forest, so concat can hand over all the nodes of another list
+    by forwarding one token, and positions stay valid after their nodes move.
+    """
+
+    class _Node(_DoublyLinkedBase._Node):
+        """Doubly linked node that also records the token of its list."""
+        __slots__ = '_owner',
+
+        def __init__(self, element, prev, next, owner=None):
+            super().__init__(element, prev, next)
+            self._owner = owner
+
+    class _Owner:
+        """Nonpublic token naming a list, or forwarding to another token."""
+        __slots__ = '_list', '_parent'
+
+        def __init__(self, container):
+            self._list = container
+            self._parent = None
 
     class Position:
         """An abstraction representing the location of a single element."""
@@ -70,16 +95,35 @@ class PositionalList(_DoublyLinkedBase):
             """Return True if other does not represent the same location."""
             return not (self == other)  # opposite of __eq__
 
+    def __init__(self):
+        """Create an empty list."""
+        super().__init__()
+        self._token = self._Owner(self)
+
     def _validate(self, p):
         """Return position's node, or raise appropriate error if invalid."""
         if not isinstance(p, self.Position):
             raise TypeError('p must be proper Position type')
-        if p._container is not self:
+        owner = p._node._owner
+        if owner is None:  # a node linked in by hand, not through the list
+            if p._container is not self:
+                raise ValueError('p does not belong to this container')
+        elif self._owner_of(owner) is not self:
             raise ValueError('p does not belong to this container')
         if p._node._next is None:
             raise ValueError('p is no longer valud')
         return p._node
 
+    @staticmethod
+    def _owner_of(token):
+        """Return the list named by token, compressing its forwarding path."""
+        root = token
+        while root._parent is not None:
+            root = root._parent
+        while token is not root:
+            token._parent, token = root, token._parent
+        return root._list
+
     def _make_position(self, node):
         """Return Position instance for given node (or None if sentinel)."""
         if node is self._header or node is self._trailer:
@@ -108,16 +152,46 @@ class PositionalList(_DoublyLinkedBase):
 
     def __iter__(self):
         """Generate a forward iteration of the elements of the list."""
-        cursor = self.first()
-        while cursor is not None:
-            yield cursor.element()
-            cursor = self.after(cursor)
+        node = self._header._next
+        trailer = self._trailer
+        while node is not trailer:  # walk the nodes, building no Positions
+            yield node._element
+            if node._next is None:
+                raise ValueError('list changed size during iteration')
+            node = node._next
+
+    def __reversed__(self):
+        """Generate a backward iteration of the elements of the list."""
+        node = self._trailer._prev
+        header = self._header
+        while node is not header:
+            yield node._element
+            if node._prev is None:
+                raise ValueError('list changed size during iteration')
+            node = node._prev
+
+    def iter_chunks(self, size):
+        """Generate the elements of the list front to back in lists of size.
+
+        The last list holds the remaining elements and may be shorter.
+        """
+        if size < 1:
+            raise ValueError('size must be positive')
+        chunk = []
+        for e in self:
+            chunk.append(e)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
 
     # ------------- mutators -------------
     # override inherited version to return Position, rather than Node
     def _insert_between(self, e, predecessor, successor):
         """Add element between existing nodes and return new Position."""
         node = super()._insert_between(e, predecessor, successor)
+        node._owner = self._token
         return self._make_position(node)
 
     def add_first(self, e):
@@ -151,3 +225,585 @@ class PositionalList(_DoublyLinkedBase):
         old_value = original._element  # save to return
         original._element = e
         return old_value
+
+    def concat(self, other):
+        """Move all elements of other, in order, to the back of this list.
+
+        Takes O(1) time; positions of the moved elements remain valid here.
+        """
+        first, last, k = self._take_all(other)
+        if k:
+            self._link_after(self._trailer._prev, first, last, k)
+
+    def sort(self, key=None, reverse=False):
+        """Sort the elements in place, stably, by relinking their nodes.
+
+        Runs a bottom-up merge sort in O(n log n) time without allocating any
+        nodes, and every Position keeps referring to the same element.
+        """
+        n = self._size
+        if n < 2:
+            return
+        self._detach()
+        tail = cur = None
+        try:
+            width = 1
+            while width < n:  # merge adjacent runs of width nodes
+                tail, cur = self._header, self._header._next
+                while cur is not None:
+                    left = cur
+                    right = self._cut(left, width)
+                    cur = self._cut(right, width)
+                    tail = self._merge_after(tail, left, right, key, reverse)
+                width *= 2
+        finally:
+            if cur is not None:  # a comparison failed; keep every node linked
+                while tail._next is not None:
+                    tail = tail._next
+                tail._next = cur
+            self._reattach(n)
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """Merge the elements of other into this list, both already sorted.
+
+        Takes O(n + m) time and leaves other empty; positions of the moved
+        elements remain valid here, and equal elements of this list come first.
+        """
+        first, last, k = self._take_all(other)
+        if k == 0:
+            return
+        last._next = None
+        n = self._size
+        mine = self._detach() if n else None
+        try:
+            self._merge_after(self._header, mine, first, key, reverse)
+        finally:
+            self._reattach(n + k)
+
+    def _take_all(self, other):
+        """Unlink all nodes of other and hand their ownership to this list.
+
+        Return the first and last node of the chain and its length.
+        """
+        if other is self:
+            raise ValueError('cannot combine a list with itself')
+        if not issubclass(other._Node, self._Node):
+            raise TypeError('other stores an incompatible node type')
+        k = other._size
+        if k == 0:
+            return None, None, 0
+        other._token._parent = self._token  # forward ownership in one step
+        other._token._list = None
+        other._token = other._Owner(other)
+        first, last = other._header._next, other._trailer._prev
+        other._unlink_run(first, last, k)
+        return first, last, k
+
+    def _detach(self):
+        """Unlink all nodes as a None-terminated chain hanging off the header.
+
+        Return the first node; _reattach must be called to restore the list.
+        """
+        first, last = self._header._next, self._trailer._prev
+        self._unlink_run(first, last, self._size)
+        last._next = None
+        self._header._next = first
+        return first
+
+    def _reattach(self, k):
+        """Link the k-node chain hanging off the header back into the list."""
+        first = self._header._next
+        prev, node = self._header, first
+        while node is not None:  # only _next links are kept while merging
+            node._prev = prev
+            prev, node = node, node._next
+        self._header._next = self._trailer
+        self._link_after(self._header, first, prev, k)
+
+    @staticmethod
+    def _cut(node, k):
+        """Cut a chain after its first k nodes and return the remainder."""
+        for _ in range(k - 1):
+            if node is None:
+                return None
+            node = node._next
+        if node is None:
+            return None
+        rest = node._next
+        node._next = None
+        return rest
+
+    @staticmethod
+    def _merge_after(anchor, a, b, key, reverse):
+        """Link the stable merge of sorted chains a and b after anchor.
+
+        Return the last node linked. If a comparison raises, the unmerged
+        nodes are still linked after the merged ones before it propagates.
+        """
+        tail = anchor
+        try:
+            while a is not None and b is not None:
+                ka = a._element if key is None else key(a._element)
+                kb = b._element if key is None else key(b._element)
+                if (ka < kb) if reverse else (kb < ka):
+                    tail._next, tail, b = b, b, b._next
+                else:
+                    tail._next, tail, a = a, a, a._next
+        finally:
+            if a is None:
+                a, b = b, None
+            tail._next = a
+            while tail._next is not None:
+                tail = tail._next
+            tail._next = b
+        return tail
+
+    def splice(self, p_start, p_end, target, after=None):
+        """Move the run of elements from p_start through p_end into target.
+
+        The run is placed after Position after of target, or at its back if
+        after is None. Links are changed in O(1) time, but the moved nodes
+        are relabeled and counted in one pass, so the total is O(k) for a run
+        of k elements. Positions of the moved elements remain valid in target.
+        """
+        if not issubclass(self._Node, target._Node):
+            raise TypeError('target stores an incompatible node type')
+        first = self._validate(p_start)
+        last = self._validate(p_end)
+        anchor = target._trailer._prev if after is None else target._validate(after)
+        k = 1
+        node = first
+        while node is not last:  # count the run, checking that it is well formed
+            if node is anchor:
+                raise ValueError('after lies inside the run being moved')
+            node = node._next
+            if node is self._trailer:
+                raise ValueError('p_end does not follow p_start')
+            k += 1
+        if anchor is last:  # the run already sits right after anchor
+            return
+        if target is not self:
+            token = target._token
+            node = first
+            for _ in range(k):
+                node._owner = token
+                node = node._next
+        self._unlink_run(first, last, k)
+        target._link_after(anchor, first, last, k)
+
+    def split_after(self, p):
+        """Remove the elements after Position p and return them as a new list.
+
+        Whichever side of p is shorter gets relabeled, so this takes
+        O(min(k, n - k)) time. Positions keep their elements valid in the list
+        that now holds them.
+        """
+        node = self._validate(p)
+        result = type(self)()
+        head, tail = node, node._next
+        while head is not self._header and tail is not self._trailer:
+            head, tail = head._prev, tail._next  # walk both sides in lockstep
+        if tail is self._trailer:               # the tail side is the short one
+            token, start, stop = result._token, node._next, self._trailer
+        else:                                   # hand this list's token over
+            result._token, self._token = self._token, self._Owner(self)
+            result._token._list = result
+            token, start, stop = self._token, self._header._next, node._next
+        k = 0
+        cursor = start
+        while cursor is not stop:
+            cursor._owner = token
+            cursor = cursor._next
+            k += 1
+        moved = k if tail is self._trailer else self._size - k
+        if moved:
+            first, last = node._next, self._trailer._prev
+            self._unlink_run(first, last, moved)
+            result._link_after(result._header, first, last, moved)
+        return result
+
+    def _unlink_run(self, first, last, k):
+        """Unlink the k-node chain first..last from this list."""
+        first._prev._next = last._next
+        last._next._prev = first._prev
+        self._size -= k
+
+    def _link_after(self, anchor, first, last, k):
+        """Link the k-node chain first..last into this list after anchor."""
+        successor = anchor._next
+        anchor._next = first
+        first._prev = anchor
+        last._next = successor
+        successor._prev = last
+        self._size += k
+
+
+class IndexedPositionalList(PositionalList):
+    """A positional list that can find the k-th element and a position's rank.
+
+    On top of the ordinary links, every node carries a tower of express links
+    of random height, as in a skip list, and each express link records how
+    many elements it skips. at(k) and index_of(p) then take expected
+    O(log n) time, and add_* and delete maintain the towers in O(log n).
+    concat, splice and split_after only mark the towers stale; they are
+    rebuilt in O(n) at the next at or index_of.
+    """
+
+    MAX_HEIGHT = 32
+
+    class _Node(PositionalList._Node):
+        """Positional list node with a tower of [next, prev, width] links."""
+        __slots__ = '_tower',
+
+        def __init__(self, element, prev, next, owner=None):
+            super().__init__(element, prev, next, owner)
+            self._tower = ()  # express links for levels 1, 2, ...
+
+    def __init__(self):
+        """Create an empty list."""
+        super().__init__()
+        self._header._tower = []
+        self._trailer._tower = []
+        self._stale = False  # towers need a rebuild before the next query
+
+    # ------------- rank and select -------------
+    def at(self, k):
+        """Return the Position of the element at index k (negative counts back).
+
+        Raise IndexError if k is out of range.
+        """
+        if k < 0:
+            k += self._size
+        if not 0 <= k < self._size:
+            raise IndexError('invalid index')
+        if self._stale:
+            self._rebuild()
+        cur, pos = self._header, -1
+        for level in range(len(self._header._tower), 0, -1):
+            link = cur._tower[level - 1]
+            while pos + link[2] <= k:  # never reaches the trailer, at n
+                pos += link[2]
+                cur = link[0]
+                link = cur._tower[level - 1]
+        while pos < k:
+            cur = cur._next
+            pos += 1
+        return self._make_position(cur)
+
+    def index_of(self, p):
+        """Return the index of the element at Position p."""
+        cur = self._validate(p)
+        if self._stale:
+            self._rebuild()
+        steps = 0
+        while cur is not self._header:  # climb back along the top of each tower
+            t = len(cur._tower)
+            if t == 0:
+                cur = cur._prev
+                steps += 1
+            else:
+                cur = cur._tower[t - 1][1]
+                steps += cur._tower[t - 1][2]
+        return steps - 1
+
+    # ------------- maintenance -------------
+    def _insert_between(self, e, predecessor, successor):
+        """Add element between existing nodes and return new Position."""
+        position = super()._insert_between(e, predecessor, successor)
+        node = position._node
+        height = self._random_height()
+        if self._stale:
+            node._tower = [[None, None, 0] for _ in range(height - 1)]
+        else:
+            self._link_tower(node, height)
+        return position
+
+    def _delete_node(self, node):
+        """Delete nonsentinel node from the list and return its element."""
+        if not self._stale:
+            self._unlink_tower(node)
+        node._tower = ()
+        return super()._delete_node(node)
+
+    def _unlink_run(self, first, last, k):
+        super()._unlink_run(first, last, k)
+        self._stale = True
+
+    def _link_after(self, anchor, first, last, k):
+        super()._link_after(anchor, first, last, k)
+        self._stale = True
+
+    def _random_height(self):
+        """Return a tower height drawn from a geometric distribution."""
+        height = 1
+        while height < self.MAX_HEIGHT and random() < 0.5:
+            height += 1
+        return height
+
+    def _grow(self, height):
+        """Raise the sentinel towers to height, spanning the current size."""
+        header, trailer = self._header, self._trailer
+        while len(header._tower) < height - 1:
+            header._tower.append([trailer, None, self._size])
+            trailer._tower.append([None, header, 0])
+
+    def _link_tower(self, node, height):
+        """Build the tower of a node just linked at level 0."""
+        self._grow(height)  # new sentinel links do not count the node yet
+        tower = [None] * (height - 1)
+        cur, d = node._prev, 1  # d is the distance from cur to node
+        for level in range(1, len(self._header._tower) + 1):
+            while len(cur._tower) < level:  # climb back to a tall enough node
+                t = len(cur._tower)
+                if t == 0:
+                    cur = cur._prev
+                    d += 1
+                else:
+                    cur = cur._tower[t - 1][1]
+                    d += cur._tower[t - 1][2]
+            link = cur._tower[level - 1]
+            if level < height:  # split the link that passes over the node
+                tower[level - 1] = [link[0], cur, link[2] - d + 1]
+                link[0]._tower[level - 1][1] = node
+                link[0] = node
+                link[2] = d
+            else:
+                link[2] += 1
+        node._tower = tower
+
+    def _unlink_tower(self, node):
+        """Remove the tower of a node about to be deleted."""
+        for level, (next, prev, width) in enumerate(node._tower, 1):
+            link = prev._tower[level - 1]
+            link[0] = next
+            link[2] += width - 1
+            next._tower[level - 1][1] = prev
+        cur = node._tower[-1][1] if node._tower else node._prev
+        for level in range(len(node._tower) + 1, len(self._header._tower) + 1):
+            while len(cur._tower) < level:
+                t = len(cur._tower)
+                cur = cur._tower[t - 1][1] if t else cur._prev
+            cur._tower[level - 1][2] -= 1
+
+    def _rebuild(self):
+        """Relink every tower in one pass over the list."""
+        header, trailer = self._header, self._trailer
+        last = [header] * len(header._tower)  # latest node seen at each level
+        seen = [0] * len(header._tower)       # and its distance from header
+        pos = 0
+        node = header._next
+        while node is not trailer:
+            pos += 1
+            tower = node._tower
+            while len(last) < len(tower):
+                header._tower.append([trailer, None, 0])
+                trailer._tower.append([None, header, 0])
+                last.append(header)
+                seen.append(0)
+            for i, link in enumerate(tower):
+                previous = last[i]._tower[i]
+                previous[0] = node
+                previous[2] = pos - seen[i]
+                link[1] = last[i]
+                last[i] = node
+                seen[i] = pos
+            node = node._next
+        pos += 1
+        for i in range(len(last)):
+            previous = last[i]._tower[i]
+            previous[0] = trailer
+            previous[2] = pos - seen[i]
+            trailer._tower[i][1] = last[i]
+        self._stale = False
+
+
+class ArrayPositionalList:
+    """A positional list keeping its links in parallel arrays of integers.
+
+    Every element is identified by an integer handle indexing the prev and
+    next link arrays and the element list; slots 0 and 1 are the header and
+    trailer sentinels. Deleted slots go on a free list chained through the
+    next links, and each slot carries a generation number that is bumped on
+    deletion, so a Position outliving its element is recognized as invalid.
+    """
+
+    _HEADER = 0
+    _TRAILER = 1
+    _FREE = -1  # prev link of a slot on the free list
+
+    class Position:
+        """An abstraction representing the location of a single element."""
+        __slots__ = '_container', '_handle', '_generation'
+
+        def __init__(self, container, handle, generation):
+            """Constructor should not be invoked by user."""
+            self._container = container
+            self._handle = handle
+            self._generation = generation
+
+        def element(self):
+            """Return the element stored at this Position (None once deleted)."""
+            container = self._container
+            if container._generation[self._handle] != self._generation:
+                return None  # the slot may already hold another element
+            return container._elements[self._handle]
+
+        def __eq__(self, other):
+            """Return True if other is a Position representing the same location."""
+            return (type(other) is type(self) and other._container is self._container
+                    and other._handle == self._handle
+                    and other._generation == self._generation)
+
+        def __ne__(self, other):
+            """Return True if other does not represent the same location."""
+            return not (self == other)  # opposite of __eq__
+
+    def __init__(self):
+        """Create an empty list."""
+        self._elements = [None, None]
+        self._prev = array('i', [self._HEADER, self._HEADER])
+        self._next = array('i', [self._TRAILER, self._TRAILER])
+        self._generation = array('I', [0, 0])
+        self._free = self._FREE  # first slot of the free list
+        self._size = 0
+
+    def __len__(self):
+        """Return the number of elements in the list."""
+        return self._size
+
+    def is_empty(self):
+        """Return True if list is empty."""
+        return self._size == 0
+
+    def _validate(self, p):
+        """Return position's handle, or raise appropriate error if invalid."""
+        if not isinstance(p, self.Position):
+            raise TypeError('p must be proper Position type')
+        if p._container is not self:
+            raise ValueError('p does not belong to this container')
+        if self._generation[p._handle] != p._generation:
+            raise ValueError('p is no longer valid')
+        return p._handle
+
+    def _make_position(self, h):
+        """Return Position instance for given handle (or None if sentinel)."""
+        if h == self._HEADER or h == self._TRAILER:
+            return None
+        return self.Position(self, h, self._generation[h])
+
+    # ------------- accessors -------------
+    def first(self):
+        """Return the first Position in the list (or None if list is empty)."""
+        return self._make_position(self._next[self._HEADER])
+
+    def last(self):
+        """Return the last Position in the list (or None if the list is empty)."""
+        return self._make_position(self._prev[self._TRAILER])
+
+    def before(self, p):
+        """Return the Position just before Position p (or None if p is first)."""
+        return self._make_position(self._prev[self._validate(p)])
+
+    def after(self, p):
+        """Return the Position just after Position p (or None if p is last)."""
+        return self._make_position(self._next[self._validate(p)])
+
+    def __iter__(self):
+        """Generate a forward iteration of the elements of the list."""
+        elements, next, generation = self._elements, self._next, self._generation
+        h = next[self._HEADER]
+        while h != self._TRAILER:
+            g = generation[h]
+            yield elements[h]
+            if generation[h] != g:
+                raise ValueError('list changed size during iteration')
+            h = next[h]
+
+    def __reversed__(self):
+        """Generate a backward iteration of the elements of the list."""
+        elements, prev, generation = self._elements, self._prev, self._generation
+        h = prev[self._TRAILER]
+        while h != self._HEADER:
+            g = generation[h]
+            yield elements[h]
+            if generation[h] != g:
+                raise ValueError('list changed size during iteration')
+            h = prev[h]
+
+    def iter_chunks(self, size):
+        """Generate the elements of the list front to back in lists of size.
+
+        The last list holds the remaining elements and may be shorter.
+        """
+        if size < 1:
+            raise ValueError('size must be positive')
+        chunk = []
+        for e in self:
+            chunk.append(e)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    # ------------- mutators -------------
+    def _insert_between(self, e, predecessor, successor):
+        """Add element between existing slots and return new Position."""
+        h = self._free
+        if h != self._FREE:  # reuse a deleted slot
+            self._free = self._next[h]
+            self._elements[h] = e
+            self._prev[h] = predecessor
+            self._next[h] = successor
+        else:
+            h = len(self._elements)
+            self._elements.append(e)
+            self._prev.append(predecessor)
+            self._next.append(successor)
+            self._generation.append(0)
+        self._next[predecessor] = h
+        self._prev[successor] = h
+        self._size += 1
+        return self.Position(self, h, self._generation[h])
+
+    def add_first(self, e):
+        """Insert element e at the front of the list and return new Position."""
+        return self._insert_between(e, self._HEADER, self._next[self._HEADER])
+
+    def add_last(self, e):
+        """Insert element e at the back of the list and return new Position."""
+        return self._insert_between(e, self._prev[self._TRAILER], self._TRAILER)
+
+    def add_before(self, p, e):
+        """Insert element e into the list before Position p and return new Position."""
+        h = self._validate(p)
+        return self._insert_between(e, self._prev[h], h)
+
+    def add_after(self, p, e):
+        """Insert element e into the list after Position p and return new Position."""
+        h = self._validate(p)
+        return self._insert_between(e, h, self._next[h])
+
+    def delete(self, p):
+        """Remove and return the element at Position p."""
+        h = self._validate(p)
+        predecessor, successor = self._prev[h], self._next[h]
+        self._next[predecessor] = successor
+        self._prev[successor] = predecessor
+        self._size -= 1
+        element = self._elements[h]
+        self._elements[h] = None  # help garbage collection
+        self._prev[h] = self._FREE
+        self._next[h] = self._free
+        self._free = h
+        self._generation[h] = (self._generation[h] + 1) & 0xFFFFFFFF
+        return element
+
+    def replace(self, p, e):
+        """Replace the element at Position p with e.
+
+        Return the element formerly at Position p."""
+        h = self._validate(p)
+        old_value = self._elements[h]  # save to return
+        self._elements[h] = e
+        return old_value
@@ -143,9 +143,29 @@ class ChainHashMap(HashMapBase):
 
 
 class ProbeHashMap(HashMapBase):
-    """Hash map implemented with linear probing for collision resolution."""
+    """Hash map implemented with linear probing for collision resolution.
+
+    Deletions leave _AVAIL markers behind. Once items and markers together
+    fill half the table, it is rebuilt without the markers, so a probe always
+    reaches an empty slot.
+    """
     _AVAIL = object()  # sentinel marks locations of previous deletions
 
+    def __init__(self, cap=11, p=109345121):
+        """Create an empty hash-table map."""
+        super().__init__(cap, p)
+        self._avail = 0  # number of _AVAIL markers in the table
+
+    def __setitem__(self, k, v):
+        super().__setitem__(k, v)
+        if self._n + self._avail > len(self._table) // 2:
+            # rebuild with room for as many insertions as there are items
+            self._resize(max(4 * self._n - 1, 11))
+
+    def _resize(self, c):
+        self._avail = 0
+        super()._resize(c)
+
     def _is_available(self, j):
         """Return True if index j is available in table."""
         return self._table[j] is None or self._table[j] is ProbeHashMap._AVAIL
@@ -177,6 +197,8 @@ class ProbeHashMap(HashMapBase):
     def _bucket_setitem(self, j, k, v):
         found, s = self._find_slot(j, k)
         if not found:
+            if self._table[s] is ProbeHashMap._AVAIL:  # reuse a marked slot
+                self._avail -= 1
             self._table[s] = self._Item(k, v)
             self._n += 1
         else:
@@ -187,6 +209,7 @@ class ProbeHashMap(HashMapBase):
         if not found:
             raise KeyError('Key Error: ' + repr(k))
         self._table[s] = ProbeHashMap._AVAIL  # mark as vacated
+        self._avail += 1
 
     def __iter__(self):
         for j in range(len(self._table)):
@@ -0,0 +1,48 @@
+class NodePool:
+    """Bounded free list that recycles the nodes of a singly linked container.
+
+    Released nodes are chained through their own _next fields, so the pool
+    itself allocates nothing; at most capacity nodes are kept for reuse.
+    """
+
+    def __init__(self, node_type, capacity):
+        """Create an empty pool of node_type nodes holding up to capacity."""
+        if capacity < 0:
+            raise ValueError('capacity must not be negative')
+        self._node_type = node_type
+        self._capacity = capacity
+        self._free = None  # head of the chain of released nodes
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        """Return the number of nodes waiting to be reused."""
+        return self._size
+
+    def acquire(self, element, next):
+        """Return a node holding element and next, recycled if possible."""
+        node = self._free
+        if node is None:
+            self._misses += 1
+            return self._node_type(element, next)
+        self._free = node._next
+        self._size -= 1
+        self._hits += 1
+        node._element = element
+        node._next = next
+        return node
+
+    def release(self, node):
+        """Take back a node the container no longer links to."""
+        node._element = None  # help garbage collection
+        if self._size < self._capacity:
+            node._next = self._free
+            self._free = node
+            self._size += 1
+        else:
+            node._next = None
+
+    def stats(self):
+        """Return a dict of the pool's hit, miss and free-node counts."""
+        return {'hits': self._hits, 'misses': self._misses, 'free': self._size}
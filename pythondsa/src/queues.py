@@ -1,5 +1,6 @@
 from pythondsa.src.exceptions import Empty
 from pythondsa.src.lists import _DoublyLinkedBase
+from pythondsa.src.pools import NodePool
 
 
 class ArrayQueue:
@@ -20,12 +21,12 @@ class ArrayQueue:
     def _resize(self, cap):
         """Resizes the list to capacity >= len(self)."""
         old = self._data                  # keep track of existing list
-        self._data = [None] * cap
-        walk = self._front
-
-        for k in range(self._size):
-            self._data[k] = old[walk]     # shift indices
-            walk = (1 + walk) % len(old)  # old size used for modulus
+        end = self._front + self._size
+        if end <= len(old):               # live elements do not wrap around
+            live = old[self._front:end]
+        else:                             # copy the two wrapped pieces
+            live = old[self._front:] + old[:end - len(old)]
+        self._data = live + [None] * (cap - self._size)
         self._front = 0
 
     def is_empty(self):
@@ -65,6 +66,117 @@ class ArrayQueue:
 
         return result
 
+    def enqueue_many(self, iterable):
+        """Add the elements of iterable, in order, to the back of the queue."""
+        values = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        m = len(values)
+        if m == 0:
+            return
+        if self._size + m > len(self._data):
+            self._resize(max(2 * len(self._data), self._size + m))
+
+        cap = len(self._data)
+        start = (self._front + self._size) % cap
+        first = min(m, cap - start)       # room before the end of the list
+        self._data[start:start + first] = values[:first]
+        if first < m:                     # the rest wraps around to the start
+            self._data[:m - first] = values[first:]
+        self._size += m
+
+    def dequeue_many(self, n):
+        """
+        Removes the n elements in front of the queue and returns them in a list.
+
+        Raises Empty exception, and removes nothing, if there are fewer than n."""
+        if n > self._size:
+            raise Empty('The queue has fewer than {} elements'.format(n))
+        if n <= 0:
+            return []
+
+        cap = len(self._data)
+        end = self._front + n
+        if end <= cap:
+            result = self._data[self._front:end]
+            self._data[self._front:end] = [None] * n
+        else:                             # the elements wrap around
+            result = self._data[self._front:] + self._data[:end - cap]
+            self._data[self._front:] = [None] * (cap - self._front)
+            self._data[:end - cap] = [None] * (end - cap)
+        self._front = end % cap
+        self._size -= n
+
+        return result
+
+
+class MaskedArrayQueue(ArrayQueue):
+    """ArrayQueue with power-of-two capacity that also shrinks when sparse.
+
+    With a capacity of 2**k, indices wrap around with a bitmask instead of a
+    modulo. Whenever the queue falls to a quarter of its capacity, the list
+    shrinks to the smallest power of two holding twice the remaining elements,
+    but never below MIN_CAPACITY.
+    """
+
+    MIN_CAPACITY = 16
+
+    def __init__(self, capacity=MIN_CAPACITY):
+        """Creates an empty queue with capacity rounded up to a power of two."""
+        cap = self._power_of_two(max(capacity, self.MIN_CAPACITY))
+        self._data = [None] * cap
+        self._mask = cap - 1
+        self._size = 0
+        self._front = 0
+
+    @staticmethod
+    def _power_of_two(n):
+        """Returns the smallest power of two >= n."""
+        return 1 << (n - 1).bit_length()
+
+    def _resize(self, cap):
+        """Resizes the list to a power-of-two capacity >= max(len(self), cap)."""
+        super()._resize(self._power_of_two(max(cap, self._size, 1)))
+        self._mask = len(self._data) - 1
+
+    def _shrink(self):
+        """Shrinks the list if the queue fills no more than a quarter of it."""
+        cap = len(self._data)
+        if cap > self.MIN_CAPACITY and self._size <= cap // 4:
+            self._resize(max(self.MIN_CAPACITY, 2 * self._size))
+
+    def enqueue(self, e):
+        """Add an element to the back of the queue."""
+        if self._size == len(self._data):
+            self._resize(2 * len(self._data))  # double the array size
+
+        self._data[(self._front + self._size) & self._mask] = e
+        self._size += 1
+
+    def dequeue(self):
+        """
+        Removes and returns the element in front of the queue.
+
+        Raises Empty exception if the queue is empty."""
+        if self._size == 0:
+            raise Empty('The queue is empty')
+
+        result = self._data[self._front]
+        self._data[self._front] = None
+        self._front = (self._front + 1) & self._mask
+        self._size -= 1
+        self._shrink()
+
+        return result
+
+    def dequeue_many(self, n):
+        """
+        Removes the n elements in front of the queue and returns them in a list.
+
+        Raises Empty exception, and removes nothing, if there are fewer than n."""
+        result = super().dequeue_many(n)
+        self._shrink()
+
+        return result
+
 
 class LinkedQueue:
     """FIFO Queue implementation using a singly linked list for storage."""
@@ -77,11 +189,17 @@ class LinkedQueue:
             self._element = element
             self._next = next
 
-    def __init__(self):
-        """Create an empty queue."""
+    def __init__(self, pool_size=0):
+        """Create an empty queue.
+
+        With a positive pool_size, up to that many dequeued nodes are kept and
+        reused by later enqueues instead of allocating new ones.
+        """
         self._head = None
         self._tail = None
         self._size = 0
+        self._pool = NodePool(self._Node, pool_size) if pool_size > 0 else None
+        self._make_node = self._Node if self._pool is None else self._pool.acquire
 
     def __len__(self):
         """Return the number of elements in queue."""
@@ -91,6 +209,10 @@ class LinkedQueue:
         """Return True if the queue is empty."""
         return self._size == 0
 
+    def pool_stats(self):
+        """Return the node pool's counters, or None if pooling is off."""
+        return None if self._pool is None else self._pool.stats()
+
     def first(self):
         """Return (but do not remove) the element at the front of the queue."""
         if self.is_empty():
@@ -104,16 +226,19 @@ class LinkedQueue:
         """
         if self.is_empty():
             raise Empty('Queue is empty')
-        answer = self._head._element
-        self._head = self._head._next
+        old = self._head
+        answer = old._element
+        self._head = old._next
         self._size -= 1
         if self.is_empty():
             self._tail = None
+        if self._pool is not None:
+            self._pool.release(old)
         return answer
 
     def enqueue(self, e):
         """Add an element to the back of the queue."""
-        newest = self._Node(e, None)
+        newest = self._make_node(e, None)
         if self.is_empty():
             self._head = newest
         else:
@@ -134,10 +259,16 @@ class CircularQueue:
             self._element = element
             self._next = next
 
-    def __init__(self):
-        """Create an empty queue."""
+    def __init__(self, pool_size=0):
+        """Create an empty queue.
+
+        With a positive pool_size, up to that many dequeued nodes are kept and
+        reused by later enqueues instead of allocating new ones.
+        """
         self._tail = None
         self._size = 0
+        self._pool = NodePool(self._Node, pool_size) if pool_size > 0 else None
+        self._make_node = self._Node if self._pool is None else self._pool.acquire
 
     def __len__(self):
         """Return the number of elements in the queue."""
@@ -147,6 +278,10 @@ class CircularQueue:
         """Return True if the queue is empty."""
         return self._size == 0
 
+    def pool_stats(self):
+        """Return the node pool's counters, or None if pooling is off."""
+        return None if self._pool is None else self._pool.stats()
+
     def first(self):
         """Return (but do not remove) the element at the front of the queue.
 
@@ -169,11 +304,14 @@ class CircularQueue:
         else:
             self._tail._next = oldhead._next
         self._size -= 1
-        return oldhead._element
+        answer = oldhead._element
+        if self._pool is not None:
+            self._pool.release(oldhead)
+        return answer
 
     def enqueue(self, e):
         """Add an element to the back of the queue."""
-        newest = self._Node(e, None)
+        newest = self._make_node(e, None)
         if self.is_empty():
             newest._next = newest
         else:
@@ -1,4 +1,12 @@
+import multiprocessing
+import pickle
+import struct
+import tempfile
+import threading
+from array import array
+from multiprocessing import shared_memory
 from pythondsa.src.exceptions import Empty, Full
+from pythondsa.src.pools import NodePool
 
 
 class ArrayStack:
@@ -26,16 +34,27 @@ class ArrayStack:
 
         Raises Full exception if the stack has assigned maxlen and is full.
         """
-        if self.is_full():
+        if len(self._data) == self._maxlen:    # inlined is_full()
             raise Full('Tre stack is full')
         self._data.append(e)
 
+    def push_many(self, iterable):
+        """Adds the elements of iterable to the stack, the last one on top.
+
+        Raises Full exception, and pushes nothing, if the elements would not
+        fit within the assigned maxlen.
+        """
+        values = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        if self._maxlen is not None and len(self._data) + len(values) > self._maxlen:
+            raise Full('Tre stack is full')
+        self._data.extend(values)
+
     def top(self):
         """
         Returns the element at the top of the stack, without removing it.
         Raises Empty exception if the stack is empty.
         """
-        if self.is_empty():
+        if not self._data:                     # inlined is_empty()
             raise Empty('The stack is empty')
         return self._data[-1]
 
@@ -44,10 +63,452 @@ class ArrayStack:
         Removes and returns the element from the top of the stack.
         Raises Empty exception if the stack is empty.
         """
-        if self.is_empty():
+        if not self._data:                     # inlined is_empty()
+            raise Empty('The stack is empty')
+        return self._data.pop()
+
+    def pop_many(self, n):
+        """
+        Removes the top n elements and returns them in a list, top first.
+        Raises Empty exception, and removes nothing, if there are fewer than n.
+        """
+        answer = self.peek_many(n)
+        if n > 0:
+            del self._data[-n:]
+        return answer
+
+    def peek_many(self, n):
+        """
+        Returns the top n elements in a list, top first, without removing them.
+        Raises Empty exception if the stack has fewer than n elements.
+        """
+        if n > len(self._data):
+            raise Empty('The stack has fewer than {} elements'.format(n))
+        if n <= 0:
+            return []
+        return self._data[-n:][::-1]
+
+
+class BoundedArrayStack(ArrayStack):
+    """Fixed-capacity stack over a list preallocated to maxlen slots.
+
+    The underlying list never grows or shrinks, so pushes never reallocate.
+    """
+
+    def __init__(self, maxlen):
+        """Creates an empty stack that holds at most maxlen elements."""
+        super().__init__(maxlen)
+        self._data = [None] * maxlen
+        self._size = 0
+
+    def __len__(self):
+        """Returns the number of elements in the stack."""
+        return self._size
+
+    def is_empty(self):
+        """Returns True if the stack is empty."""
+        return self._size == 0
+
+    def is_full(self):
+        """Returns True if the stack is full."""
+        return self._size == self._maxlen
+
+    def push(self, e):
+        """Adds an element to the top of the stack.
+
+        Raises Full exception if the stack is full.
+        """
+        if self._size == self._maxlen:
+            raise Full('Tre stack is full')
+        self._data[self._size] = e
+        self._size += 1
+
+    def push_many(self, iterable):
+        """Adds the elements of iterable to the stack, the last one on top.
+
+        Raises Full exception, and pushes nothing, if they would not fit.
+        """
+        values = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        end = self._size + len(values)
+        if end > self._maxlen:
+            raise Full('Tre stack is full')
+        self._data[self._size:end] = values
+        self._size = end
+
+    def top(self):
+        """
+        Returns the element at the top of the stack, without removing it.
+        Raises Empty exception if the stack is empty.
+        """
+        if self._size == 0:
+            raise Empty('The stack is empty')
+        return self._data[self._size - 1]
+
+    def pop(self):
+        """
+        Removes and returns the element from the top of the stack.
+        Raises Empty exception if the stack is empty.
+        """
+        if self._size == 0:
+            raise Empty('The stack is empty')
+        self._size -= 1
+        answer = self._data[self._size]
+        self._data[self._size] = None          # help garbage collection
+        return answer
+
+    def pop_many(self, n):
+        """
+        Removes the top n elements and returns them in a list, top first.
+        Raises Empty exception, and removes nothing, if there are fewer than n.
+        """
+        answer = self.peek_many(n)
+        if n > 0:
+            self._size -= n
+            self._data[self._size:self._size + n] = [None] * n
+        return answer
+
+    def peek_many(self, n):
+        """
+        Returns the top n elements in a list, top first, without removing them.
+        Raises Empty exception if the stack has fewer than n elements.
+        """
+        if n > self._size:
+            raise Empty('The stack has fewer than {} elements'.format(n))
+        if n <= 0:
+            return []
+        return self._data[self._size - n:self._size][::-1]
+
+
+class AggregateStack(ArrayStack):
+    """ArrayStack answering min, max and a custom aggregate in O(1) time.
+
+    Alongside each element the stack stores the minimum, maximum and running
+    aggregate of everything at or below it, so every query reads the top entry.
+    """
+
+    def __init__(self, maxlen=None, aggregate=None):
+        """Creates an empty stack.
+
+        aggregate, if given, is an associative binary function such as
+        operator.add, folded over the elements from bottom to top.
+        """
+        super().__init__(maxlen)
+        self._combine = aggregate
+        self._mins = []
+        self._maxs = []
+        self._aggs = []
+
+    def push(self, e):
+        """Adds an element to the top of the stack.
+
+        Raises Full exception if the stack has assigned maxlen and is full.
+        """
+        summaries = self._summarize([e])  # may raise; nothing is pushed then
+        super().push(e)
+        self._record(*summaries)
+
+    def push_many(self, iterable):
+        """Adds the elements of iterable to the stack, the last one on top.
+
+        Raises Full exception, and pushes nothing, if the elements would not
+        fit within the assigned maxlen.
+        """
+        values = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        summaries = self._summarize(values)  # may raise; nothing is pushed then
+        super().push_many(values)
+        self._record(*summaries)
+
+    def pop(self):
+        """
+        Removes and returns the element from the top of the stack.
+        Raises Empty exception if the stack is empty.
+        """
+        answer = super().pop()
+        self._mins.pop()
+        self._maxs.pop()
+        if self._combine is not None:
+            self._aggs.pop()
+        return answer
+
+    def pop_many(self, n):
+        """
+        Removes the top n elements and returns them in a list, top first.
+        Raises Empty exception, and removes nothing, if there are fewer than n.
+        """
+        answer = super().pop_many(n)
+        if n > 0:
+            del self._mins[-n:]
+            del self._maxs[-n:]
+            del self._aggs[-n:]
+        return answer
+
+    def min(self):
+        """
+        Returns the smallest element in the stack.
+        Raises Empty exception if the stack is empty.
+        """
+        if not self._mins:
+            raise Empty('The stack is empty')
+        return self._mins[-1]
+
+    def max(self):
+        """
+        Returns the largest element in the stack.
+        Raises Empty exception if the stack is empty.
+        """
+        if not self._maxs:
+            raise Empty('The stack is empty')
+        return self._maxs[-1]
+
+    def aggregate(self):
+        """
+        Returns the aggregate of all elements in the stack, bottom to top.
+        Raises Empty exception if the stack is empty, and ValueError if the
+        stack was created without an aggregate function.
+        """
+        if self._combine is None:
+            raise ValueError('The stack has no aggregate function')
+        if not self._aggs:
             raise Empty('The stack is empty')
+        return self._aggs[-1]
+
+    def _summarize(self, values):
+        """Return the min, max and aggregate lists for pushing values in order."""
+        mins, maxs, aggs = [], [], []
+        bottom = not self._mins
+        if not bottom:
+            lo, hi = self._mins[-1], self._maxs[-1]
+            acc = self._aggs[-1] if self._combine is not None else None
+        for e in values:
+            if bottom:  # the bottom element summarizes itself
+                lo = hi = acc = e
+                bottom = False
+            else:
+                lo = min(e, lo)
+                hi = max(e, hi)
+                if self._combine is not None:
+                    acc = self._combine(acc, e)
+            mins.append(lo)
+            maxs.append(hi)
+            if self._combine is not None:
+                aggs.append(acc)
+        return mins, maxs, aggs
+
+    def _record(self, mins, maxs, aggs):
+        """Append the summaries computed by _summarize for newly pushed elements."""
+        self._mins.extend(mins)
+        self._maxs.extend(maxs)
+        self._aggs.extend(aggs)
+
+
+class SpillStack:
+    """Stack that keeps its top in memory and spills the rest to a temp file.
+
+    Elements above the memory budget are written, a segment at a time, to the
+    end of a temporary file, and read back from its end when the in-memory
+    part runs out, so the file is only ever accessed sequentially. Segments
+    are packed with array.tobytes when a typecode is given, or pickled.
+    """
+
+    DEFAULT_SEGMENT_SIZE = 1 << 16
+
+    def __init__(self, maxlen=None, segment_size=DEFAULT_SEGMENT_SIZE,
+                 memory_budget=None, typecode=None, dir=None):
+        """Creates an empty stack.
+
+        memory_budget is the number of elements kept in memory; it defaults to
+        four segments and must be at least two, so a segment read back from
+        disk is never spilled again by the next push. dir is where the
+        temporary file is created.
+        """
+        if segment_size < 1:
+            raise ValueError('segment_size must be positive')
+        if memory_budget is None:
+            memory_budget = 4 * segment_size
+        if memory_budget < 2 * segment_size:
+            raise ValueError('memory_budget must hold at least two segments')
+        self._data = []                # in-memory top of the stack
+        self._maxlen = maxlen
+        self._segment_size = segment_size
+        self._budget = memory_budget
+        self._typecode = typecode
+        self._dir = dir
+        self._file = None              # created on the first spill
+        self._segments = []            # (offset, count) of each spilled segment
+        self._spilled = 0              # number of elements on disk
+
+    def __len__(self):
+        """Returns the number of elements in the stack."""
+        return len(self._data) + self._spilled
+
+    def is_empty(self):
+        """Returns True if the stack is empty."""
+        return len(self) == 0
+
+    def is_full(self):
+        """Returns True if the stack is full."""
+        return len(self) == self._maxlen
+
+    def push(self, e):
+        """Adds an element to the top of the stack.
+
+        Raises Full exception if the stack has assigned maxlen and is full,
+        and TypeError or OverflowError if e does not fit the typecode.
+        """
+        if self.is_full():
+            raise Full('Tre stack is full')
+        if self._typecode is not None:
+            e = array(self._typecode, [e])[0]  # reject it now, not at a later spill
+        if len(self._data) >= self._budget:
+            self._spill()
+        self._data.append(e)
+
+    def push_many(self, iterable):
+        """Adds the elements of iterable to the stack, the last one on top.
+
+        Whole segments beyond the memory budget are spilled to the file.
+        Raises Full exception, and pushes nothing, if the elements would not
+        fit within the assigned maxlen.
+        """
+        values = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        if self._maxlen is not None and len(self) + len(values) > self._maxlen:
+            raise Full('Tre stack is full')
+        if self._typecode is not None:
+            values = array(self._typecode, values).tolist()
+        data = self._data + values
+        k = self._segment_size
+        count = max(0, -(-(len(data) - self._budget) // k))  # segments to spill
+        mark = len(self._segments)
+        try:
+            for j in range(count):
+                self._write(data[j * k:(j + 1) * k])
+        except BaseException:
+            self._truncate(mark)       # take back the segments already written
+            raise
+        self._data = data[count * k:]
+
+    def top(self):
+        """
+        Returns the element at the top of the stack, without removing it.
+        Raises Empty exception if the stack is empty.
+        """
+        if not self._data:
+            if not self._segments:
+                raise Empty('The stack is empty')
+            self._load()
+        return self._data[-1]
+
+    def pop(self):
+        """
+        Removes and returns the element from the top of the stack.
+        Raises Empty exception if the stack is empty.
+        """
+        if not self._data:
+            if not self._segments:
+                raise Empty('The stack is empty')
+            self._load()
         return self._data.pop()
 
+    def pop_many(self, n):
+        """
+        Removes the top n elements and returns them in a list, top first.
+        Raises Empty exception, and removes nothing, if there are fewer than n.
+        """
+        if n > len(self):
+            raise Empty('The stack has fewer than {} elements'.format(n))
+        answer = []
+        while len(answer) < n:
+            if not self._data:
+                self._load()
+            take = min(n - len(answer), len(self._data))
+            answer.extend(self._data[:-take - 1:-1])
+            del self._data[-take:]
+        return answer
+
+    def peek_many(self, n):
+        """
+        Returns the top n elements in a list, top first, without removing them.
+        Segments on disk are read but not paged back in.
+        Raises Empty exception if the stack has fewer than n elements.
+        """
+        if n > len(self):
+            raise Empty('The stack has fewer than {} elements'.format(n))
+        if n <= 0:
+            return []
+        answer = self._data[:-n - 1:-1]
+        i = len(self._segments)
+        while len(answer) < n:
+            i -= 1
+            segment = self._read(i)
+            answer.extend(segment[:len(answer) - n - 1:-1])
+        return answer
+
+    def close(self):
+        """Discards the contents of the stack and deletes its temporary file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._data = []
+        self._segments = []
+        self._spilled = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _spill(self):
+        """Write the bottom segment of the in-memory part to the file end."""
+        k = self._segment_size
+        self._write(self._data[:k])
+        del self._data[:k]             # only once the segment is safely on disk
+
+    def _write(self, segment):
+        """Append segment to the file as the new last spilled segment."""
+        if self._typecode is not None:
+            payload = array(self._typecode, segment).tobytes()
+        else:
+            payload = pickle.dumps(segment, pickle.HIGHEST_PROTOCOL)
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self._dir)
+        offset = self._file.seek(0, 2)
+        try:
+            self._file.write(payload)
+        except BaseException:
+            self._file.seek(offset)    # drop a partial write
+            self._file.truncate()
+            raise
+        self._segments.append((offset, len(segment)))
+        self._spilled += len(segment)
+
+    def _read(self, i):
+        """Return the elements of spilled segment i, leaving it on disk."""
+        offset = self._segments[i][0]
+        if i + 1 < len(self._segments):
+            size = self._segments[i + 1][0] - offset
+        else:
+            size = -1                  # the last segment runs to the file end
+        self._file.seek(offset)
+        payload = self._file.read(size)
+        if self._typecode is not None:
+            return array(self._typecode, payload).tolist()
+        return pickle.loads(payload)
+
+    def _truncate(self, i):
+        """Cut spilled segments i onward off the file."""
+        if i < len(self._segments):
+            self._file.seek(self._segments[i][0])
+            self._file.truncate()
+            self._spilled -= sum(k for _, k in self._segments[i:])
+            del self._segments[i:]
+
+    def _load(self):
+        """Read the last spilled segment back in and cut it off the file."""
+        segment = self._read(len(self._segments) - 1)
+        self._truncate(len(self._segments) - 1)
+        self._data = segment
+
 
 class LinkedStack:
     """LIFO Stack implementation using a singly linked list for storage."""
@@ -60,10 +521,16 @@ class LinkedStack:
             self._element = element
             self._next = next
 
-    def __init__(self):
-        """Create an empty stack."""
+    def __init__(self, pool_size=0):
+        """Create an empty stack.
+
+        With a positive pool_size, up to that many popped nodes are kept and
+        reused by later pushes instead of allocating new ones.
+        """
         self._head = None
         self._size = 0
+        self._pool = NodePool(self._Node, pool_size) if pool_size > 0 else None
+        self._make_node = self._Node if self._pool is None else self._pool.acquire
 
     def __len__(self):
         """Return the number of elements in the stack."""
@@ -73,9 +540,13 @@ class LinkedStack:
         """Return True if the stack is empty."""
         return self._size == 0
 
+    def pool_stats(self):
+        """Return the node pool's counters, or None if pooling is off."""
+        return None if self._pool is None else self._pool.stats()
+
     def push(self, e):
         """Add element e to the top of the stack."""
-        self._head = self._Node(e, self._head)
+        self._head = self._make_node(e, self._head)
         self._size += 1
 
     def top(self):
@@ -94,7 +565,362 @@ class LinkedStack:
         """
         if self.is_empty():
             raise Empty('Stack is empty')
-        answer = self._head._element
-        self._head = self._head._next
+        old = self._head
+        answer = old._element
+        self._head = old._next
+        self._size -= 1
+        if self._pool is not None:
+            self._pool.release(old)
+        return answer
+
+
+class UnrolledLinkedStack:
+    """LIFO Stack implementation using a singly linked list of array chunks."""
+
+    DEFAULT_CHUNK_SIZE = 64
+
+    class _Chunk:
+        """Lightweight, nonpublic class for storing a block of elements."""
+        __slots__ = '_elements', '_next'  # streamline memory usage
+
+        def __init__(self, size, next):
+            self._elements = [None] * size
+            self._next = next
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Create an empty stack storing chunk_size elements per chunk."""
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be positive')
+        self._chunk_size = chunk_size
+        self._head = None    # chunk holding the top; never empty unless stack is
+        self._top = 0        # number of elements used in the head chunk
+        self._size = 0
+        self._spare = None   # last emptied chunk, kept to avoid thrashing
+
+    def __len__(self):
+        """Return the number of elements in the stack."""
+        return self._size
+
+    def is_empty(self):
+        """Return True if the stack is empty."""
+        return self._size == 0
+
+    def push(self, e):
+        """Add element e to the top of the stack."""
+        if self._top == self._chunk_size or self._head is None:
+            if self._spare is not None:
+                chunk, self._spare = self._spare, None
+                chunk._next = self._head
+            else:
+                chunk = self._Chunk(self._chunk_size, self._head)
+            self._head = chunk
+            self._top = 0
+        self._head._elements[self._top] = e
+        self._top += 1
+        self._size += 1
+
+    def top(self):
+        """Return (but do not remove) the element at the top of the stack.
+
+        Raise Empty exception if the stack is empty.
+        """
+        if self._size == 0:
+            raise Empty('Stack is empty')
+        return self._head._elements[self._top - 1]
+
+    def pop(self):
+        """Remove and return the element from the top of the stack (i.e., LIFO).
+
+        Raise Empty exception if the stack is empty.
+        """
+        if self._size == 0:
+            raise Empty('Stack is empty')
+        self._top -= 1
+        elements = self._head._elements
+        answer = elements[self._top]
+        elements[self._top] = None   # help garbage collection
         self._size -= 1
+        if self._top == 0:           # retire the emptied head chunk
+            chunk = self._head
+            self._head = chunk._next
+            chunk._next = None
+            self._spare = chunk
+            self._top = self._chunk_size if self._head is not None else 0
         return answer
+
+
+class PersistentStack:
+    """Immutable LIFO Stack whose versions share their singly linked tails.
+
+    push and pop leave the stack unchanged and return a new version in O(1),
+    so any version can be kept as a snapshot at no extra cost.
+    """
+    __slots__ = '_head', '_size'
+
+    _Node = LinkedStack._Node  # nodes are never modified once linked
+
+    def __init__(self):
+        """Create an empty stack."""
+        self._head = None
+        self._size = 0
+
+    @classmethod
+    def _make(cls, head, size):
+        """Return a version of the stack over an existing chain of nodes."""
+        version = cls.__new__(cls)
+        version._head = head
+        version._size = size
+        return version
+
+    def __len__(self):
+        """Return the number of elements in the stack."""
+        return self._size
+
+    def __iter__(self):
+        """Generate the elements of the stack from top to bottom."""
+        node = self._head
+        while node is not None:
+            yield node._element
+            node = node._next
+
+    def is_empty(self):
+        """Return True if the stack is empty."""
+        return self._size == 0
+
+    def push(self, e):
+        """Return a new version of the stack with element e on top."""
+        return self._make(self._Node(e, self._head), self._size + 1)
+
+    def top(self):
+        """Return the element at the top of the stack.
+
+        Raise Empty exception if the stack is empty.
+        """
+        if self.is_empty():
+            raise Empty('Stack is empty')
+        return self._head._element
+
+    def pop(self):
+        """Return a new version of the stack without its top element.
+
+        Raise Empty exception if the stack is empty.
+        """
+        if self.is_empty():
+            raise Empty('Stack is empty')
+        return self._make(self._head._next, self._size - 1)
+
+
+class ConcurrentStack:
+    """Thread-safe LIFO Stack implementation using a singly linked list.
+
+    Nodes are built outside the lock, which is held only while the head
+    pointer is swapped, so threads contend for a few bytecodes per operation.
+    """
+
+    _Node = LinkedStack._Node
+
+    def __init__(self):
+        """Create an empty stack."""
+        self._head = None
+        self._size = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def __len__(self):
+        """Return the number of elements in the stack."""
+        return self._size
+
+    def is_empty(self):
+        """Return True if the stack is empty."""
+        return self._size == 0
+
+    def push(self, e):
+        """Add element e to the top of the stack, waking one waiting pop."""
+        node = self._Node(e, None)
+        with self._lock:
+            node._next = self._head
+            self._head = node
+            self._size += 1
+            self._not_empty.notify()
+
+    def top(self):
+        """Return (but do not remove) the element at the top of the stack.
+
+        Raise Empty exception if the stack is empty.
+        """
+        head = self._head  # a single read, so no lock is needed
+        if head is None:
+            raise Empty('Stack is empty')
+        return head._element
+
+    def pop(self, timeout=0):
+        """Remove and return the element from the top of the stack (i.e., LIFO).
+
+        Wait up to timeout seconds for an element to arrive, or indefinitely if
+        timeout is None. Raise Empty exception if the stack is still empty.
+        """
+        with self._lock:
+            if self._head is None and timeout != 0:
+                self._not_empty.wait_for(lambda: self._head is not None, timeout)
+            if self._head is None:
+                raise Empty('Stack is empty')
+            return self._unlink()
+
+    def try_pop(self):
+        """Remove the top element if there is one, without ever raising Empty.
+
+        Return a (success, element) pair; element is None when success is False.
+        """
+        with self._lock:
+            if self._head is None:
+                return False, None
+            return True, self._unlink()
+
+    def _unlink(self):
+        """Remove and return the top element; the lock must be held."""
+        node = self._head
+        self._head = node._next
+        self._size -= 1
+        return node._element
+
+
+class SharedMemoryStack:
+    """Fixed-capacity stack of numbers kept in a shared memory block.
+
+    The block starts with a small header (magic, typecode, capacity and
+    element count), followed by the elements, so any process that attaches
+    to the block by name sees the same stack without pickling the elements.
+    Every operation holds a multiprocessing lock, which must be the same lock
+    object in each process; the stack pickles as its name plus that lock, so
+    handing it to a multiprocessing.Process arranges this.
+    """
+
+    _HEADER = struct.Struct('<4sc3xQQ')  # magic, typecode, capacity, count
+    _MAGIC = b'PDSS'
+
+    def __init__(self, capacity=None, typecode=None, name=None, lock=None):
+        """Create a stack for capacity elements, or attach to the named one.
+
+        A new stack holds integers ('q') unless typecode says otherwise, e.g.
+        'B' for bytes. When attaching, typecode defaults to (and must match)
+        the one recorded in the header.
+        """
+        self._lock = multiprocessing.Lock() if lock is None else lock
+        self._items = None
+        if capacity is not None:
+            typecode = 'q' if typecode is None else typecode
+            itemsize = array(typecode).itemsize
+            self._shm = shared_memory.SharedMemory(
+                name=name, create=True,
+                size=self._HEADER.size + max(1, capacity) * itemsize)
+            self._capacity = capacity
+        else:
+            if name is None:
+                raise ValueError('A capacity is required to create a new stack')
+            self._shm = shared_memory.SharedMemory(name=name)
+            magic, stored, self._capacity, _ = self._HEADER.unpack_from(self._shm.buf)
+            stored = stored.decode('ascii')
+            if magic != self._MAGIC or typecode not in (None, stored):
+                self._shm.close()
+                raise ValueError('Not a matching shared stack: ' + repr(name))
+            typecode = stored
+        self._typecode = typecode
+        start = self._HEADER.size
+        stop = start + self._capacity * array(typecode).itemsize
+        self._items = self._shm.buf[start:stop].cast(typecode)
+        if capacity is not None:
+            self._set_count(0)
+
+    @property
+    def name(self):
+        """The name other processes use to attach to the stack."""
+        return self._shm.name
+
+    def __reduce__(self):
+        return type(self), (None, self._typecode, self.name, self._lock)
+
+    def __len__(self):
+        """Return the number of elements in the stack."""
+        with self._lock:
+            return self._count()
+
+    def is_empty(self):
+        """Return True if the stack is empty."""
+        return len(self) == 0
+
+    def is_full(self):
+        """Return True if the stack is full."""
+        return len(self) == self._capacity
+
+    def push(self, e):
+        """Add element e to the top of the stack.
+
+        Raise Full exception if the stack is full.
+        """
+        with self._lock:
+            n = self._count()
+            if n == self._capacity:
+                raise Full('Stack is full')
+            self._items[n] = e
+            self._set_count(n + 1)
+
+    def top(self):
+        """Return (but do not remove) the element at the top of the stack.
+
+        Raise Empty exception if the stack is empty.
+        """
+        with self._lock:
+            n = self._count()
+            if n == 0:
+                raise Empty('Stack is empty')
+            return self._items[n - 1]
+
+    def pop(self):
+        """Remove and return the element from the top of the stack (i.e., LIFO).
+
+        Raise Empty exception if the stack is empty.
+        """
+        with self._lock:
+            n = self._count()
+            if n == 0:
+                raise Empty('Stack is empty')
+            self._set_count(n - 1)
+            return self._items[n - 1]
+
+    def try_pop(self):
+        """Remove the top element if there is one, without ever raising Empty.
+
+        Return a (success, element) pair; element is None when success is False.
+        """
+        with self._lock:
+            n = self._count()
+            if n == 0:
+                return False, None
+            self._set_count(n - 1)
+            return True, self._items[n - 1]
+
+    def close(self):
+        """Detach this process from the shared memory block."""
+        if self._items is not None:
+            self._items.release()
+            self._items = None
+            self._shm.close()
+
+    def unlink(self):
+        """Destroy the shared memory block once every process has closed it."""
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _count(self):
+        """Return the element count recorded in the header."""
+        return self._HEADER.unpack_from(self._shm.buf)[3]
+
+    def _set_count(self, n):
+        """Record n as the element count in the header."""
+        self._HEADER.pack_into(self._shm.buf, 0, self._MAGIC,
+                               self._typecode.encode('ascii'), self._capacity, n)
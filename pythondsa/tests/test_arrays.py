@@ -1,6 +1,26 @@
+import os
+import struct
+import sys
+import tempfile
 import unittest
+from array import array
 from pythondsa.src.exceptions import Empty
-from pythondsa.src.arrays import DynamicArray
+from pythondsa.src.arrays import DynamicArray, MappedDynamicArray, GapBuffer, TieredVector
+from pythondsa.src.arrays import FenwickTree
+from pythondsa.src.arrays import overallocate
+
+
+def filled(elements, *args, factory=DynamicArray):
+    """Return a new factory(*args) holding elements, appended one at a time."""
+    seq = factory(*args)
+    for e in elements:
+        seq.append(e)
+    return seq
+
+
+def elements(seq):
+    """Return the elements of seq, read by index, in a list."""
+    return [seq[k] for k in range(len(seq))]
 
 
 class TestDynamicArrayMethods(unittest.TestCase):
@@ -123,6 +143,31 @@ class TestDynamicArrayMethods(unittest.TestCase):
 
         self.assertEqual(da._A[0:5], expected_elements)
 
+    def test_insert_with_resize_shifts_items_rightward_at_middle_index(self):
+        da = DynamicArray()
+        da._n = 4
+        da._capacity = 4
+        da._A = da._make_array(da._capacity)
+        da._A[0:4] = ['foo', 'bar', 'baz', 'qux']
+        expected_elements = ['foo', 'bar', 'spam', 'baz', 'qux']
+
+        da.insert(2, 'spam')
+
+        self.assertEqual(da._A[0:5], expected_elements)
+        self.assertEqual(da._capacity, 8)
+
+    def test_insert_adds_at_end_of_array_with_index_equal_to_length(self):
+        da = DynamicArray()
+        da._n = 2
+        da._capacity = 4
+        da._A = da._make_array(da._capacity)
+        da._A[0:2] = ['foo', 'bar']
+
+        da.insert(2, 'spam')
+
+        self.assertEqual(da._A[0:3], ['foo', 'bar', 'spam'])
+        self.assertEqual(da._n, 3)
+
     def test_remove_raises_ValueError_with_value_missing_in_array(self):
         da = DynamicArray()
         da._n = 2
@@ -145,6 +190,18 @@ class TestDynamicArrayMethods(unittest.TestCase):
         self.assertEqual(da._A[0:4], expected_elements)
         self.assertEqual(da._n, 4)
 
+    def test_remove_clears_vacated_slot_at_end_of_array(self):
+        da = DynamicArray()
+        da._n = 3
+        da._capacity = 4
+        da._A = da._make_array(da._capacity)
+        da._A[0:3] = ['foo', 'bar', 'baz']
+
+        da.remove('foo')
+
+        self.assertEqual(da._A[0:3], ['bar', 'baz', None])
+        self.assertEqual(da._n, 2)
+
     def test_remove_halves_array_capacity_if_less_than_quarter_of_capacity_used(self):
         da = DynamicArray()
         da._capacity = 64
@@ -198,3 +255,732 @@ class TestDynamicArrayMethods(unittest.TestCase):
         da.pop()
 
         self.assertEqual(da._capacity, 32)
+
+
+class TestDynamicArrayBulkMethods(unittest.TestCase):
+
+    def test_extend_resizes_array_once(self):
+        da = DynamicArray()
+        da.append('foo')
+
+        da.extend(iter(['bar', 'baz', 'spam', 'eggs']))
+
+        self.assertEqual(elements(da), ['foo', 'bar', 'baz', 'spam', 'eggs'])
+        self.assertEqual(da.stats()['resizes'], 1)
+
+    def test_getitem_with_slice_returns_new_array(self):
+        da = filled([1, 2, 3, 4, 5], 'q')
+
+        result = da[1:4]
+        reversed_result = da[::-2]
+
+        self.assertIsInstance(result, DynamicArray)
+        self.assertEqual(result._typecode, 'q')
+        self.assertEqual(elements(result), [2, 3, 4])
+        self.assertEqual(elements(reversed_result), [5, 3, 1])
+        self.assertEqual(len(DynamicArray()[::-1]), 0)
+
+    def test_setitem_replaces_element_at_index(self):
+        da = filled(['foo', 'bar', 'baz'])
+
+        da[-1] = 'spam'
+        da[0] = 'eggs'
+
+        self.assertEqual(elements(da), ['eggs', 'bar', 'spam'])
+        self.assertRaises(IndexError, da.__setitem__, 3, 'ham')
+
+    def test_setitem_with_slice_shifts_tail_once(self):
+        da = filled([1, 2, 3, 4, 5])
+
+        da[1:3] = ['foo', 'bar', 'baz', 'spam']
+
+        self.assertEqual(elements(da), [1, 'foo', 'bar', 'baz', 'spam', 4, 5])
+
+        da[1:5] = []
+
+        self.assertEqual(elements(da), [1, 4, 5])
+        self.assertEqual(da._A[3:], [None] * (da._capacity - 3))
+
+    def test_setitem_with_slice_rejects_mistyped_values_without_moving_tail(self):
+        da = filled([1, 2, 3, 4, 5, 6], 'i')
+
+        self.assertRaises(TypeError, da.__setitem__, slice(1, 2), [7, 1.5, 8])
+        self.assertRaises(TypeError, da.__setitem__, slice(1, 4), ['x'])
+        self.assertRaises(TypeError, da.__setitem__, slice(None, None, 2), [7, 8, 'x'])
+
+        self.assertEqual(elements(da), [1, 2, 3, 4, 5, 6])
+
+    def test_setitem_with_extended_slice_requires_same_length(self):
+        da = filled([1, 2, 3, 4, 5], 'i')
+
+        da[::2] = [10, 30, 50]
+
+        self.assertEqual(elements(da), [10, 2, 30, 4, 50])
+        self.assertRaises(ValueError, da.__setitem__, slice(None, None, 2), [1])
+
+    def test_delitem_removes_element_at_index(self):
+        da = filled(['foo', 'bar', 'baz'])
+
+        del da[-2]
+
+        self.assertEqual(elements(da), ['foo', 'baz'])
+        self.assertRaises(IndexError, da.__delitem__, 2)
+
+    def test_delitem_with_slice_removes_elements_and_shrinks(self):
+        da = filled(range(16))
+
+        del da[2:15]
+
+        self.assertEqual(elements(da), [0, 1, 15])
+        self.assertEqual(da._capacity, 8)
+
+        da = filled(range(10), 'd')
+
+        del da[::-3]
+
+        self.assertEqual(elements(da), [1, 2, 4, 5, 7, 8])
+
+    def test_remove_all_filters_in_place_and_returns_count(self):
+        da = filled([1, 2, 3, 4, 5, 6])
+
+        result = da.remove_all(lambda e: e % 2 == 0)
+
+        self.assertEqual(result, 3)
+        self.assertEqual(elements(da), [1, 3, 5])
+        self.assertEqual(da._A[3:], [None] * (da._capacity - 3))
+
+    def test_remove_all_keeps_unjudged_elements_if_predicate_raises(self):
+        da = filled([1, 2, 3, 'x', 5])
+
+        self.assertRaises(TypeError, da.remove_all, lambda e: e % 2 == 0)
+
+        self.assertEqual(elements(da), [1, 3, 'x', 5])
+        self.assertEqual(da._A[4:], [None] * (da._capacity - 4))
+
+    def test_compact_removes_None_elements(self):
+        da = filled(['foo', None, 'bar', None, None])
+
+        result = da.compact()
+
+        self.assertEqual(result, 3)
+        self.assertEqual(elements(da), ['foo', 'bar'])
+
+
+class TestDynamicArraySortMethods(unittest.TestCase):
+
+    def test_sort_orders_object_array_in_place(self):
+        da = filled(['foo', 'bar', 'baz', 'spam'])
+        da.append('eggs')  # leaves vacant slots after the elements
+        low_level_array = da._A
+
+        da.sort()
+
+        self.assertIs(da._A, low_level_array)
+        self.assertEqual(elements(da), ['bar', 'baz', 'eggs', 'foo', 'spam'])
+        self.assertEqual(len(da._A), da._capacity)
+
+    def test_sort_accepts_key_and_reverse(self):
+        da = filled(['bb', 'a', 'ccc'])
+
+        da.sort(key=len, reverse=True)
+
+        self.assertEqual(elements(da), ['ccc', 'bb', 'a'])
+
+        da = filled([3, -1, 2], 'i')
+
+        da.sort(key=abs)
+
+        self.assertEqual(elements(da), [-1, 2, 3])
+
+    def test_sort_orders_signed_and_unsigned_integers_by_radix(self):
+        signed = [5, -3, 0, 2 ** 62, -2 ** 63, 7, -3]
+        unsigned = [2 ** 64 - 1, 0, 2 ** 63, 12, 1]
+
+        for typecode, values in [('q', signed), ('Q', unsigned), ('b', [3, -128, 127, 0])]:
+            da = filled(values, typecode)
+
+            da.sort()
+
+            self.assertEqual(elements(da), sorted(values))
+
+    def test_sort_orders_floats_by_radix(self):
+        values = [2.5, -1.0, float('inf'), 0.0, -float('inf'), -2.75, 1e-300]
+        da = filled(values, 'd')
+
+        da.sort()
+
+        self.assertEqual(elements(da), sorted(values))
+
+        da.sort(reverse=True)
+
+        self.assertEqual(elements(da), sorted(values, reverse=True))
+
+    def test_sort_leaves_low_level_array_in_place_for_typed_array(self):
+        da = filled(range(1000, 0, -1), 'l')
+        low_level_array = da._A
+
+        da.sort()
+
+        self.assertIs(da._A, low_level_array)
+        self.assertEqual(elements(da), list(range(1, 1001)))
+
+    def test_bisect_left_and_right_search_live_elements(self):
+        da = filled([1, 2, 2, 2, 5], 'q')
+        da.append(9)
+
+        self.assertEqual(da.bisect_left(2), 1)
+        self.assertEqual(da.bisect_right(2), 4)
+        self.assertEqual(da.bisect_left(10), 6)
+        self.assertEqual(da.bisect_right(0), 0)
+        self.assertEqual(da.bisect_left(2, lo=2), 2)
+        self.assertEqual(da.bisect_right(9, hi=5), 5)
+
+
+class TestDynamicArrayGrowthPolicies(unittest.TestCase):
+
+    def capacities(self, da, n):
+        result = []
+        for value in range(n):
+            da.append(value)
+            if da._capacity not in result:
+                result.append(da._capacity)
+        return result
+
+    def test_constructor_raises_ValueError_with_invalid_policy(self):
+        self.assertRaises(ValueError, DynamicArray, growth=1)
+        self.assertRaises(ValueError, DynamicArray, shrink_threshold=1)
+
+    def test_growth_factor_sets_capacity_sequence(self):
+        self.assertEqual(self.capacities(DynamicArray(), 9), [1, 2, 4, 8, 16])
+        self.assertEqual(self.capacities(DynamicArray(growth=1.5), 9), [1, 2, 3, 4, 6, 9])
+
+    def test_growth_callable_receives_capacity_and_minimum(self):
+        calls = []
+
+        def policy(capacity, minimum):
+            calls.append((capacity, minimum))
+            return capacity + 10
+
+        da = DynamicArray(growth=policy)
+        self.capacities(da, 12)
+
+        self.assertEqual(calls, [(1, 2), (11, 12)])
+        self.assertEqual(da._capacity, 21)
+
+    def test_overallocate_mimics_list_growth(self):
+        self.assertEqual(overallocate(0, 1), 4)
+        self.assertEqual(overallocate(4, 5), 8)
+        self.assertEqual(overallocate(8, 9), 16)
+        self.assertEqual(self.capacities(DynamicArray(growth=overallocate), 17),
+                         [1, 8, 16, 24])
+
+    def test_shrink_threshold_sets_hysteresis(self):
+        da = DynamicArray(shrink_threshold=8)
+        self.capacities(da, 64)
+
+        while len(da) > 8:
+            da.pop()
+
+        self.assertEqual(da._capacity, 64)
+
+        da.pop()
+
+        self.assertEqual(da._capacity, 32)
+
+    def test_shrink_threshold_None_never_shrinks(self):
+        da = DynamicArray(shrink_threshold=None)
+        self.capacities(da, 64)
+
+        while len(da) > 0:
+            da.pop()
+
+        self.assertEqual(da._capacity, 64)
+
+    def test_reserve_grows_capacity_once(self):
+        da = DynamicArray()
+        da.reserve(100)
+
+        self.capacities(da, 100)
+
+        self.assertEqual(da._capacity, 100)
+        self.assertEqual(da.stats()['resizes'], 1)
+
+    def test_shrink_to_fit_reduces_capacity_to_length(self):
+        da = DynamicArray()
+        self.capacities(da, 5)
+
+        da.shrink_to_fit()
+
+        self.assertEqual(da._capacity, 5)
+        self.assertEqual([da[k] for k in range(5)], [0, 1, 2, 3, 4])
+
+    def test_stats_counts_resizes_bytes_copied_and_peak_capacity(self):
+        da = DynamicArray(typecode='d')
+        self.capacities(da, 5)
+        while len(da) > 1:
+            da.pop()
+
+        result = da.stats()
+
+        #  grows 1 -> 2 -> 4 -> 8 copying 1 + 2 + 4 elements,
+        #  then shrinks 8 -> 4 copying 1 element:
+        self.assertEqual(result['resizes'], 4)
+        self.assertEqual(result['bytes_copied'], 8 * 8)
+        self.assertEqual(result['peak_capacity'], 8)
+        self.assertEqual(result['capacity'], 4)
+        self.assertEqual(result['length'], 1)
+
+
+class TestTypedDynamicArrayMethods(unittest.TestCase):
+
+    def test_constructor_raises_ValueError_with_unsupported_typecode(self):
+        self.assertRaises(ValueError, DynamicArray, 'u')
+        self.assertRaises(ValueError, DynamicArray, 'dd')
+
+    def test_make_array_returns_compact_array_of_typecode(self):
+        da = DynamicArray(typecode='d')
+
+        result = da._make_array(4)
+
+        self.assertEqual(result.typecode, 'd')
+        self.assertEqual(result.tolist(), [0.0] * 4)
+
+    def test_typed_array_supports_append_insert_remove_and_pop(self):
+        da = DynamicArray(typecode='q')
+        for value in [10, 20, 30, 40, 50]:
+            da.append(value)
+
+        da.insert(1, 15)
+        da.remove(30)
+        result = da.pop()
+
+        self.assertEqual(result, 50)
+        self.assertEqual([da[k] for k in range(len(da))], [10, 15, 20, 40])
+        self.assertEqual(da[-1], 40)
+        self.assertEqual(da._A.typecode, 'q')
+
+    def test_typed_array_rejects_values_not_matching_typecode(self):
+        da = DynamicArray(typecode='q')
+
+        self.assertRaises(TypeError, da.append, 'foo')
+        self.assertEqual(len(da), 0)
+
+    def test_insert_rejects_mistyped_value_without_moving_elements(self):
+        spare = DynamicArray(typecode='i')
+        spare.extend([1, 2, 3, 4, 5])
+        spare.append(6)
+        spare.pop()
+        full = DynamicArray(typecode='i')
+        full.extend([1, 2, 3])
+
+        self.assertRaises(TypeError, spare.insert, 1, 2.5)
+        self.assertRaises(TypeError, full.insert, 1, 2.5)
+        self.assertEqual(list(spare), [1, 2, 3, 4, 5])
+        self.assertEqual(list(full), [1, 2, 3])
+
+    def test_typed_array_halves_capacity_if_less_than_quarter_used(self):
+        da = DynamicArray(typecode='d')
+        for value in range(17):
+            da.append(value)
+
+        for _ in range(13):
+            da.pop()
+
+        self.assertEqual(da._capacity, 16)
+        self.assertEqual([da[k] for k in range(len(da))], [0.0, 1.0, 2.0, 3.0])
+
+
+class TestDynamicArrayBufferMethods(unittest.TestCase):
+
+    def test_view_raises_TypeError_for_object_array(self):
+        da = DynamicArray()
+
+        self.assertRaises(TypeError, da.view)
+
+    def test_view_shares_memory_of_live_elements(self):
+        da = DynamicArray(typecode='d')
+        for value in [1.0, 2.0, 3.0]:
+            da.append(value)
+
+        view = da.view()
+        view[0] = 9.0
+
+        self.assertEqual(view.tolist(), [9.0, 2.0, 3.0])
+        self.assertEqual(da[0], 9.0)
+
+    def test_insert_and_remove_keep_working_while_view_is_exported(self):
+        da = DynamicArray(typecode='q')
+        for value in [1, 2, 3]:
+            da.append(value)
+        view = da.view()
+
+        da.insert(0, 0)
+        da.remove(2)
+
+        self.assertEqual(da.view().tolist(), [0, 1, 3])
+        view.release()
+
+    def test_array_interface_describes_live_elements(self):
+        da = DynamicArray(typecode='i')
+        for value in [1, 2, 3]:
+            da.append(value)
+        order = '<' if sys.byteorder == 'little' else '>'
+
+        result = da.__array_interface__
+
+        self.assertEqual(result['version'], 3)
+        self.assertEqual(result['shape'], (3,))
+        self.assertEqual(result['typestr'], order + 'i4')
+        self.assertEqual(bytes(result['data']), array('i', [1, 2, 3]).tobytes())
+
+    def test_array_interface_missing_for_object_array(self):
+        da = DynamicArray()
+
+        self.assertFalse(hasattr(da, '__array_interface__'))
+
+    def test_from_buffer_uses_buffer_format_as_typecode(self):
+        source = array('d', [1.5, 2.5, 3.5])
+
+        da = DynamicArray.from_buffer(source)
+
+        self.assertEqual(da._typecode, 'd')
+        self.assertEqual(len(da), 3)
+        self.assertEqual(da.view().tolist(), [1.5, 2.5, 3.5])
+
+    def test_extend_from_buffer_appends_raw_bytes_after_live_elements(self):
+        da = DynamicArray(typecode='d')
+        da.append(1.0)
+
+        da.extend_from_buffer(struct.pack('=3d', 2.0, 3.0, 4.0))
+
+        self.assertEqual(da.view().tolist(), [1.0, 2.0, 3.0, 4.0])
+        self.assertGreaterEqual(da._capacity, 4)
+
+    def test_extend_from_buffer_raises_with_incompatible_buffer(self):
+        da = DynamicArray(typecode='d')
+
+        self.assertRaises(TypeError, da.extend_from_buffer, array('q', [1]))
+        self.assertRaises(ValueError, da.extend_from_buffer, b'abc')
+        self.assertRaises(TypeError, DynamicArray().extend_from_buffer, b'abc')
+
+    def test_extend_from_buffer_treats_signed_bytes_as_elements(self):
+        signed = array('b', [1, -1, 5, 0])
+        da = DynamicArray(typecode='b')
+
+        da.extend_from_buffer(signed)
+
+        self.assertEqual(list(da), [1, -1, 5, 0])
+        self.assertRaises(TypeError, DynamicArray('h').extend_from_buffer, signed)
+
+
+class TestDynamicArrayRangeSumMethods(unittest.TestCase):
+
+    def test_range_sum_without_index_scans(self):
+        da = filled(range(10))
+        self.assertEqual(da.range_sum(2, 5), 9)
+        self.assertEqual(da.range_sum(4, 4), 0)
+
+    def test_range_sum_invalid_range_raises_error(self):
+        da = filled(range(5))
+        da.build_prefix_index()
+        with self.assertRaises(IndexError):
+            da.range_sum(3, 2)
+        with self.assertRaises(IndexError):
+            da.range_sum(0, 6)
+
+    def test_range_sum_follows_append_and_pop(self):
+        da = filled(range(10), 'q')
+        da.build_prefix_index()
+        da.append(100)
+        self.assertEqual(da.range_sum(8, 11), 117)
+        da.pop()
+        da.pop()
+        self.assertEqual(da.range_sum(0, 9), 36)
+        self.assertFalse(da._prefix_stale)
+
+    def test_range_sum_follows_item_assignment(self):
+        da = filled(range(10))
+        da.build_prefix_index()
+        da[3] = 10
+        da[-1] = 0
+        self.assertEqual(da.range_sum(0, 10), 43)
+        self.assertFalse(da._prefix_stale)
+
+    def test_range_sum_rebuilds_after_middle_edits(self):
+        da = filled(range(10))
+        da.build_prefix_index()
+        da.insert(5, 100)
+        self.assertTrue(da._prefix_stale)
+        self.assertEqual(da.range_sum(4, 7), 109)
+        da.remove(100)
+        del da[0:2]
+        self.assertEqual(da.range_sum(0, 8), 44)
+        self.assertFalse(da._prefix_stale)
+
+    def test_drop_prefix_index_falls_back_to_scan(self):
+        da = filled(range(10))
+        da.build_prefix_index()
+        da.drop_prefix_index()
+        da.append(10)
+        self.assertIsNone(da._prefix)
+        self.assertEqual(da.range_sum(0, 11), 55)
+
+
+class TestFenwickTreeMethods(unittest.TestCase):
+
+    def test_init_builds_prefix_sums(self):
+        ft = FenwickTree([3, 1, 4, 1, 5, 9, 2, 6])
+        self.assertEqual(len(ft), 8)
+        self.assertEqual([ft.prefix_sum(k) for k in range(9)],
+                         [0, 3, 4, 8, 9, 14, 23, 25, 31])
+
+    def test_add_updates_range_sums(self):
+        ft = FenwickTree([1] * 10)
+        ft.add(4, 5)
+        self.assertEqual(ft.range_sum(0, 4), 4)
+        self.assertEqual(ft.range_sum(4, 5), 6)
+        self.assertEqual(ft.range_sum(0, 10), 15)
+
+    def test_append_matches_built_tree(self):
+        ft = FenwickTree()
+        for value in range(1, 20):
+            ft.append(value)
+        self.assertEqual(ft._tree, FenwickTree(range(1, 20))._tree)
+
+    def test_pop_removes_last_value(self):
+        ft = FenwickTree(range(10))
+        ft.pop()
+        self.assertEqual(len(ft), 9)
+        self.assertEqual(ft.prefix_sum(9), 36)
+
+
+class TestMappedDynamicArrayMethods(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'array.bin')
+
+    def test_constructor_requires_typecode_for_new_file(self):
+        self.assertRaises(ValueError, MappedDynamicArray, self.path)
+
+    def test_append_grows_file_with_capacity(self):
+        with MappedDynamicArray(self.path, 'q') as da:
+            for value in range(5):
+                da.append(value)
+
+            self.assertEqual(da._capacity, 8)
+            self.assertEqual(os.path.getsize(self.path), 16 + 8 * 8)
+
+    def test_reopening_file_recovers_elements(self):
+        with MappedDynamicArray(self.path, 'd') as da:
+            for value in [1.0, 2.0, 3.0, 4.0]:
+                da.append(value)
+            da.insert(1, 1.5)
+            da.remove(3.0)
+
+        with MappedDynamicArray(self.path) as da:
+            self.assertEqual(da._typecode, 'd')
+            self.assertEqual(da.view().tolist(), [1.0, 1.5, 2.0, 4.0])
+            self.assertEqual(da[-1], 4.0)
+
+    def test_constructor_raises_ValueError_with_mismatching_file(self):
+        with MappedDynamicArray(self.path, 'q'):
+            pass
+
+        self.assertRaises(ValueError, MappedDynamicArray, self.path, 'd')
+
+        with open(self.path, 'wb') as f:
+            f.write(b'not an array file')
+
+        self.assertRaises(ValueError, MappedDynamicArray, self.path)
+
+    def test_pop_shrinks_file_with_capacity(self):
+        with MappedDynamicArray(self.path, 'i') as da:
+            for value in range(17):
+                da.append(value)
+
+            for _ in range(13):
+                da.pop()
+
+            self.assertEqual(da._capacity, 16)
+            self.assertEqual(os.path.getsize(self.path), 16 + 16 * 4)
+            self.assertEqual(da.view().tolist(), [0, 1, 2, 3])
+
+    def test_resize_raises_BufferError_while_view_is_exported(self):
+        with MappedDynamicArray(self.path, 'q') as da:
+            da.append(1)
+            view = da.view()
+
+            self.assertRaises(BufferError, da.append, 2)
+
+            view.release()
+            da.append(2)
+            self.assertEqual(da.view().tolist(), [1, 2])
+
+    def test_close_raises_BufferError_and_stays_open_while_view_is_exported(self):
+        da = MappedDynamicArray(self.path, 'q')
+        da.append(1)
+        view = da.view()
+
+        self.assertRaises(BufferError, da.close)
+
+        view.release()
+        da.append(2)
+        self.assertEqual(da.view().tolist(), [1, 2])
+        da.close()
+        with MappedDynamicArray(self.path) as reopened:
+            self.assertEqual(reopened.view().tolist(), [1, 2])
+
+
+class TestGapBufferMethods(unittest.TestCase):
+
+    def test_insert_moves_gap_to_index_after_inserted_element(self):
+        gb = GapBuffer()
+        for value in ['foo', 'bar', 'baz']:
+            gb.append(value)
+
+        gb.insert(1, 'spam')
+
+        self.assertEqual(list(gb), ['foo', 'spam', 'bar', 'baz'])
+        self.assertEqual(gb._gap_start, 2)
+        self.assertEqual(gb._A[gb._gap_end:], ['bar', 'baz'])
+
+    def test_insert_raises_IndexError_with_invalid_index(self):
+        gb = GapBuffer()
+
+        self.assertRaises(IndexError, gb.insert, 1, 'foo')
+        self.assertRaises(IndexError, gb.insert, -1, 'foo')
+
+    def test_getitem_returns_correct_element_around_the_gap(self):
+        gb = GapBuffer()
+        for value in ['foo', 'bar', 'baz', 'qux']:
+            gb.append(value)
+        gb.insert(2, 'spam')
+
+        self.assertEqual([gb[k] for k in range(len(gb))],
+                         ['foo', 'bar', 'spam', 'baz', 'qux'])
+        self.assertEqual(gb[-1], 'qux')
+        self.assertEqual(gb[-5], 'foo')
+        self.assertRaises(IndexError, gb.__getitem__, 5)
+        self.assertRaises(IndexError, gb.__getitem__, -6)
+
+    def test_setitem_replaces_element_at_index(self):
+        gb = GapBuffer()
+        for value in ['foo', 'bar', 'baz']:
+            gb.append(value)
+        gb.insert(1, 'spam')
+
+        gb[2] = 'eggs'
+
+        self.assertEqual(list(gb), ['foo', 'spam', 'eggs', 'baz'])
+
+    def test_delitem_removes_element_and_clears_vacated_slot(self):
+        gb = GapBuffer()
+        for value in ['foo', 'bar', 'baz', 'qux']:
+            gb.append(value)
+
+        del gb[1]
+
+        self.assertEqual(list(gb), ['foo', 'baz', 'qux'])
+        self.assertTrue(all(e is None for e in gb._A[gb._gap_start:gb._gap_end]))
+
+    def test_remove_removes_first_occurence_on_either_side_of_gap(self):
+        gb = GapBuffer()
+        for value in ['foo', 'bar', 'spam', 'baz', 'spam']:
+            gb.append(value)
+        gb.insert(1, 'eggs')
+
+        gb.remove('spam')
+
+        self.assertEqual(list(gb), ['foo', 'eggs', 'bar', 'baz', 'spam'])
+        self.assertRaises(ValueError, gb.remove, 'ham')
+
+    def test_pop_removes_and_returns_last_element_and_shrinks(self):
+        gb = GapBuffer()
+        for value in range(17):
+            gb.append(value)
+
+        results = [gb.pop() for _ in range(13)]
+
+        self.assertEqual(results, list(range(16, 3, -1)))
+        self.assertEqual(list(gb), [0, 1, 2, 3])
+        self.assertEqual(gb._capacity, 16)
+        self.assertRaises(Empty, GapBuffer().pop)
+
+
+class TestTieredVectorMethods(unittest.TestCase):
+
+    def test_append_fills_blocks_in_order(self):
+        tv = filled(range(40), factory=TieredVector)
+
+        self.assertEqual(len(tv), 40)
+        self.assertEqual(len(tv._blocks), 3)
+        self.assertEqual(list(tv), list(range(40)))
+
+    def test_getitem_supports_negative_index_and_raises_IndexError(self):
+        tv = filled(range(40), factory=TieredVector)
+
+        self.assertEqual(tv[17], 17)
+        self.assertEqual(tv[-1], 39)
+        self.assertEqual(tv[-40], 0)
+        self.assertRaises(IndexError, tv.__getitem__, 40)
+        self.assertRaises(IndexError, tv.__getitem__, -41)
+
+    def test_insert_shifts_later_elements_across_blocks(self):
+        tv = filled(range(40), factory=TieredVector)
+        expected = list(range(40))
+
+        tv.insert(5, 'foo')
+        expected.insert(5, 'foo')
+
+        self.assertEqual(list(tv), expected)
+        self.assertEqual(tv[16], 15)
+        #  later blocks absorbed one element by rotating their offset:
+        self.assertEqual(tv._offsets[1:], [15, 15])
+
+    def test_insert_raises_IndexError_with_invalid_index(self):
+        tv = filled(range(3), factory=TieredVector)
+
+        self.assertRaises(IndexError, tv.insert, 4, 'foo')
+
+    def test_delitem_shifts_later_elements_and_drops_empty_block(self):
+        tv = filled(range(33), factory=TieredVector)
+        expected = list(range(33))
+
+        del tv[3]
+        del expected[3]
+
+        self.assertEqual(list(tv), expected)
+        self.assertEqual(len(tv._blocks), 2)
+        self.assertEqual(tv[-1], 32)
+
+    def test_setitem_replaces_element_at_index(self):
+        tv = filled(range(20), factory=TieredVector)
+
+        tv[-3] = 'foo'
+
+        self.assertEqual(tv[17], 'foo')
+
+    def test_block_size_grows_and_shrinks_with_length(self):
+        tv = filled(range(600), factory=TieredVector)
+
+        self.assertEqual(tv._b, 32)
+        self.assertEqual(list(tv), list(range(600)))
+
+        while len(tv) > 100:
+            tv.pop()
+
+        self.assertEqual(tv._b, 16)
+        self.assertEqual(list(tv), list(range(100)))
+
+    def test_remove_and_pop(self):
+        tv = filled(range(5), factory=TieredVector)
+
+        tv.remove(2)
+        result = tv.pop()
+
+        self.assertEqual(result, 4)
+        self.assertEqual(list(tv), [0, 1, 3])
+        self.assertRaises(ValueError, tv.remove, 'foo')
+        self.assertRaises(Empty, TieredVector().pop)
@@ -0,0 +1,172 @@
+import unittest
+from pythondsa.src.caches import LRUCache, LFUCache, TTLCache
+from pythondsa.src.maps import ProbeHashMap
+
+
+class TestLRUCacheMethods(unittest.TestCase):
+
+    def test_init_raises_ValueError_with_invalid_limits(self):
+        self.assertRaises(ValueError, LRUCache, 0)
+        self.assertRaises(ValueError, LRUCache, 10, 0)
+
+    def test_get_returns_cached_value_or_default(self):
+        c = LRUCache(2)
+        c.put('foo', 1)
+
+        self.assertEqual(c.get('foo'), 1)
+        self.assertIsNone(c.get('bar'))
+        self.assertEqual(c.get('bar', 0), 0)
+        self.assertEqual(c.stats()['hits'], 1)
+        self.assertEqual(c.stats()['misses'], 2)
+
+    def test_put_evicts_least_recently_used_entry(self):
+        c = LRUCache(2)
+        c.put('foo', 1)
+        c.put('bar', 2)
+        c.get('foo')
+
+        c.put('baz', 3)
+
+        self.assertIn('foo', c)
+        self.assertNotIn('bar', c)
+        self.assertEqual(len(c), 2)
+        self.assertEqual(c.stats()['evictions'], 1)
+
+    def test_put_replaces_value_and_refreshes_entry(self):
+        c = LRUCache(2)
+        c.put('foo', 1)
+        c.put('bar', 2)
+
+        c.put('foo', 10)
+        c.put('baz', 3)
+
+        self.assertEqual(c.get('foo'), 10)
+        self.assertNotIn('bar', c)
+
+    def test_put_evicts_to_stay_within_maxweight(self):
+        c = LRUCache(None, maxweight=10, weigher=len)
+        c.put('a', 'xxxx')
+        c.put('b', 'xxxx')
+
+        c.put('c', 'xxx')
+
+        self.assertNotIn('a', c)
+        self.assertEqual(c.stats()['weight'], 7)
+        self.assertRaises(ValueError, c.put, 'd', 'x' * 11)
+
+    def test_pop_removes_entry(self):
+        c = LRUCache(2)
+        c.put('foo', 1)
+
+        self.assertEqual(c.pop('foo'), 1)
+        self.assertEqual(c.pop('foo', None), None)
+        self.assertRaises(KeyError, c.pop, 'foo')
+        self.assertEqual(len(c), 0)
+
+    def test_map_type_can_be_redefined_by_subclass(self):
+        class ProbeLRUCache(LRUCache):
+            _MapType = ProbeHashMap
+
+        c = ProbeLRUCache(2)
+        c.put('foo', 1)
+
+        self.assertIsInstance(c._map, ProbeHashMap)
+        self.assertEqual(c.get('foo'), 1)
+
+    def test_probing_map_survives_eviction_churn(self):
+        class ProbeLRUCache(LRUCache):
+            _MapType = ProbeHashMap
+
+        c = ProbeLRUCache(8)
+        for j in range(2000):
+            c.put(j % 100, j)
+            c.get((j * 7) % 100)
+
+        self.assertEqual(len(c), 8)
+        self.assertEqual(c.get(99), 1999)
+
+
+class TestLFUCacheMethods(unittest.TestCase):
+
+    def test_put_evicts_least_frequently_used_entry(self):
+        c = LFUCache(2)
+        c.put('foo', 1)
+        c.put('bar', 2)
+        c.get('foo')
+        c.get('foo')
+        c.get('bar')
+
+        c.put('baz', 3)
+
+        self.assertIn('foo', c)
+        self.assertNotIn('bar', c)
+        self.assertIn('baz', c)
+
+    def test_put_breaks_ties_by_recency(self):
+        c = LFUCache(2)
+        c.put('foo', 1)
+        c.put('bar', 2)
+        c.get('bar')
+        c.get('foo')
+
+        c.put('baz', 3)
+
+        self.assertNotIn('bar', c)
+        self.assertIn('foo', c)
+
+    def test_buckets_track_use_counts(self):
+        c = LFUCache(3)
+        c.put('foo', 1)
+        c.put('bar', 2)
+        c.get('foo')
+
+        counts = [b._count for b in c._buckets]
+        sizes = [len(b._entries) for b in c._buckets]
+
+        self.assertEqual(counts, [1, 2])
+        self.assertEqual(sizes, [1, 1])
+        c.pop('foo')
+        self.assertEqual([b._count for b in c._buckets], [1])
+
+
+class TestTTLCacheMethods(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0
+        self.cache = TTLCache(3, ttl=10, timer=lambda: self.now)
+
+    def test_init_raises_ValueError_with_nonpositive_ttl(self):
+        self.assertRaises(ValueError, TTLCache, 3, 0)
+
+    def test_get_misses_after_entry_expires(self):
+        self.cache.put('foo', 1)
+        self.now = 9
+        self.assertEqual(self.cache.get('foo'), 1)
+
+        self.now = 10
+
+        self.assertIsNone(self.cache.get('foo'))
+        self.assertEqual(self.cache.stats()['expirations'], 1)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_put_restarts_time_to_live(self):
+        self.cache.put('foo', 1)
+        self.cache.put('bar', 2)
+        self.now = 5
+        self.cache.put('foo', 3)
+
+        self.now = 12
+
+        self.assertNotIn('bar', self.cache)
+        self.assertEqual(self.cache.get('foo'), 3)
+
+    def test_put_evicts_least_recently_used_entry(self):
+        for key in ['foo', 'bar', 'baz']:
+            self.cache.put(key, 0)
+        self.cache.get('foo')
+
+        self.cache.put('qux', 0)
+
+        self.assertNotIn('bar', self.cache)
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+        self.assertEqual(len(self.cache._expiry), 3)
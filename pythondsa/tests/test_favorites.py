@@ -0,0 +1,67 @@
+import unittest
+from pythondsa.src.favorites import FavoritesList
+
+
+class TestFavoritesListMethods(unittest.TestCase):
+
+    def accessed(self, policy, elements):
+        fl = FavoritesList(policy)
+        for e in elements:
+            fl.access(e)
+        return fl
+
+    def test_init_raises_ValueError_with_unknown_policy(self):
+        self.assertRaises(ValueError, FavoritesList, 'lru')
+
+    def test_len_and_is_empty(self):
+        fl = FavoritesList()
+
+        self.assertTrue(fl.is_empty())
+        fl.access('foo')
+        fl.access('foo')
+        self.assertEqual(len(fl), 1)
+
+    def test_access_with_count_policy_orders_by_count(self):
+        fl = self.accessed('count', ['a', 'b', 'c', 'c', 'b', 'c'])
+
+        self.assertEqual(list(fl), ['c', 'b', 'a'])
+
+    def test_access_with_mtf_policy_moves_element_to_front(self):
+        fl = self.accessed('mtf', ['a', 'b', 'c', 'a'])
+
+        self.assertEqual(list(fl), ['a', 'c', 'b'])
+
+    def test_access_with_transpose_policy_swaps_with_predecessor(self):
+        fl = self.accessed('transpose', ['a', 'b', 'c'])
+        self.assertEqual(list(fl), ['b', 'c', 'a'])
+
+        fl.access('c')
+
+        self.assertEqual(list(fl), ['c', 'b', 'a'])
+
+    def test_remove_deletes_element_if_present(self):
+        fl = self.accessed('count', ['a', 'b'])
+
+        fl.remove('a')
+        fl.remove('z')
+
+        self.assertEqual(list(fl), ['b'])
+
+    def test_top_returns_elements_by_access_count(self):
+        for policy in FavoritesList.POLICIES:
+            fl = self.accessed(policy, ['a', 'b', 'c', 'c', 'c', 'a', 'a', 'a'])
+
+            self.assertEqual(list(fl.top(2)), ['a', 'c'])
+
+    def test_top_raises_ValueError_with_illegal_k(self):
+        fl = self.accessed('mtf', ['a'])
+
+        self.assertRaises(ValueError, lambda: list(fl.top(0)))
+        self.assertRaises(ValueError, lambda: list(fl.top(2)))
+
+    def test_stats_records_search_depth(self):
+        fl = self.accessed('mtf', ['a', 'b', 'b', 'a'])
+
+        self.assertEqual(fl.stats(), {'accesses': 4, 'depth': 4,
+                                      'average_depth': 1.0})
+        self.assertEqual(FavoritesList().stats()['average_depth'], 0.0)
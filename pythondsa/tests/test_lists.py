@@ -1,6 +1,14 @@
 import unittest
 from unittest.mock import MagicMock
-from pythondsa.src.lists import _DoublyLinkedBase, PositionalList
+from pythondsa.src.lists import _DoublyLinkedBase, PositionalList, ArrayPositionalList
+from pythondsa.src.lists import IndexedPositionalList
+
+
+def filled(factory, elements):
+    """Return a new list from factory() holding elements, and their Positions."""
+    pl = factory()
+    positions = [pl.add_last(e) for e in elements]
+    return pl, positions
 
 
 class Test_DoublyLinkedBaseMethods(unittest.TestCase):
@@ -358,3 +366,356 @@ class TestPositionalListMethods(unittest.TestCase):
         pl._validate.assert_called_with(position)
         self.assertIs(result_element, original_element)
         self.assertIs(node._element, new_element)
+
+    def test_iter_builds_no_positions(self):
+        pl = PositionalList()
+        for e in ['foo', 'bar', 'baz']:
+            pl.add_last(e)
+        pl._make_position = MagicMock()
+
+        result = list(pl)
+
+        self.assertEqual(result, ['foo', 'bar', 'baz'])
+        pl._make_position.assert_not_called()
+
+    def test_iter_raises_ValueError_if_current_element_is_deleted(self):
+        pl = PositionalList()
+        p = pl.add_last('foo')
+        pl.add_last('bar')
+        iterator = iter(pl)
+        next(iterator)
+
+        pl.delete(p)
+
+        self.assertRaises(ValueError, next, iterator)
+
+    def test_reversed_returns_a_backward_generation_of_the_elements(self):
+        pl = PositionalList()
+        for e in ['foo', 'bar', 'baz']:
+            pl.add_last(e)
+
+        self.assertEqual(list(reversed(pl)), ['baz', 'bar', 'foo'])
+        self.assertEqual(list(reversed(PositionalList())), [])
+
+    def test_iter_chunks_groups_elements_in_order(self):
+        pl = PositionalList()
+        for e in range(7):
+            pl.add_last(e)
+
+        result = list(pl.iter_chunks(3))
+
+        self.assertEqual(result, [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(list(PositionalList().iter_chunks(3)), [])
+
+    def test_iter_chunks_raises_ValueError_with_nonpositive_size(self):
+        pl = PositionalList()
+
+        self.assertRaises(ValueError, lambda: list(pl.iter_chunks(0)))
+
+
+class TestArrayPositionalListMethods(unittest.TestCase):
+
+    def test_len_and_is_empty(self):
+        apl = ArrayPositionalList()
+
+        self.assertTrue(apl.is_empty())
+        apl.add_first('foo')
+        self.assertEqual(len(apl), 1)
+        self.assertFalse(apl.is_empty())
+
+    def test_first_and_last_return_None_with_empty_list(self):
+        apl = ArrayPositionalList()
+
+        self.assertIsNone(apl.first())
+        self.assertIsNone(apl.last())
+
+    def test_add_methods_link_elements_in_order(self):
+        apl, (foo, bar) = filled(ArrayPositionalList, ['foo', 'bar'])
+
+        apl.add_first('a')
+        apl.add_before(bar, 'b')
+        apl.add_after(bar, 'c')
+
+        self.assertEqual(list(apl), ['a', 'foo', 'b', 'bar', 'c'])
+        self.assertEqual(list(reversed(apl)), ['c', 'bar', 'b', 'foo', 'a'])
+        self.assertEqual(apl.first().element(), 'a')
+        self.assertEqual(apl.last().element(), 'c')
+
+    def test_before_and_after_navigate_positions(self):
+        apl, (foo, bar, baz) = filled(ArrayPositionalList, ['foo', 'bar', 'baz'])
+
+        self.assertEqual(apl.after(foo), bar)
+        self.assertEqual(apl.before(baz), bar)
+        self.assertIsNone(apl.before(foo))
+        self.assertIsNone(apl.after(baz))
+
+    def test_delete_recycles_slot_and_invalidates_position(self):
+        apl, (foo, bar) = filled(ArrayPositionalList, ['foo', 'bar'])
+
+        result = apl.delete(foo)
+        newest = apl.add_last('baz')
+
+        self.assertEqual(result, 'foo')
+        self.assertEqual(newest._handle, foo._handle)
+        self.assertNotEqual(newest, foo)
+        self.assertRaises(ValueError, apl.after, foo)
+        self.assertEqual(list(apl), ['bar', 'baz'])
+        self.assertEqual(len(apl._elements), 4)
+
+    def test_element_returns_None_once_slot_is_reused(self):
+        apl, (foo,) = filled(ArrayPositionalList, ['foo'])
+
+        apl.delete(foo)
+        apl.add_last('bar')
+
+        self.assertIsNone(foo.element())
+
+    def test_replace_returns_old_element(self):
+        apl, (foo,) = filled(ArrayPositionalList, ['foo'])
+
+        result = apl.replace(foo, 'bar')
+
+        self.assertEqual(result, 'foo')
+        self.assertEqual(foo.element(), 'bar')
+
+    def test_validate_raises_errors_with_invalid_positions(self):
+        apl, (foo,) = filled(ArrayPositionalList, ['foo'])
+        other, (bar,) = filled(ArrayPositionalList, ['bar'])
+
+        self.assertRaises(TypeError, apl.delete, 'foo')
+        self.assertRaises(ValueError, apl.delete, bar)
+        self.assertRaises(TypeError, apl.delete, PositionalList().add_last('x'))
+
+    def test_iter_raises_ValueError_if_current_element_is_deleted(self):
+        apl, (foo, bar) = filled(ArrayPositionalList, ['foo', 'bar'])
+        iterator = iter(apl)
+        next(iterator)
+
+        apl.delete(foo)
+        apl.add_last('baz')
+
+        self.assertRaises(ValueError, next, iterator)
+
+    def test_iter_chunks_groups_elements_in_order(self):
+        apl, _ = filled(ArrayPositionalList, range(5))
+
+        self.assertEqual(list(apl.iter_chunks(2)), [[0, 1], [2, 3], [4]])
+
+
+class TestPositionalListSpliceMethods(unittest.TestCase):
+
+    def test_concat_moves_all_elements_to_back(self):
+        pl1, _ = filled(PositionalList, ['foo', 'bar'])
+        pl2, (baz, qux) = filled(PositionalList, ['baz', 'qux'])
+
+        pl1.concat(pl2)
+
+        self.assertEqual(list(pl1), ['foo', 'bar', 'baz', 'qux'])
+        self.assertEqual(len(pl1), 4)
+        self.assertTrue(pl2.is_empty())
+        self.assertEqual(list(pl2), [])
+
+    def test_concat_keeps_moved_positions_valid_in_target(self):
+        pl1, (foo,) = filled(PositionalList, ['foo'])
+        pl2, (bar,) = filled(PositionalList, ['bar'])
+
+        pl1.concat(pl2)
+        pl2.add_last('baz')
+
+        self.assertEqual(pl1.after(foo), bar)
+        self.assertEqual(pl1.delete(bar), 'bar')
+        self.assertRaises(ValueError, pl2.after, foo)
+        self.assertEqual(list(pl2), ['baz'])
+
+    def test_concat_raises_ValueError_with_itself(self):
+        pl, _ = filled(PositionalList, ['foo'])
+
+        self.assertRaises(ValueError, pl.concat, pl)
+
+    def test_splice_moves_run_after_given_position(self):
+        pl1, (a, b, c, d) = filled(PositionalList, ['a', 'b', 'c', 'd'])
+        pl2, (x, y) = filled(PositionalList, ['x', 'y'])
+
+        pl1.splice(b, c, pl2, after=x)
+
+        self.assertEqual(list(pl1), ['a', 'd'])
+        self.assertEqual(list(pl2), ['x', 'b', 'c', 'y'])
+        self.assertEqual((len(pl1), len(pl2)), (2, 4))
+        self.assertEqual(pl2.before(b), x)
+        self.assertRaises(ValueError, pl1.delete, c)
+
+    def test_splice_appends_run_without_after(self):
+        pl1, (a, b) = filled(PositionalList, ['a', 'b'])
+        pl2, _ = filled(PositionalList, ['x'])
+
+        pl1.splice(a, a, pl2)
+
+        self.assertEqual(list(pl2), ['x', 'a'])
+        self.assertEqual(pl2.last(), a)
+
+    def test_splice_moves_run_within_same_list(self):
+        pl, (a, b, c, d) = filled(PositionalList, ['a', 'b', 'c', 'd'])
+
+        pl.splice(a, b, pl, after=c)
+
+        self.assertEqual(list(pl), ['c', 'a', 'b', 'd'])
+        self.assertEqual(len(pl), 4)
+
+    def test_splice_raises_ValueError_with_bad_run(self):
+        pl, (a, b, c) = filled(PositionalList, ['a', 'b', 'c'])
+        other, _ = filled(PositionalList, ['x'])
+
+        self.assertRaises(ValueError, pl.splice, c, a, other)
+        self.assertRaises(ValueError, pl.splice, a, c, pl, b)
+        self.assertEqual(list(pl), ['a', 'b', 'c'])
+
+    def test_split_after_returns_tail_as_new_list(self):
+        pl, (a, b, c, d, e) = filled(PositionalList, ['a', 'b', 'c', 'd', 'e'])
+
+        tail = pl.split_after(d)
+
+        self.assertEqual(list(pl), ['a', 'b', 'c', 'd'])
+        self.assertEqual(list(tail), ['e'])
+        self.assertEqual((len(pl), len(tail)), (4, 1))
+        self.assertEqual(tail.first(), e)
+        self.assertRaises(ValueError, pl.delete, e)
+
+    def test_split_after_relabels_shorter_head(self):
+        pl, (a, b, c, d, e) = filled(PositionalList, ['a', 'b', 'c', 'd', 'e'])
+
+        tail = pl.split_after(a)
+
+        self.assertEqual(list(pl), ['a'])
+        self.assertEqual(list(tail), ['b', 'c', 'd', 'e'])
+        self.assertEqual(pl.first(), a)
+        self.assertEqual(tail.delete(c), 'c')
+        self.assertRaises(ValueError, tail.delete, a)
+        self.assertEqual(list(reversed(tail)), ['e', 'd', 'b'])
+
+    def test_split_after_last_returns_empty_list(self):
+        pl, (a, b) = filled(PositionalList, ['a', 'b'])
+
+        tail = pl.split_after(b)
+
+        self.assertTrue(tail.is_empty())
+        self.assertEqual(list(pl), ['a', 'b'])
+
+
+class TestPositionalListSortMethods(unittest.TestCase):
+
+    def test_sort_orders_elements_and_keeps_positions(self):
+        pl, positions = filled(PositionalList, [5, 2, 8, 1, 9, 3])
+
+        pl.sort()
+
+        self.assertEqual(list(pl), [1, 2, 3, 5, 8, 9])
+        self.assertEqual(list(reversed(pl)), [9, 8, 5, 3, 2, 1])
+        self.assertEqual(pl.after(positions[0]), positions[2])
+        self.assertEqual(pl.first(), positions[3])
+        self.assertEqual(len(pl), 6)
+
+    def test_sort_with_key_is_stable(self):
+        pl, _ = filled(PositionalList, ['bb', 'a', 'cc', 'd', 'ee'])
+
+        pl.sort(key=len)
+
+        self.assertEqual(list(pl), ['a', 'd', 'bb', 'cc', 'ee'])
+
+    def test_sort_with_reverse_is_stable(self):
+        pl, _ = filled(PositionalList, [(1, 'a'), (2, 'b'), (1, 'c'), (2, 'd')])
+
+        pl.sort(key=lambda t: t[0], reverse=True)
+
+        self.assertEqual(list(pl), [(2, 'b'), (2, 'd'), (1, 'a'), (1, 'c')])
+
+    def test_sort_keeps_all_elements_linked_when_comparison_fails(self):
+        pl, _ = filled(PositionalList, [3, 'x', 1, 2])
+
+        self.assertRaises(TypeError, pl.sort)
+        self.assertEqual(len(pl), 4)
+        self.assertEqual(sorted(map(str, pl)), ['1', '2', '3', 'x'])
+        self.assertEqual(list(reversed(pl)), list(pl)[::-1])
+
+    def test_merge_sorted_combines_sorted_lists(self):
+        pl1, _ = filled(PositionalList, [1, 4, 6])
+        pl2, (two, four, seven) = filled(PositionalList, [2, 4, 7])
+
+        pl1.merge_sorted(pl2)
+
+        self.assertEqual(list(pl1), [1, 2, 4, 4, 6, 7])
+        self.assertTrue(pl2.is_empty())
+        self.assertEqual(pl1.last(), seven)
+        self.assertEqual(pl1.before(four).element(), 4)
+
+    def test_merge_sorted_into_empty_list(self):
+        pl1 = PositionalList()
+        pl2, _ = filled(PositionalList, [1, 2])
+
+        pl1.merge_sorted(pl2)
+
+        self.assertEqual(list(pl1), [1, 2])
+        self.assertEqual(len(pl1), 2)
+
+    def test_sort_marks_indexed_list_for_rebuild(self):
+        ipl = IndexedPositionalList()
+        positions = [ipl.add_last(e) for e in [3, 1, 2]]
+
+        ipl.sort()
+
+        self.assertEqual(ipl.index_of(positions[0]), 2)
+        self.assertEqual(ipl.at(0), positions[1])
+
+
+class TestIndexedPositionalListMethods(unittest.TestCase):
+
+    def test_at_returns_position_of_kth_element(self):
+        ipl, positions = filled(IndexedPositionalList, range(100))
+
+        for k in [0, 1, 50, 99]:
+            self.assertEqual(ipl.at(k), positions[k])
+        self.assertEqual(ipl.at(-1).element(), 99)
+
+    def test_at_raises_IndexError_with_index_out_of_range(self):
+        ipl, _ = filled(IndexedPositionalList, range(3))
+
+        self.assertRaises(IndexError, ipl.at, 3)
+        self.assertRaises(IndexError, ipl.at, -4)
+        self.assertRaises(IndexError, IndexedPositionalList().at, 0)
+
+    def test_index_of_returns_rank_of_position(self):
+        ipl, positions = filled(IndexedPositionalList, range(100))
+
+        self.assertEqual([ipl.index_of(p) for p in positions], list(range(100)))
+
+    def test_index_follows_inserts_and_deletes(self):
+        ipl, positions = filled(IndexedPositionalList, range(50))
+
+        ipl.add_first('a')
+        ipl.add_after(positions[10], 'b')
+        ipl.delete(positions[30])
+
+        expected = (['a'] + list(range(11)) + ['b'] + list(range(11, 30))
+                    + list(range(31, 50)))
+        self.assertEqual([ipl.at(k).element() for k in range(len(ipl))], expected)
+        self.assertEqual(ipl.index_of(positions[40]), expected.index(40))
+
+    def test_index_rebuilds_after_bulk_operations(self):
+        ipl1, positions = filled(IndexedPositionalList, range(20))
+        ipl2, others = filled(IndexedPositionalList, range(20, 30))
+
+        ipl1.concat(ipl2)
+        tail = ipl1.split_after(positions[14])
+
+        self.assertTrue(ipl1._stale)
+        self.assertEqual(ipl1.at(14), positions[14])
+        self.assertFalse(ipl1._stale)
+        self.assertEqual(tail.index_of(others[0]), 5)
+        self.assertEqual(tail.at(-1).element(), 29)
+
+    def test_concat_raises_TypeError_with_plain_positional_list(self):
+        ipl, _ = filled(IndexedPositionalList, ['foo'])
+        pl = PositionalList()
+        pl.add_last('bar')
+
+        self.assertRaises(TypeError, ipl.concat, pl)
+        self.assertEqual(list(pl), ['bar'])
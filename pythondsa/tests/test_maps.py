@@ -1,5 +1,5 @@
 import unittest
-from pythondsa.src.maps import UnsortedTableMap, ChainHashMap
+from pythondsa.src.maps import UnsortedTableMap, ChainHashMap, ProbeHashMap
 from pythondsa.src.maps import TreeMap
 
 
@@ -102,6 +102,31 @@ class TestChainHashMap(unittest.TestCase):
         self.assertEqual(result, expected_value)
 
 
+class TestProbeHashMap(unittest.TestCase):
+
+    def test_delitem_leaves_marker_counted_in_avail(self):
+        phm = ProbeHashMap()
+        phm['spam'] = 'eggs'
+
+        del phm['spam']
+
+        self.assertEqual(phm._avail, 1)
+        self.assertEqual(phm._table.count(ProbeHashMap._AVAIL), 1)
+        self.assertRaises(KeyError, phm.__getitem__, 'spam')
+
+    def test_setitem_rebuilds_table_once_markers_pile_up(self):
+        phm = ProbeHashMap()
+        for j in range(1000):  # churn through keys, a few live at a time
+            phm[j] = j
+            if j >= 3:
+                del phm[j - 3]
+
+            self.assertTrue(any(slot is None for slot in phm._table))
+        self.assertLessEqual(len(phm) + phm._avail, len(phm._table) // 2)
+        self.assertEqual(sorted(phm), [997, 998, 999])
+        self.assertRaises(KeyError, phm.__getitem__, 'spam')
+
+
 class TestTreeMap(unittest.TestCase):
 
     def test_getitem_raises_KeyError_if_key_not_in_map(self):
@@ -0,0 +1,45 @@
+import unittest
+from pythondsa.src.pools import NodePool
+from pythondsa.src.stacks import LinkedStack
+
+
+class TestNodePoolMethods(unittest.TestCase):
+
+    def test_init_raises_ValueError_with_negative_capacity(self):
+        self.assertRaises(ValueError, NodePool, LinkedStack._Node, -1)
+
+    def test_acquire_allocates_new_node_when_pool_is_empty(self):
+        pool = NodePool(LinkedStack._Node, 2)
+
+        node = pool.acquire('foo', None)
+
+        self.assertIsInstance(node, LinkedStack._Node)
+        self.assertEqual(node._element, 'foo')
+        self.assertEqual(pool.stats(), {'hits': 0, 'misses': 1, 'free': 0})
+
+    def test_release_then_acquire_recycles_node(self):
+        pool = NodePool(LinkedStack._Node, 2)
+        node = pool.acquire('foo', None)
+        other = LinkedStack._Node('bar', None)
+
+        pool.release(node)
+
+        self.assertEqual(len(pool), 1)
+        self.assertIsNone(node._element)
+        recycled = pool.acquire('baz', other)
+        self.assertIs(recycled, node)
+        self.assertEqual(recycled._element, 'baz')
+        self.assertIs(recycled._next, other)
+        self.assertEqual(pool.stats(), {'hits': 1, 'misses': 1, 'free': 0})
+
+    def test_release_drops_nodes_beyond_capacity(self):
+        pool = NodePool(LinkedStack._Node, 1)
+        first = LinkedStack._Node('foo', None)
+        second = LinkedStack._Node('bar', None)
+
+        pool.release(first)
+        pool.release(second)
+
+        self.assertEqual(len(pool), 1)
+        self.assertIs(pool.acquire('baz', None), first)
+        self.assertIsNot(pool.acquire('qux', None), second)
@@ -1,6 +1,6 @@
 import unittest
 from pythondsa.src.queues import ArrayQueue, ArrayDeque, LinkedDeque
-from pythondsa.src.queues import LinkedQueue, CircularQueue
+from pythondsa.src.queues import LinkedQueue, CircularQueue, MaskedArrayQueue
 from pythondsa.src.exceptions import Empty
 
 
@@ -112,6 +112,117 @@ class TestArrayQueueMethods(unittest.TestCase):
 
         self.assertRaises(Empty, q.dequeue)
 
+    def test_resize_preserves_order_of_wrapped_elements(self):
+        q = ArrayQueue()
+        q._data[8:10] = ['foo', 'bar']
+        q._data[0:1] = ['baz']
+        q._size = 3
+        q._front = 8
+
+        q._resize(20)
+
+        self.assertEqual(q._data[:4], ['foo', 'bar', 'baz', None])
+        self.assertEqual(len(q._data), 20)
+        self.assertEqual(q._front, 0)
+
+    def test_enqueue_many_wraps_around_end_of_list(self):
+        q = ArrayQueue()
+        q._front = 8
+
+        q.enqueue_many(['foo', 'bar', 'baz'])
+
+        self.assertEqual(q._data[8:10], ['foo', 'bar'])
+        self.assertEqual(q._data[0], 'baz')
+        self.assertEqual(len(q), 3)
+
+    def test_enqueue_many_resizes_to_fit_all_elements(self):
+        q = ArrayQueue()
+        q.enqueue('foo')
+
+        q.enqueue_many(x for x in range(30))
+
+        self.assertEqual(len(q._data), 31)
+        self.assertEqual(q.dequeue_many(3), ['foo', 0, 1])
+
+    def test_dequeue_many_returns_front_elements_in_order(self):
+        q = ArrayQueue()
+        q._data[8:10] = ['foo', 'bar']
+        q._data[0:2] = ['baz', 'qux']
+        q._size = 4
+        q._front = 8
+
+        result = q.dequeue_many(3)
+
+        self.assertEqual(result, ['foo', 'bar', 'baz'])
+        self.assertEqual(q._data[:2], [None, 'qux'])
+        self.assertEqual(q._data[8:], [None, None])
+        self.assertEqual(q.first(), 'qux')
+        self.assertEqual(q.dequeue_many(0), [])
+
+    def test_dequeue_many_raises_Empty_exception_and_removes_nothing(self):
+        q = ArrayQueue()
+        q.enqueue_many(['foo', 'bar'])
+
+        self.assertRaises(Empty, q.dequeue_many, 3)
+        self.assertEqual(len(q), 2)
+
+
+class TestMaskedArrayQueueMethods(unittest.TestCase):
+
+    def test_init_rounds_capacity_up_to_power_of_two(self):
+        self.assertEqual(len(MaskedArrayQueue()._data), 16)
+        q = MaskedArrayQueue(100)
+
+        self.assertEqual(len(q._data), 128)
+        self.assertEqual(q._mask, 127)
+
+    def test_enqueue_and_dequeue_wrap_with_mask(self):
+        q = MaskedArrayQueue()
+        q._front = 15
+
+        q.enqueue('foo')
+        q.enqueue('bar')
+
+        self.assertEqual(q._data[15], 'foo')
+        self.assertEqual(q._data[0], 'bar')
+        self.assertEqual(q.dequeue(), 'foo')
+        self.assertEqual(q._front, 0)
+
+    def test_enqueue_doubles_capacity_if_full(self):
+        q = MaskedArrayQueue()
+
+        for e in range(17):
+            q.enqueue(e)
+
+        self.assertEqual(len(q._data), 32)
+        self.assertEqual(q._mask, 31)
+
+    def test_enqueue_many_keeps_power_of_two_capacity(self):
+        q = MaskedArrayQueue()
+
+        q.enqueue_many(range(40))
+
+        self.assertEqual(len(q._data), 64)
+        self.assertEqual(q.dequeue_many(40), list(range(40)))
+
+    def test_dequeue_shrinks_capacity_when_quarter_full(self):
+        q = MaskedArrayQueue()
+        q.enqueue_many(range(64))
+
+        q.dequeue_many(47)
+        self.assertEqual(len(q._data), 64)
+        q.dequeue()
+
+        self.assertEqual(len(q._data), 32)
+        self.assertEqual(q.dequeue_many(16), list(range(48, 64)))
+        self.assertEqual(len(q._data), 16)
+
+    def test_dequeue_raises_Empty_exception_if_queue_is_empty(self):
+        q = MaskedArrayQueue()
+
+        self.assertRaises(Empty, q.dequeue)
+        self.assertRaises(Empty, q.dequeue_many, 1)
+
 
 class TestLinkedQueueMethods(unittest.TestCase):
 
@@ -186,6 +297,24 @@ class TestLinkedQueueMethods(unittest.TestCase):
 
         self.assertRaises(Empty, q.dequeue)
 
+    def test_pool_stats_returns_None_without_pool(self):
+        q = LinkedQueue()
+
+        self.assertIsNone(q.pool_stats())
+
+    def test_enqueue_reuses_dequeued_nodes_with_pool(self):
+        q = LinkedQueue(pool_size=1)
+        q.enqueue('foo')
+        q.enqueue('bar')
+        first_node = q._head
+
+        q.dequeue()
+        q.enqueue('baz')
+
+        self.assertIs(q._tail, first_node)
+        self.assertEqual([q.dequeue() for _ in range(2)], ['bar', 'baz'])
+        self.assertEqual(q.pool_stats(), {'hits': 1, 'misses': 2, 'free': 1})
+
 
 class TestCircularQueueMethods(unittest.TestCase):
 
@@ -276,6 +405,24 @@ class TestCircularQueueMethods(unittest.TestCase):
 
         self.assertEqual(result, expected_result)
 
+    def test_pool_stats_returns_None_without_pool(self):
+        q = CircularQueue()
+
+        self.assertIsNone(q.pool_stats())
+
+    def test_enqueue_reuses_dequeued_nodes_with_pool(self):
+        q = CircularQueue(pool_size=1)
+        q.enqueue('foo')
+        q.enqueue('bar')
+        first_node = q._tail._next
+
+        q.dequeue()
+        q.enqueue('baz')
+
+        self.assertIs(q._tail, first_node)
+        self.assertEqual([q.dequeue() for _ in range(2)], ['bar', 'baz'])
+        self.assertEqual(q.pool_stats(), {'hits': 1, 'misses': 2, 'free': 1})
+
 
 class TestArrayDequeMethods(unittest.TestCase):
 
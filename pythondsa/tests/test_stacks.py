@@ -1,5 +1,10 @@
+import multiprocessing
+import operator
+import threading
 import unittest
-from pythondsa.src.stacks import ArrayStack, LinkedStack
+from pythondsa.src.stacks import ArrayStack, BoundedArrayStack, LinkedStack
+from pythondsa.src.stacks import AggregateStack, ConcurrentStack, SharedMemoryStack
+from pythondsa.src.stacks import PersistentStack, SpillStack, UnrolledLinkedStack
 from pythondsa.src.exceptions import Empty, Full
 
 
@@ -85,6 +90,287 @@ class TestArrayStackMethods(unittest.TestCase):
 
         self.assertRaises(Empty, s.top)
 
+    def test_push_many_adds_elements_last_on_top(self):
+        s = ArrayStack()
+        s.push('foo')
+
+        s.push_many(x for x in ['bar', 'baz'])
+
+        self.assertEqual(s._data, ['foo', 'bar', 'baz'])
+
+    def test_push_many_raises_Full_exception_and_pushes_nothing(self):
+        s = ArrayStack(maxlen=3)
+        s._data = ['foo']
+
+        self.assertRaises(Full, s.push_many, ['bar', 'baz', 'qux'])
+        self.assertEqual(s._data, ['foo'])
+
+    def test_pop_many_returns_top_elements_top_first(self):
+        s = ArrayStack()
+        s._data = ['foo', 'bar', 'baz']
+
+        result = s.pop_many(2)
+
+        self.assertEqual(result, ['baz', 'bar'])
+        self.assertEqual(s._data, ['foo'])
+        self.assertEqual(s.pop_many(0), [])
+        self.assertEqual(s._data, ['foo'])
+
+    def test_pop_many_raises_Empty_exception_and_removes_nothing(self):
+        s = ArrayStack()
+        s._data = ['foo', 'bar']
+
+        self.assertRaises(Empty, s.pop_many, 3)
+        self.assertEqual(s._data, ['foo', 'bar'])
+
+    def test_pop_many_with_negative_n_removes_nothing(self):
+        s = ArrayStack()
+        s._data = ['foo', 'bar', 'baz']
+
+        self.assertEqual(s.pop_many(-2), [])
+        self.assertEqual(s._data, ['foo', 'bar', 'baz'])
+
+    def test_peek_many_returns_top_elements_without_removing_them(self):
+        s = ArrayStack()
+        s._data = ['foo', 'bar', 'baz']
+
+        self.assertEqual(s.peek_many(3), ['baz', 'bar', 'foo'])
+        self.assertEqual(len(s), 3)
+        self.assertRaises(Empty, s.peek_many, 4)
+
+
+class TestBoundedArrayStackMethods(unittest.TestCase):
+
+    def test_init_preallocates_storage(self):
+        s = BoundedArrayStack(4)
+
+        self.assertEqual(s._data, [None] * 4)
+        self.assertEqual(len(s), 0)
+        self.assertTrue(s.is_empty())
+
+    def test_push_and_pop_keep_storage_in_place(self):
+        s = BoundedArrayStack(2)
+        storage = s._data
+
+        s.push('foo')
+        s.push('bar')
+
+        self.assertTrue(s.is_full())
+        self.assertRaises(Full, s.push, 'baz')
+        self.assertEqual(s.top(), 'bar')
+        self.assertEqual(s.pop(), 'bar')
+        self.assertEqual(s._data, ['foo', None])
+        self.assertIs(s._data, storage)
+
+    def test_pop_raises_Empty_exception_if_stack_is_empty(self):
+        s = BoundedArrayStack(2)
+
+        self.assertRaises(Empty, s.pop)
+        self.assertRaises(Empty, s.top)
+
+    def test_push_many_and_pop_many(self):
+        s = BoundedArrayStack(5)
+
+        s.push_many(['foo', 'bar', 'baz'])
+
+        self.assertRaises(Full, s.push_many, ['a', 'b', 'c'])
+        self.assertEqual(len(s), 3)
+        self.assertEqual(s.peek_many(3), ['baz', 'bar', 'foo'])
+        self.assertEqual(s.pop_many(2), ['baz', 'bar'])
+        self.assertEqual(s._data, ['foo', None, None, None, None])
+        self.assertRaises(Empty, s.pop_many, 2)
+
+
+class TestAggregateStackMethods(unittest.TestCase):
+
+    def test_min_and_max_follow_push_and_pop(self):
+        s = AggregateStack()
+        for e in [5, 3, 8, 1]:
+            s.push(e)
+
+        self.assertEqual((s.min(), s.max()), (1, 8))
+        s.pop()
+        self.assertEqual((s.min(), s.max()), (3, 8))
+        s.pop()
+        self.assertEqual((s.min(), s.max()), (3, 5))
+
+    def test_aggregate_folds_elements_bottom_to_top(self):
+        s = AggregateStack(aggregate=operator.add)
+        s.push_many([1, 2, 3, 4])
+
+        self.assertEqual(s.aggregate(), 10)
+        self.assertEqual(s.pop_many(2), [4, 3])
+        self.assertEqual(s.aggregate(), 3)
+        self.assertEqual(s.max(), 2)
+
+    def test_pop_many_with_negative_n_keeps_aggregates_in_step(self):
+        s = AggregateStack(aggregate=operator.add)
+        s.push_many([1, 2, 3, 4, 5])
+
+        self.assertEqual(s.pop_many(-2), [])
+        self.assertEqual(len(s), 5)
+        self.assertEqual((s.min(), s.max(), s.aggregate()), (1, 5, 15))
+        self.assertEqual(s.pop_many(3), [5, 4, 3])
+        self.assertEqual((s.min(), s.max(), s.aggregate()), (1, 2, 3))
+
+    def test_push_leaves_stack_unchanged_if_summary_raises(self):
+        s = AggregateStack()
+        s.push(1)
+
+        self.assertRaises(TypeError, s.push, 'a')
+        self.assertEqual(len(s), 1)
+        self.assertEqual(s.pop(), 1)
+        self.assertRaises(Empty, s.min)
+
+    def test_push_many_pushes_nothing_if_summary_raises(self):
+        s = AggregateStack(aggregate=operator.add)
+        s.push(5)
+
+        self.assertRaises(TypeError, s.push_many, [3, 1, None, 2])
+        self.assertEqual(len(s), 1)
+        self.assertEqual((s.min(), s.max(), s.aggregate()), (5, 5, 5))
+
+    def test_aggregate_raises_ValueError_without_function(self):
+        s = AggregateStack()
+        s.push(1)
+
+        self.assertRaises(ValueError, s.aggregate)
+
+    def test_queries_raise_Empty_exception_if_stack_is_empty(self):
+        s = AggregateStack(aggregate=operator.add)
+
+        self.assertRaises(Empty, s.min)
+        self.assertRaises(Empty, s.max)
+        self.assertRaises(Empty, s.aggregate)
+
+    def test_push_raises_Full_exception_and_keeps_summaries(self):
+        s = AggregateStack(maxlen=2)
+        s.push(4)
+
+        self.assertRaises(Full, s.push_many, [1, 2])
+        s.push(7)
+        self.assertRaises(Full, s.push, 0)
+        self.assertEqual((s.min(), s.max()), (4, 7))
+        self.assertEqual(len(s._mins), 2)
+
+
+class TestSpillStackMethods(unittest.TestCase):
+
+    def test_init_raises_ValueError_with_small_memory_budget(self):
+        self.assertRaises(ValueError, SpillStack, segment_size=4, memory_budget=7)
+        self.assertRaises(ValueError, SpillStack, segment_size=0)
+
+    def test_push_spills_bottom_segment_beyond_budget(self):
+        with SpillStack(segment_size=2, memory_budget=4) as s:
+            for e in range(5):
+                s.push(e)
+
+            self.assertEqual(len(s), 5)
+            self.assertEqual(s._data, [2, 3, 4])
+            self.assertEqual(s._segments, [(0, 2)])
+            self.assertEqual(s._spilled, 2)
+
+    def test_pop_pages_segments_back_in_lifo_order(self):
+        with SpillStack(segment_size=3, memory_budget=6) as s:
+            for e in range(20):
+                s.push(e)
+
+            result = [s.pop() for _ in range(20)]
+
+            self.assertEqual(result, list(range(19, -1, -1)))
+            self.assertTrue(s.is_empty())
+            self.assertEqual(s._file.seek(0, 2), 0)
+
+    def test_typecode_packs_segments_as_arrays(self):
+        with SpillStack(segment_size=2, memory_budget=4, typecode='q') as s:
+            for e in range(6):
+                s.push(e)
+
+            self.assertEqual(s._file.tell(), 2 * 8)
+            self.assertEqual(s.top(), 5)
+            self.assertEqual([s.pop() for _ in range(6)], [5, 4, 3, 2, 1, 0])
+
+    def test_push_rejects_values_not_matching_typecode(self):
+        with SpillStack(segment_size=2, memory_budget=4, typecode='B') as s:
+            s.push(1)
+
+            self.assertRaises(OverflowError, s.push, 300)
+            self.assertRaises(TypeError, s.push, 'foo')
+            self.assertEqual(s._data, [1])
+
+    def test_failed_spill_keeps_the_segment_in_memory(self):
+        with SpillStack(segment_size=2, memory_budget=4) as s:
+            s.push(threading.Lock())  # cannot be pickled
+            for e in range(3):
+                s.push(e)
+
+            self.assertRaises(TypeError, s.push, 3)
+            self.assertEqual(len(s), 4)
+            self.assertEqual(s._segments, [])
+            self.assertEqual([s.pop() for _ in range(3)], [2, 1, 0])
+
+    def test_push_many_spills_whole_segments_beyond_budget(self):
+        with SpillStack(segment_size=2, memory_budget=4) as s:
+            s.push(0)
+
+            s.push_many(x for x in range(1, 10))
+
+            self.assertEqual(len(s), 10)
+            self.assertEqual(s._data, [6, 7, 8, 9])
+            self.assertEqual([k for _, k in s._segments], [2, 2, 2])
+
+    def test_push_many_pushes_nothing_if_a_segment_cannot_be_written(self):
+        with SpillStack(segment_size=2, memory_budget=4) as s:
+            s.push_many([0, 1, 2])
+
+            self.assertRaises(TypeError, s.push_many, [threading.Lock(), 3, 4, 5])
+            self.assertEqual(s._data, [0, 1, 2])
+            self.assertEqual((s._segments, s._spilled), ([], 0))
+            self.assertEqual(s._file.seek(0, 2), 0)
+
+    def test_pop_many_pages_segments_back_in(self):
+        with SpillStack(segment_size=2, memory_budget=4, typecode='q') as s:
+            s.push_many(range(11))
+
+            self.assertEqual(s.pop_many(8), [10, 9, 8, 7, 6, 5, 4, 3])
+            self.assertEqual(len(s), 3)
+            self.assertRaises(Empty, s.pop_many, 4)
+            self.assertEqual(s.pop_many(3), [2, 1, 0])
+            self.assertEqual(s._file.seek(0, 2), 0)
+
+    def test_peek_many_reads_segments_without_paging_them_in(self):
+        with SpillStack(segment_size=2, memory_budget=4) as s:
+            s.push_many(range(9))
+            segments = list(s._segments)
+
+            self.assertEqual(s.peek_many(8), [8, 7, 6, 5, 4, 3, 2, 1])
+            self.assertEqual(s._segments, segments)
+            s.push(9)
+            self.assertEqual(s.pop_many(10), list(range(9, -1, -1)))
+
+    def test_top_returns_top_element_after_paging_in(self):
+        with SpillStack(segment_size=1, memory_budget=2) as s:
+            for e in ['foo', 'bar', 'baz']:
+                s.push(e)
+            s.pop()
+            s.pop()
+
+            self.assertEqual(s.top(), 'foo')
+            self.assertEqual(len(s), 1)
+
+    def test_push_raises_Full_exception_with_full_stack(self):
+        with SpillStack(maxlen=2, segment_size=1, memory_budget=2) as s:
+            s.push('foo')
+            s.push('bar')
+
+            self.assertTrue(s.is_full())
+            self.assertRaises(Full, s.push, 'baz')
+
+    def test_pop_raises_Empty_exception_if_stack_is_empty(self):
+        with SpillStack() as s:
+            self.assertRaises(Empty, s.pop)
+            self.assertRaises(Empty, s.top)
+
 
 class TestLinkedStackMethods(unittest.TestCase):
 
@@ -158,3 +444,257 @@ class TestLinkedStackMethods(unittest.TestCase):
         s = LinkedStack()
 
         self.assertRaises(Empty, s.top)
+
+    def test_pool_stats_returns_None_without_pool(self):
+        s = LinkedStack()
+
+        self.assertIsNone(s.pool_stats())
+
+    def test_push_reuses_popped_nodes_with_pool(self):
+        s = LinkedStack(pool_size=2)
+        s.push('foo')
+        node = s._head
+
+        s.pop()
+        s.push('bar')
+
+        self.assertIs(s._head, node)
+        self.assertEqual(s.pop(), 'bar')
+        self.assertEqual(s.pool_stats(), {'hits': 1, 'misses': 1, 'free': 1})
+
+
+class TestUnrolledLinkedStackMethods(unittest.TestCase):
+
+    def test_len_returns_correct_stack_length(self):
+        s = UnrolledLinkedStack(chunk_size=2)
+
+        self.assertEqual(len(s), 0)
+        for e in ['foo', 'bar', 'baz']:
+            s.push(e)
+
+        self.assertEqual(len(s), 3)
+        self.assertFalse(s.is_empty())
+
+    def test_init_raises_ValueError_with_nonpositive_chunk_size(self):
+        self.assertRaises(ValueError, UnrolledLinkedStack, 0)
+
+    def test_push_fills_chunks_before_linking_new_ones(self):
+        s = UnrolledLinkedStack(chunk_size=2)
+        for e in ['foo', 'bar', 'baz']:
+            s.push(e)
+
+        self.assertEqual(s._head._elements, ['baz', None])
+        self.assertEqual(s._head._next._elements, ['foo', 'bar'])
+        self.assertIsNone(s._head._next._next)
+
+    def test_top_returns_top_element_without_removing_it(self):
+        s = UnrolledLinkedStack(chunk_size=2)
+        s.push('foo')
+        s.push('bar')
+
+        self.assertEqual(s.top(), 'bar')
+        self.assertEqual(len(s), 2)
+
+    def test_pop_returns_elements_in_lifo_order_across_chunks(self):
+        s = UnrolledLinkedStack(chunk_size=3)
+        for e in range(10):
+            s.push(e)
+
+        result = [s.pop() for _ in range(10)]
+
+        self.assertEqual(result, list(range(9, -1, -1)))
+        self.assertTrue(s.is_empty())
+        self.assertIsNone(s._head)
+
+    def test_pop_keeps_one_spare_chunk_for_reuse(self):
+        s = UnrolledLinkedStack(chunk_size=2)
+        for e in ['foo', 'bar', 'baz']:
+            s.push(e)
+
+        s.pop()
+        spare = s._spare
+        s.push('qux')
+
+        self.assertIs(s._head, spare)
+        self.assertIsNone(s._spare)
+        self.assertEqual(s.top(), 'qux')
+
+    def test_pop_raises_Empty_exception_if_stack_is_empty(self):
+        s = UnrolledLinkedStack()
+
+        self.assertRaises(Empty, s.pop)
+        self.assertRaises(Empty, s.top)
+
+
+class TestPersistentStackMethods(unittest.TestCase):
+
+    def test_len_returns_correct_stack_length(self):
+        s = PersistentStack()
+
+        self.assertEqual(len(s), 0)
+        self.assertTrue(s.is_empty())
+        self.assertEqual(len(s.push('foo').push('bar')), 2)
+
+    def test_push_returns_new_version_and_leaves_original_unchanged(self):
+        s1 = PersistentStack().push('foo')
+
+        s2 = s1.push('bar')
+
+        self.assertEqual(list(s1), ['foo'])
+        self.assertEqual(list(s2), ['bar', 'foo'])
+
+    def test_push_shares_tail_between_versions(self):
+        base = PersistentStack().push('foo')
+
+        left = base.push('bar')
+        right = base.push('baz')
+
+        self.assertIs(left._head._next, base._head)
+        self.assertIs(right._head._next, base._head)
+
+    def test_top_returns_top_element(self):
+        s = PersistentStack().push('foo').push('bar')
+
+        self.assertEqual(s.top(), 'bar')
+        self.assertEqual(len(s), 2)
+
+    def test_pop_returns_version_without_top_element(self):
+        s = PersistentStack().push('foo').push('bar')
+
+        rest = s.pop()
+
+        self.assertEqual(rest.top(), 'foo')
+        self.assertEqual(len(rest), 1)
+        self.assertEqual(list(s), ['bar', 'foo'])
+        self.assertIs(rest._head, s._head._next)
+
+    def test_pop_raises_Empty_exception_if_stack_is_empty(self):
+        s = PersistentStack()
+
+        self.assertRaises(Empty, s.pop)
+        self.assertRaises(Empty, s.top)
+
+
+class TestConcurrentStackMethods(unittest.TestCase):
+
+    def test_push_and_pop_in_lifo_order(self):
+        s = ConcurrentStack()
+        s.push('foo')
+        s.push('bar')
+
+        self.assertEqual(len(s), 2)
+        self.assertEqual(s.top(), 'bar')
+        self.assertEqual(s.pop(), 'bar')
+        self.assertEqual(s.pop(), 'foo')
+        self.assertTrue(s.is_empty())
+
+    def test_pop_raises_Empty_exception_if_stack_is_empty(self):
+        s = ConcurrentStack()
+
+        self.assertRaises(Empty, s.pop)
+        self.assertRaises(Empty, s.pop, 0.01)
+        self.assertRaises(Empty, s.top)
+
+    def test_try_pop_reports_success(self):
+        s = ConcurrentStack()
+
+        self.assertEqual(s.try_pop(), (False, None))
+        s.push('foo')
+        self.assertEqual(s.try_pop(), (True, 'foo'))
+
+    def test_pop_waits_for_push_from_another_thread(self):
+        s = ConcurrentStack()
+        timer = threading.Timer(0.05, s.push, ['foo'])
+        timer.start()
+
+        result = s.pop(timeout=5)
+
+        timer.join()
+        self.assertEqual(result, 'foo')
+
+    def test_concurrent_push_and_pop_lose_no_elements(self):
+        s = ConcurrentStack()
+        popped = []
+
+        def worker(base):
+            for i in range(1000):
+                s.push(base + i)
+            for i in range(500):
+                popped.append(s.pop())
+
+        threads = [threading.Thread(target=worker, args=(k * 1000,)) for k in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        remaining = [s.pop() for _ in range(len(s))]
+        self.assertEqual(sorted(popped + remaining), list(range(4000)))
+
+
+def push_from_child(stack, values):
+    for value in values:
+        stack.push(value)
+    stack.close()
+
+
+class TestSharedMemoryStackMethods(unittest.TestCase):
+
+    def setUp(self):
+        self.s = SharedMemoryStack(3)
+
+    def tearDown(self):
+        self.s.close()
+        self.s.unlink()
+
+    def test_push_and_pop_in_lifo_order(self):
+        self.s.push(1)
+        self.s.push(2)
+
+        self.assertEqual(len(self.s), 2)
+        self.assertEqual(self.s.top(), 2)
+        self.assertEqual(self.s.pop(), 2)
+        self.assertEqual(self.s.try_pop(), (True, 1))
+        self.assertEqual(self.s.try_pop(), (False, None))
+
+    def test_push_raises_Full_exception_with_full_stack(self):
+        for value in range(3):
+            self.s.push(value)
+
+        self.assertTrue(self.s.is_full())
+        self.assertRaises(Full, self.s.push, 3)
+
+    def test_pop_raises_Empty_exception_if_stack_is_empty(self):
+        self.assertTrue(self.s.is_empty())
+        self.assertRaises(Empty, self.s.pop)
+        self.assertRaises(Empty, self.s.top)
+
+    def test_attach_by_name_shares_elements(self):
+        self.s.push(7)
+        other = SharedMemoryStack(name=self.s.name, lock=self.s._lock)
+
+        other.push(8)
+
+        self.assertEqual(other._typecode, 'q')
+        self.assertEqual(self.s.pop(), 8)
+        self.assertEqual(other.pop(), 7)
+        other.close()
+
+    def test_attach_raises_ValueError_with_wrong_typecode(self):
+        self.assertRaises(ValueError, SharedMemoryStack, None, 'B', self.s.name)
+
+    def test_typecode_selects_element_type(self):
+        with SharedMemoryStack(2, 'B') as s:
+            s.push(255)
+            self.assertRaises(ValueError, s.push, 256)
+            self.assertEqual(s.pop(), 255)
+            s.unlink()
+
+    def test_child_process_pushes_onto_shared_stack(self):
+        child = multiprocessing.Process(target=push_from_child, args=(self.s, [4, 5]))
+        child.start()
+        child.join(30)
+
+        self.assertEqual(child.exitcode, 0)
+        self.assertEqual(self.s.pop(), 5)
+        self.assertEqual(self.s.pop(), 4)